@@ -0,0 +1,96 @@
+'''
+Measure how long `import businesswizard` takes in a fresh interpreter
+
+Each run starts a new python process so nothing is cached in sys.modules. The script reports the
+median wall time, the slowest imports from python's -X importtime log and any heavy optional
+dependency that was loaded eagerly. It exits with status 1 when the median exceeds --budget or a
+forbidden module is loaded, so it can guard against startup regressions in CI.
+
+Examples
+--------
+python benchmarks/import_time.py
+python benchmarks/import_time.py --module businesswizard.filewizard --runs 10 --budget 1.5
+'''
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+# Dependencies only specific functions need; none of them should load with the package
+heavy_modules = ['janitor', 'duckdb', 'pyodbc', 'matplotlib', 'seaborn', 'polars', 'win32com', 'pyarrow.dataset']
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+probe = '''
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(elapsed)
+print(','.join(m for m in {heavy!r} if m in sys.modules))
+'''
+
+
+def run_once(module: str) -> Tuple[float, List[str], Dict[str, int]]:
+    '''
+    Import a module in a new interpreter
+
+    Returns
+    -------
+    seconds: float
+        Wall time of the import statement
+    loaded: list
+        Heavy modules that ended up in sys.modules
+    cumulative: dict
+        Cumulative import time in microseconds of every imported module
+    '''
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', probe.format(module=module, heavy=heavy_modules)],
+        capture_output=True, text=True, cwd=root, check=True
+    )
+    # The last line is empty when no heavy module was loaded
+    seconds, loaded = result.stdout.split('\n')[-3:-1]
+
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_us, name = line.split('|')
+        cumulative[name.strip()] = int(cumulative_us)
+    return float(seconds), [m for m in loaded.split(',') if m], cumulative
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--module', default='businesswizard', help='Module to import. Default is businesswizard.')
+    parser.add_argument('--runs', type=int, default=5, help='Number of fresh interpreters. Default is 5.')
+    parser.add_argument('--top', type=int, default=15, help='Number of slowest imports to list. Default is 15.')
+    parser.add_argument('--budget', type=float, default=None, help='Fail when the median import takes longer, in seconds.')
+    parser.add_argument('--allow', nargs='*', default=[], help='Heavy modules that may be loaded eagerly.')
+    args = parser.parse_args()
+
+    runs = [run_once(args.module) for _ in range(args.runs)]
+    median = statistics.median(seconds for seconds, _, _ in runs)
+    _, loaded, cumulative = runs[-1]
+
+    print(f'import {args.module}: median {median:.3f}s over {args.runs} runs '
+          f'(min {min(r[0] for r in runs):.3f}s, max {max(r[0] for r in runs):.3f}s)')
+    print('\nslowest imports (cumulative, last run):')
+    for name, us in sorted(cumulative.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f'  {us / 1e6:8.3f}s  {name}')
+
+    failed = False
+    forbidden = [m for m in loaded if m not in args.allow]
+    if len(forbidden) > 0:
+        print(f'\nheavy modules loaded at import: {", ".join(forbidden)}')
+        failed = True
+    if args.budget is not None and median > args.budget:
+        print(f'\nmedian import time {median:.3f}s is over the budget of {args.budget:.3f}s')
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,11 +1,59 @@
-from os.path import dirname, basename, isfile, join
-import glob
-import pandas as pd
-import pandas_flavor as pf
-from janitor import clean_names, remove_empty
-import os
-
-from .functions import *
-from .file_wizard import *
-from .db_wizard import *
-from .chart_wizard import *
+import importlib
+import importlib.util
+
+# Registers the dataframe methods (df.date_diff, df.group_concat, ...) on import
+from . import functions
+
+# Everything else loads on first use, so importing businesswizard does not pull in janitor,
+# duckdb, pyodbc or matplotlib. Functions are still available here by name as before.
+__subpackages = ['filewizard', 'chartwizard', 'db_wizard', 'file_wizard']
+__modules = {
+    'bullet_graph': '.chartwizard',
+    'funnel_chart': '.chartwizard',
+    'heatmap': '.chartwizard',
+    'query_database': '.db_wizard',
+    'execute_sql_commanges': '.db_wizard',
+    'check_duplicates': '.db_wizard'
+}
+# Optional dependencies of those modules. Their names are left out of `from businesswizard import *`
+# when a dependency is not installed, and still raise ImportError on direct use.
+__requires = {
+    '.chartwizard': ['matplotlib', 'seaborn'],
+    '.db_wizard': ['pyodbc', 'sqlparse']
+}
+
+
+def __all_names() -> list:
+    names = list(functions.__all__) + list(importlib.import_module('.filewizard', __name__).__all__)
+    for name, module in __modules.items():
+        if all(importlib.util.find_spec(dependency) is not None for dependency in __requires[module]):
+            names.append(name)
+    return names
+
+
+def __getattr__(name: str):
+    if name == '__all__':
+        # Built on first use, as `from businesswizard import *` is the only thing that needs it
+        globals()['__all__'] = __all_names()
+        return globals()['__all__']
+    if name.startswith('__'):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if name in __subpackages:
+        return importlib.import_module(f'.{name}', __name__)
+
+    if name in functions.__all__:
+        module = functions
+    elif name in __modules:
+        module = importlib.import_module(__modules[name], __name__)
+    else:
+        module = importlib.import_module('.filewizard', __name__)
+        if name not in module.__all__:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(functions.__all__) | set(__subpackages) | set(__modules))
@@ -0,0 +1,9 @@
+from .bullet_chart import bullet_graph
+from .funnel_chart import funnel_chart
+from .heatmap import heatmap
+
+__all__ = [
+    "bullet_graph",
+    "funnel_chart",
+    "heatmap"
+]
@@ -1,10 +1,78 @@
 import pandas_flavor as pf
 import pandas as pd
 import numpy as np
-import matplotlib as plt
+import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection, PolyCollection
 import seaborn as sns
 from typing import List, Tuple
 
+
+def __rectangles(left: np.ndarray, bottom: np.ndarray, width: np.ndarray, height: float) -> np.ndarray:
+    '''
+    Corner vertices of many rectangles at once, shaped (n, 4, 2) for a PolyCollection
+    '''
+    right = left + width
+    top = bottom + height
+    return np.stack([
+        np.column_stack([left, bottom]),
+        np.column_stack([left, top]),
+        np.column_stack([right, top]),
+        np.column_stack([right, bottom])
+    ], axis=1)
+
+
+def __bullet_collection(dt, limits, labels, palette, size, target_color, bar_color, label_color):
+    '''
+    Draw every bullet on one axes: one collection for the bands, one for the values and one for the targets
+    '''
+    categories = [item[0] for item in dt]
+    values = np.array([item[1] for item in dt], dtype=float)
+    targets = np.array([item[2] for item in dt], dtype=float)
+    # First category at the top
+    y = np.arange(len(dt))[::-1].astype(float)
+
+    fig, ax = plt.subplots(figsize=size)
+
+    # Bands: every row gets the same segments, so build them as a grid of row x limit
+    edges = np.concatenate([[0], limits]).astype(float)
+    band_left = np.tile(edges[:-1], len(y))
+    band_width = np.tile(np.diff(edges), len(y))
+    band_bottom = np.repeat(y - 0.4, len(limits))
+    bands = PolyCollection(
+        __rectangles(band_left, band_bottom, band_width, 0.8),
+        facecolors=[palette[i] for i in range(len(limits))] * len(y),
+        edgecolors='none'
+    )
+    ax.add_collection(bands)
+
+    bars = PolyCollection(
+        __rectangles(np.zeros(len(y)), y - 0.8 / 6, values, 0.8 / 3),
+        facecolors=bar_color,
+        edgecolors='none'
+    )
+    ax.add_collection(bars)
+
+    segments = np.stack([np.column_stack([targets, y - 0.3]), np.column_stack([targets, y + 0.3])], axis=1)
+    ax.add_collection(LineCollection(segments, colors=target_color, linewidths=1.5))
+
+    ax.set_xlim(0, max(limits[-1], np.nanmax(values, initial=0), np.nanmax(targets, initial=0)))
+    # An empty frame still gets a row of height so the axes is not singular
+    ax.set_ylim(-0.5, max(len(y), 1) - 0.5)
+    # Category names as plain text rather than y ticks; each tick is a group of artists of its own
+    ax.set_yticks([])
+    transform = ax.get_yaxis_transform()
+    for row, category in zip(y, categories):
+        ax.text(-0.01, row, category, transform=transform, ha='right', va='center')
+    for spine in ax.spines.values():
+        spine.set_visible(False)
+
+    if labels is not None:
+        # One label per band above the top row rather than one per row
+        for left, width, label in zip(edges[:-1], np.diff(edges), labels):
+            ax.text(left + width / 2, len(y) - 0.5, label, ha='center', va='bottom', color=label_color)
+    return fig, ax
+
+
 @pf.register_dataframe_method
 def bullet_graph(
     df: pd.DataFrame,
@@ -20,7 +88,8 @@ def bullet_graph(
     formatter: str = None,
     target_color: str = "gray",
     bar_color: str = "black",
-    label_color: str = "black"
+    label_color: str = "black",
+    mode: str = 'subplots'
 ):
    
     """
@@ -54,11 +123,17 @@ def bullet_graph(
                 target_color: Color of the target variable
                 bar_color: Color of the bars
                 label_color: Color of the labelss
+                mode: 'subplots' draws one axes per category. 'collection' draws every category on a
+                    single axes with one collection each for the bands, value bars and targets, which
+                    stays fast for hundreds of categories. Default is subplots.
 
             Returns:
-                Matplot Chart object
+                Matplotlib figure
     """
 
+    if mode not in ['subplots', 'collection']:
+        raise ValueError("mode must be 'subplots' or 'collection'")
+
     # Convert dataframe to a list of tuples for code to run.
     dt = list(df[[category_column, category_value_column, target_value_column]].itertuples(index=False, name=None))
 
@@ -68,44 +143,50 @@ def bullet_graph(
     # Use the 
     palette = sns.light_palette(palette_color, len(limits), reverse=False)
 
+    if mode == 'collection':
+        fig, ax = __bullet_collection(dt, limits, labels, palette, size, target_color, bar_color, label_color)
+        if formatter:
+            ax.xaxis.set_major_formatter(formatter)
+        if axis_label:
+            ax.set_xlabel(axis_label)
+        if title:
+            fig.suptitle(title, fontsize=14)
+        return fig
+
     # Must be able to handle one or many data sets via multiple subplots
-    if len(dt) == 1:
-        fig, ax = plt.subplots(figsize=size, sharex=True)
-    else:
-        fig, axarr = plt.subplots(len(dt), figsize=size, sharex=True)
+    fig, axarr = plt.subplots(len(dt), figsize=size, sharex=True, squeeze=False)
 
-        # Add each bullet graph bar to a subplot
+    # Add each bullet graph bar to a subplot
     for idx, item in enumerate(dt):
 
         # Get the axis from the array of axes returned when the plot is created
-        if len(dt) > 1:
-            ax = axarr[idx]
-
-            # Formatting to get rid of extra marking clutter
-            ax.set_aspect('equal')
-            ax.set_yticklabels([item[0]])
-            ax.set_yticks([1])
-            ax.spines['bottom'].set_visible(False)
-            ax.spines['top'].set_visible(False)
-            ax.spines['right'].set_visible(False)
-            ax.spines['left'].set_visible(False)
-
-            prev_limit = 0
-            for idx2, lim in enumerate(limits):
-                # Draw the bar
-                ax.barh([1], lim - prev_limit, left=prev_limit, height=h,
-                        color=palette[idx2])
-                prev_limit = lim
-            rects = ax.patches
-            # The last item in the list is the value we're measuring
-            # Draw the value we're measuring
-            ax.barh([1], item[1], height=(h / 3), color=bar_color)
-
-            # Need the ymin and max in order to make sure the target marker
-            # fits
-            ymin, ymax = ax.get_ylim()
-            ax.vlines(
-                item[2], ymin * .9, ymax * .9, linewidth=1.5, color=target_color)
+        ax = axarr[idx, 0]
+
+        # Formatting to get rid of extra marking clutter
+        ax.set_aspect('equal')
+        ax.set_yticks([1])
+        ax.set_yticklabels([item[0]])
+        ax.spines['bottom'].set_visible(False)
+        ax.spines['top'].set_visible(False)
+        ax.spines['right'].set_visible(False)
+        ax.spines['left'].set_visible(False)
+
+        prev_limit = 0
+        for idx2, lim in enumerate(limits):
+            # Draw the bar
+            ax.barh([1], lim - prev_limit, left=prev_limit, height=h,
+                    color=palette[idx2])
+            prev_limit = lim
+        rects = ax.patches
+        # The last item in the list is the value we're measuring
+        # Draw the value we're measuring
+        ax.barh([1], item[1], height=(h / 3), color=bar_color)
+
+        # Need the ymin and max in order to make sure the target marker
+        # fits
+        ymin, ymax = ax.get_ylim()
+        ax.vlines(
+            item[2], ymin * .9, ymax * .9, linewidth=1.5, color=target_color)
 
         # Now make some labels
         if labels is not None:
@@ -120,10 +201,10 @@ def bullet_graph(
                     color=label_color)
         if formatter:
             ax.xaxis.set_major_formatter(formatter)
-        if axis_label:
-            ax.set_xlabel(axis_label)
-        if title:
-            fig.suptitle(title, fontsize=14)
-        g = fig.subplots_adjust(hspace=0)
+    if axis_label:
+        ax.set_xlabel(axis_label)
+    if title:
+        fig.suptitle(title, fontsize=14)
+    fig.subplots_adjust(hspace=0)
 
-        return g
+    return fig
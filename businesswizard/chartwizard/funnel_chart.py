@@ -1,7 +1,7 @@
 import pandas_flavor as pf
 import pandas as pd
 import numpy as np
-import matplotlib as plt
+import matplotlib.pyplot as plt
 import seaborn as sns
 
 
@@ -1,7 +1,7 @@
 from typing import List, Tuple
 
 import pandas as pd
-import matplotlib as plt
+import matplotlib.pyplot as plt
 import seaborn as sns
 import pandas_flavor as pf
 
@@ -0,0 +1,39 @@
+from .bulk_import_csv import bulk_import_csv
+from .bulk_import_excel import bulk_import_excel
+from .compress_file import ArchiveStats, compress_file, create_archive
+from .create_excel_report import create_excel_report, create_excel_reports
+from .csv_batches import CsvBatch, iter_csv_batches
+from .filereader import ReadHandler, read_file, register_handler, sniff_format
+from .incremental_import import IncrementalImporter
+from .ingest_cache import IngestCache
+from .optimize_dtypes import optimize_dtypes
+from .query_parquet import ParquetQueryEngine, query_parquet
+from .refresh_workbook import refresh_excel_workbook
+from .schema_reconciliation import clean_column_names, read_file_schema, unify_schemas
+from .write_parquet import write_parquet_dataset
+
+__all__ = [
+    "bulk_import_csv",
+    "bulk_import_excel",
+    "ArchiveStats",
+    "compress_file",
+    "create_archive",
+    "create_excel_report",
+    "create_excel_reports",
+    "CsvBatch",
+    "iter_csv_batches",
+    "ReadHandler",
+    "read_file",
+    "register_handler",
+    "sniff_format",
+    "IncrementalImporter",
+    "IngestCache",
+    "optimize_dtypes",
+    "ParquetQueryEngine",
+    "query_parquet",
+    "refresh_excel_workbook",
+    "clean_column_names",
+    "read_file_schema",
+    "unify_schemas",
+    "write_parquet_dataset"
+]
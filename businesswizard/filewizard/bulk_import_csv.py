@@ -1,29 +1,49 @@
 import pandas as pd
 from fnmatch import fnmatch
-from janitor import clean_names, remove_empty
-
-def __csv_encodings(path, **kwargs):
-    csv_encodings = ['utf-8', 'utf-8-sig', 'iso-8859-1', 'latin1','cp1252']
-
-    for e in csv_encodings:
-        try:
-            temp = (
-                pd.read_csv(path, encoding=e, engine= 'pyarrow', **kwargs)
-                .clean_names()
-                .remove_empty()
-            )
-        except Exception as e:
-            pass
-    return temp
-
-def bulk_import_csv(file_paths, **kwargs) -> pd.DataFrame:
+
+from .filereader import read_file
+from .ingest_cache import IngestCache
+from .optimize_dtypes import optimize_dtypes
+from .schema_reconciliation import import_reconciled
+
+csv_patterns = ['*.csv', '*.csv.gz', '*.csv.zip', '*.tsv', '*.tsv.gz']
+
+def __read_csv(path, **kwargs):
+    # Registers clean_names and remove_empty; imported on first read as it is slow to load
+    import janitor  # noqa: F401
+
+    return (
+        read_file(path, **kwargs)
+        .clean_names()
+        .remove_empty()
+    )
+
+def bulk_import_csv(
+    file_paths,
+    cache: IngestCache = None,
+    optimize: bool = False,
+    schema: dict = None,
+    reconcile_schema: bool = False,
+    **kwargs
+) -> pd.DataFrame:
     '''
     Read multiple csv file and concatenate data into a single dataframe
 
     Parameters
     ----------
     file_paths: list
-        List of csv file paths to read in
+        List of csv file paths to read in. Gzip or zip wrapped csv and tsv files are also read.
+    cache: IngestCache, optional
+        Parquet ingest cache. When given, unchanged files are read from their cached parquet copy.
+    optimize: bool, optional
+        When True, numeric columns are downcast, low-cardinality strings become categoricals and
+        date-like strings are parsed. See optimize_dtypes.
+    schema: dict, optional
+        Column to dtype overrides used when optimize is True. Listed columns are not optimized.
+    reconcile_schema: bool, optional
+        When True, one target schema is computed from the file headers up front, every file is read
+        into it and the files are concatenated in arrow, so differing columns are not upcast to object.
+        Names are cleaned and empty rows/columns removed once for the combined data. The cache is not used.
     
     Returns
     ----------
@@ -31,12 +51,23 @@ def bulk_import_csv(file_paths, **kwargs) -> pd.DataFrame:
         Dataframe of concatenated csv files
     '''
 
-    csv_files = [file for file in file_paths if fnmatch(file, '*.csv')]
+    csv_files = [file for file in file_paths if any(fnmatch(file.lower(), p) for p in csv_patterns)]
+
+    if reconcile_schema is True:
+        df = import_reconciled(csv_files, **kwargs)
+        if optimize is True:
+            df = optimize_dtypes(df, schema=schema)
+        return df
 
     df = pd.DataFrame()
     for i in range(0, len(csv_files)):
-        temp = __csv_encodings(path=r''+csv_files[i], **kwargs)
+        if cache is not None:
+            temp = cache.read(r''+csv_files[i], __read_csv, **kwargs)
+        else:
+            temp = __read_csv(r''+csv_files[i], **kwargs)
         df = pd.concat([temp, df])
+
+    if optimize is True:
+        df = optimize_dtypes(df, schema=schema)
         
     return df
-
@@ -1,8 +1,31 @@
 import pandas as pd
 from fnmatch import fnmatch
-from janitor import clean_names, remove_empty
 
-def bulk_import_excel(file_paths, **kwargs) -> pd.DataFrame:
+from .filereader import read_file
+from .ingest_cache import IngestCache
+from .optimize_dtypes import optimize_dtypes
+from .schema_reconciliation import import_reconciled
+
+excel_patterns = ['*.xls', '*.xlsx', '*.xlsm']
+
+def __read_excel(path, **kwargs):
+    # Registers clean_names and remove_empty; imported on first read as it is slow to load
+    import janitor  # noqa: F401
+
+    return (
+        read_file(path, **kwargs)
+        .clean_names()
+        .remove_empty()
+    )
+
+def bulk_import_excel(
+    file_paths,
+    cache: IngestCache = None,
+    optimize: bool = False,
+    schema: dict = None,
+    reconcile_schema: bool = False,
+    **kwargs
+) -> pd.DataFrame:
     '''
     Read multiple excel files and concatenate data into a single dataframe.
 
@@ -10,6 +33,17 @@ def bulk_import_excel(file_paths, **kwargs) -> pd.DataFrame:
     ----------
     file_paths: list
         List of excel filepaths to ingest.
+    cache: IngestCache, optional
+        Parquet ingest cache. When given, unchanged files are read from their cached parquet copy.
+    optimize: bool, optional
+        When True, numeric columns are downcast, low-cardinality strings become categoricals and
+        date-like strings are parsed. See optimize_dtypes.
+    schema: dict, optional
+        Column to dtype overrides used when optimize is True. Listed columns are not optimized.
+    reconcile_schema: bool, optional
+        When True, one target schema is computed from the file headers up front, every file is read
+        into it and the files are concatenated in arrow, so differing columns are not upcast to object.
+        Names are cleaned and empty rows/columns removed once for the combined data. The cache is not used.
     **kwargs: TYPE
         Additional pd.read_excel options
     
@@ -19,16 +53,24 @@ def bulk_import_excel(file_paths, **kwargs) -> pd.DataFrame:
         Dataframe of concatenated excel files
     '''
 
-    xlsx_files = [file for file in file_paths if fnmatch(file, '*.xls?')]
+    xlsx_files = [file for file in file_paths if any(fnmatch(file.lower(), p) for p in excel_patterns)]
+
+    if reconcile_schema is True:
+        df = import_reconciled(xlsx_files, **kwargs)
+        if optimize is True:
+            df = optimize_dtypes(df, schema=schema)
+        return df
 
     df = pd.DataFrame()
     for i in range(0, len(xlsx_files)):
-        temp = (
-            pd.read_excel(r''+xlsx_files[i], dtype_backend='pyarrow', **kwargs)
-            .clean_names()
-            .remove_empty()
-        )
+        if cache is not None:
+            temp = cache.read(r''+xlsx_files[i], __read_excel, **kwargs)
+        else:
+            temp = __read_excel(r''+xlsx_files[i], **kwargs)
     
         df = pd.concat([temp, df])
         del temp
+
+    if optimize is True:
+        df = optimize_dtypes(df, schema=schema)
     return df
\ No newline at end of file
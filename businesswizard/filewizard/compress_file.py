@@ -1,7 +1,234 @@
-import zipfile
 import os
+import time
+import zlib
+import tarfile
+import zipfile
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+# Formats that are already compressed gain nothing from DEFLATE and are stored as-is in 'auto' mode
+compressed_suffixes = [
+    '.parquet', '.zip', '.gz', '.bz2', '.xz', '.zst', '.7z', '.xlsx', '.xlsm', '.docx',
+    '.pptx', '.png', '.jpg', '.jpeg', '.gif', '.mp4', '.pdf'
+]
+
+class ArchiveStats:
+    '''
+    Summary of an archive run
+
+    Attributes
+    ----------
+    archive_name: str
+        File path of the archive
+    files: int
+        Number of files archived
+    bytes_in: int
+        Total size of the input files
+    bytes_out: int
+        Size of the archive
+    seconds: float
+        Wall time of the run
+    '''
+
+    def __init__(self, archive_name: str, files: int, bytes_in: int, bytes_out: int, seconds: float):
+        self.archive_name = archive_name
+        self.files = files
+        self.bytes_in = bytes_in
+        self.bytes_out = bytes_out
+        self.seconds = seconds
+
+    @property
+    def ratio(self) -> float:
+        '''
+        Compression ratio (input size / archive size)
+
+        Returns
+        -------
+        float
+        '''
+        return self.bytes_in / self.bytes_out if self.bytes_out else 0.0
+
+    @property
+    def throughput(self) -> float:
+        '''
+        Input megabytes processed per second
 
-def compress_file(file_list, zip_file_name) -> str:
+        Returns
+        -------
+        float
+        '''
+        return self.bytes_in / 1024 ** 2 / self.seconds if self.seconds else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.archive_name}: {self.files} files, {self.bytes_in:,} -> {self.bytes_out:,} bytes '
+            f'(ratio {self.ratio:.2f}) in {self.seconds:.2f}s ({self.throughput:.1f} MB/s)'
+        )
+
+def __deflate_chunk(chunk: bytes, zdict: bytes, compression_level: int, last: bool) -> bytes:
+    '''
+    Raw DEFLATE one chunk of a member. zlib releases the GIL, so chunks compress in parallel threads.
+    '''
+    if zdict:
+        # Priming with the previous chunk's tail keeps back-references across chunk boundaries (as pigz does)
+        compressor = zlib.compressobj(compression_level, zlib.DEFLATED, -15, zdict=zdict)
+    else:
+        compressor = zlib.compressobj(compression_level, zlib.DEFLATED, -15)
+
+    # Sync flushes end each chunk on a byte boundary so the chunks concatenate into one valid stream
+    return compressor.compress(chunk) + compressor.flush(zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH)
+
+def __read_chunks(file_list, codec, chunk_size):
+    '''
+    Yield (path, chunk, zdict, crc, last) for deflated members and (path, None, None, None, True) for stored ones
+    '''
+    for f in file_list:
+        if codec == 'stored' or (codec == 'auto' and os.path.splitext(f)[1].lower() in compressed_suffixes):
+            yield f, None, None, None, True
+            continue
+
+        crc = 0
+        zdict = None
+        with open(f, 'rb') as src:
+            chunk = src.read(chunk_size)
+            while True:
+                nxt = src.read(chunk_size)
+                crc = zlib.crc32(chunk, crc)
+                yield f, chunk, zdict, crc, nxt == b''
+                if nxt == b'':
+                    break
+                zdict = chunk[-32768:]
+                chunk = nxt
+
+def __write_zip(file_list, archive_name, codec, max_workers, compression_level, chunk_size) -> None:
+    max_workers = max_workers or os.cpu_count() or 1
+
+    with zipfile.ZipFile(archive_name, 'w', allowZip64=True) as zf, ThreadPoolExecutor(max_workers) as executor:
+        # Bound the chunks in flight so memory stays flat however large the members are
+        window = 2 * max_workers
+        pending = deque()
+        member = {}
+
+        def write_next():
+            path, future, crc, last = pending.popleft()
+            if future is None:
+                zf.write(path, compress_type=zipfile.ZIP_STORED)
+                return
+
+            if not member:
+                zinfo = zipfile.ZipInfo.from_file(path)
+                zinfo.compress_type = zipfile.ZIP_DEFLATED
+                zinfo.file_size = os.path.getsize(path)
+                zinfo.CRC = 0
+                zinfo.compress_size = 0
+                zinfo.header_offset = zf.fp.tell()
+                # Same headroom for incompressible data that ZipFile uses when sizes are unknown up front
+                member['zip64'] = zinfo.file_size * 1.05 > zipfile.ZIP64_LIMIT
+                zf.fp.write(zinfo.FileHeader(member['zip64']))
+                member['zinfo'] = zinfo
+                member['data_start'] = zf.fp.tell()
+
+            zf.fp.write(future.result())
+
+            if last:
+                zinfo = member.pop('zinfo')
+                zinfo.CRC = crc
+                zinfo.compress_size = zf.fp.tell() - member.pop('data_start')
+                zip64 = member.pop('zip64')
+                if not zip64 and zinfo.compress_size > zipfile.ZIP64_LIMIT:
+                    raise RuntimeError(f'{path} compressed beyond the zip64 estimate')
+
+                # Rewrite the local header now that the CRC and compressed size are known
+                end = zf.fp.tell()
+                zf.fp.seek(zinfo.header_offset)
+                zf.fp.write(zinfo.FileHeader(zip64))
+                zf.fp.seek(end)
+
+                zf.filelist.append(zinfo)
+                zf.NameToInfo[zinfo.filename] = zinfo
+                zf.start_dir = end
+
+        for path, chunk, zdict, crc, last in __read_chunks(file_list, codec, chunk_size):
+            future = None
+            if chunk is not None:
+                future = executor.submit(__deflate_chunk, chunk, zdict, compression_level, last)
+            pending.append((path, future, crc, last))
+
+            while len(pending) >= window:
+                write_next()
+
+        while pending:
+            write_next()
+
+def __write_zstd_tar(file_list, archive_name, max_workers, compression_level) -> None:
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError("codec='zstd' requires the zstandard package: pip install zstandard")
+
+    compressor = zstandard.ZstdCompressor(level=compression_level, threads=max_workers or -1)
+    with open(archive_name, 'wb') as fh, compressor.stream_writer(fh) as writer:
+        with tarfile.open(fileobj=writer, mode='w|') as tar:
+            for f in file_list:
+                tar.add(f)
+
+def create_archive(
+    file_list: str | List[str],
+    archive_name: str,
+    codec: str = 'auto',
+    max_workers: int = None,
+    compression_level: int = None,
+    chunk_size: int = 16 * 1024 ** 2
+) -> ArchiveStats:
+    '''
+    Archive file(s), compressing members in parallel and streaming them in chunks
+
+    Parameters
+    ----------
+    file_list: str | list
+        File path or list of file paths to archive
+    archive_name: str
+        File path of the output archive
+    codec: str, optional
+        'auto' deflates files into a zip but stores already-compressed formats (parquet, zip, gz, ...) as-is.
+        'deflate' and 'stored' apply to every member. 'zstd' writes a multithreaded zstandard .tar.zst instead of a zip.
+    max_workers: int, optional
+        Number of compression threads. Defaults to the number of cores.
+    compression_level: int, optional
+        Codec compression level. Defaults to 6 for deflate and 3 for zstd.
+    chunk_size: int, optional
+        Number of bytes read per chunk. Default is 16 MB.
+
+    Returns
+    -------
+    stats: ArchiveStats
+        Bytes in, bytes out and throughput of the run
+    '''
+
+    if isinstance(file_list, str):
+        file_list = [file_list]
+
+    start = time.perf_counter()
+
+    if codec == 'zstd':
+        __write_zstd_tar(file_list, archive_name, max_workers, compression_level or 3)
+    elif codec in ['auto', 'deflate', 'stored']:
+        level = compression_level if compression_level is not None else 6
+        __write_zip(file_list, archive_name, codec, max_workers, level, chunk_size)
+    else:
+        raise ValueError("codec must be one of 'auto', 'deflate', 'stored' or 'zstd'")
+
+    return ArchiveStats(
+        archive_name=archive_name,
+        files=len(file_list),
+        bytes_in=sum(os.path.getsize(f) for f in file_list),
+        bytes_out=os.path.getsize(archive_name),
+        seconds=time.perf_counter() - start
+    )
+
+def compress_file(file_list, zip_file_name, codec: str = 'auto', max_workers: int = None, verbose: bool = False) -> str:
     '''
     Compress file(s) into a zip
 
@@ -11,13 +238,20 @@ def compress_file(file_list, zip_file_name) -> str:
         List of filepaths to use
     zip_file_name: str
         File path of the output zip
+    codec: str, optional
+        Zip compression codec: 'auto', 'deflate' or 'stored', see create_archive. Default is auto.
+        Use create_archive for zstd, which writes a .tar.zst archive rather than a zip.
+    max_workers: int, optional
+        Number of compression threads. Defaults to the number of cores.
+    verbose: bool, optional
+        When True, prints bytes in, bytes out and throughput
     '''
 
-    if isinstance(file_list, str) == True:
-        file_list = [file_list]
-    
-    with zipfile.zipFile(zip_file_name, 'w', zipfile.ZIP_DEFLATED) as myzip:
-        for f in file_list:
-            myzip.write(f)
-    
-    return zip_file_name
\ No newline at end of file
+    if codec == 'zstd':
+        raise ValueError("compress_file writes zip files; use create_archive(..., codec='zstd') for a .tar.zst archive")
+
+    stats = create_archive(file_list, zip_file_name, codec=codec, max_workers=max_workers)
+    if verbose is True:
+        print(stats)
+
+    return zip_file_name
@@ -1,5 +1,11 @@
 import pandas as pd
 
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple
+
+# Excel's sheet row limit; one row per sheet is used by the header
+excel_max_rows = 1_048_576
+
 default_header_format = {
     'bold': True,
     "text_wrap": True,
@@ -9,17 +15,88 @@ default_header_format = {
     'border': 1
 }
 
+def __column_widths(df: pd.DataFrame, width_sample_size: int) -> list:
+    '''
+    Compute column widths from the string length of the unique values in an evenly spaced row sample
+    '''
+    step = max(1, len(df.index) // width_sample_size)
+    sample = df.iloc[::step]
+
+    widths = []
+    for col in df.columns:
+        values = pd.Series(sample[col].unique())
+        width = values.astype(str).str.len().max() if len(values.index) > 0 else 0
+        widths.append(max(width, len(str(col))))
+    return widths
+
+def __sheet_parts(df: pd.DataFrame, sheet_name: str) -> List[Tuple[str, pd.DataFrame]]:
+    '''
+    Split a dataframe across numbered sheets when it exceeds Excel's row limit
+    '''
+    rows_per_sheet = excel_max_rows - 1
+    if len(df.index) <= rows_per_sheet:
+        return [(sheet_name, df)]
+
+    parts = []
+    for i, start in enumerate(range(0, len(df.index), rows_per_sheet), start=1):
+        suffix = f'_{i}'
+        # Sheet names are limited to 31 characters
+        parts.append((sheet_name[:31 - len(suffix)] + suffix, df.iloc[start:start + rows_per_sheet]))
+    return parts
+
+def __write_streaming(
+    sheets: List[Tuple[str, pd.DataFrame]],
+    file_name: str,
+    header_format: dict,
+    widths: list,
+    chunk_size: int
+) -> None:
+    '''
+    Write rows in order through xlsxwriter's constant_memory mode, flushing each row to disk as it is written
+    '''
+    import xlsxwriter
+
+    workbook = xlsxwriter.Workbook(file_name, {
+        'constant_memory': True,
+        'nan_inf_to_errors': True,
+        'remove_timezone': True,
+        'default_date_format': 'yyyy-mm-dd'
+    })
+    header = workbook.add_format(header_format)
+
+    for sheet_name, df in sheets:
+        worksheet = workbook.add_worksheet(sheet_name)
+
+        for i, width in enumerate(widths):
+            worksheet.set_column(i, i, width)
+
+        worksheet.write_row(0, 0, [str(c) for c in df.columns], header)
+
+        for start in range(0, len(df.index), chunk_size):
+            chunk = df.iloc[start:start + chunk_size]
+            # Missing values become None so they are left blank instead of raising in xlsxwriter
+            rows = chunk.astype(object).where(chunk.notna(), None).itertuples(index=False, name=None)
+            for offset, row in enumerate(rows):
+                worksheet.write_row(start + offset + 1, 0, row)
+
+    workbook.close()
+
 def create_excel_report(
 df: pd.DataFrame,
 file_name: str,
 sheet_name: str = 'Report',
 header_format: dict = default_header_format,
-excel_engine = 'xlsxwriter'
+excel_engine = 'xlsxwriter',
+streaming: bool = False,
+chunk_size: int = 50_000,
+width_sample_size: int = 10_000
 ) -> None:
 
     """
     Exports dataframe to a pre-formatted excel file
 
+    Dataframes longer than Excel's row limit are split across numbered sheets e.g. Report_1, Report_2.
+
     Parameters
     ----------
     df: pd.DataFrame
@@ -32,26 +109,89 @@ excel_engine = 'xlsxwriter'
         Format of the report header
     excel_engine: str, optional
         Excel Writer enginge to use
-    
+    streaming: bool, optional
+        When True, rows are written in chunks through xlsxwriter's constant_memory mode so
+        memory use stays flat regardless of row count. Recommended for large reports.
+    chunk_size: int, optional
+        Number of rows converted per chunk in streaming mode. Default is 50,000.
+    width_sample_size: int, optional
+        Approximate number of rows sampled to compute column widths. Default is 10,000.
+
     Returns
     -------
     None
     """
 
-    writer = pd.ExcelWriter(file_name, engine=excel_engine)
+    widths = __column_widths(df, width_sample_size)
+    sheets = __sheet_parts(df, sheet_name)
 
-    df.to_excel(writer, index=False, sheet_name=sheet_name, startrow=1, header=False)
-    workbook = writer.book
-    worksheet = writer.sheets[sheet_name]
+    if streaming is True:
+        __write_streaming(sheets, file_name, header_format, widths, chunk_size)
+        return
 
-    for i, col in enumerate(df.columns):
-        width = max(df[col].apply(lambda x: len(str(x))).max(), len(col))
-        worksheet.set_column(i, i, width)
-    
+    writer = pd.ExcelWriter(file_name, engine=excel_engine)
+    workbook = writer.book
     header = workbook.add_format(header_format)
 
-    for col_num, value in enumerate(df.columns.values):
-        worksheet.write(0, col_num + 1, value, header)
-    
-    writer.save()
-    
+    for name, part in sheets:
+        part.to_excel(writer, index=False, sheet_name=name, startrow=1, header=False)
+        worksheet = writer.sheets[name]
+
+        for i, width in enumerate(widths):
+            worksheet.set_column(i, i, width)
+
+        for col_num, value in enumerate(df.columns.values):
+            worksheet.write(0, col_num, value, header)
+
+    writer.close()
+
+def __render_report(spec) -> str:
+    '''
+    Render a single report spec inside a worker process
+    '''
+    args, kwargs = spec
+    create_excel_report(*args, **kwargs)
+    return args[1]
+
+def create_excel_reports(
+    report_specs: List[tuple | dict],
+    max_workers: int = None,
+    **kwargs
+) -> List[str]:
+    '''
+    Render many pre-formatted excel reports in parallel worker processes
+
+    Examples
+    --------
+    create_excel_reports([(east_df, 'east.xlsx'), (west_df, 'west.xlsx', 'West')], streaming=True)
+
+    Parameters
+    ----------
+    report_specs: list
+        Reports to render. Each spec is a (df, file_name) or (df, file_name, sheet_name) tuple,
+        or a dict of create_excel_report arguments.
+    max_workers: int, optional
+        Number of worker processes. Defaults to the number of cores. 1 renders serially.
+    **kwargs:
+        create_excel_report options applied to every report e.g. streaming, header_format
+
+    Returns
+    -------
+    file_names: list
+        File names of the rendered reports, in the order of report_specs
+    '''
+
+    specs = []
+    for spec in report_specs:
+        if isinstance(spec, dict):
+            options = {k: v for k, v in spec.items() if k not in ['df', 'file_name']}
+            specs.append(((spec['df'], spec['file_name']), {**kwargs, **options}))
+        else:
+            specs.append((tuple(spec), kwargs))
+
+    if max_workers == 1 or len(specs) <= 1:
+        return [__render_report(spec) for spec in specs]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(__render_report, specs))
+
@@ -0,0 +1,181 @@
+import pyarrow as pa
+import pyarrow.csv as pv
+import pyarrow.compute as pc
+from fnmatch import fnmatch
+
+from typing import Iterator, List
+
+from .bulk_import_csv import csv_patterns
+from .schema_reconciliation import clean_column_names, conform_table, csv_source, read_file_schema, scan_csv_types, unify_schemas
+
+
+class CsvBatch:
+    '''
+    Fixed-size batch of rows read from a csv file
+
+    Attributes
+    ----------
+    data: pd.DataFrame | pa.Table
+        Rows of the batch, normalized to the shared schema
+    source_file: str
+        File the rows were read from
+    row_offset: int
+        Position of the batch's first row among the data rows of the source file
+    source_rows: int
+        Number of source rows the batch covers, including empty rows that were dropped
+    batch_index: int
+        Position of the batch in the overall stream
+    '''
+
+    def __init__(self, data, source_file: str, row_offset: int, source_rows: int, batch_index: int):
+        self.data = data
+        self.source_file = source_file
+        self.row_offset = row_offset
+        self.source_rows = source_rows
+        self.batch_index = batch_index
+
+    def __repr__(self) -> str:
+        return f'CsvBatch({self.source_file}, rows {self.row_offset}-{self.row_offset + self.source_rows})'
+
+
+def __drop_empty_rows(table: pa.Table) -> pa.Table:
+    '''
+    Drop rows where every value is null, as janitor's remove_empty does
+    '''
+    if table.num_columns == 0 or len(table) == 0:
+        return table
+    mask = pc.is_valid(table.column(0))
+    for column in table.columns[1:]:
+        mask = pc.or_(mask, pc.is_valid(column))
+    return table.filter(mask)
+
+
+def __delimiter(path: str) -> str:
+    return '\t' if '.tsv' in path.lower() else ','
+
+
+def __scan_types(path: str, encoding: str, block_size: int) -> pa.Schema:
+    '''
+    Read the schema of a file with its numeric column types checked over every block
+    '''
+    return scan_csv_types(
+        path,
+        read_file_schema(path, encoding),
+        pv.ReadOptions(encoding=encoding, block_size=block_size),
+        pv.ParseOptions(delimiter=__delimiter(path))
+    )
+
+
+def __batches(reader, path: str) -> Iterator[pa.RecordBatch]:
+    '''
+    Iterate the reader, naming the file when a value does not parse as its column's type
+    '''
+    while True:
+        try:
+            yield reader.read_next_batch()
+        except StopIteration:
+            return
+        except pa.ArrowInvalid as error:
+            raise ValueError(
+                f'{path}: {error}. Pass a schema with a string type for the column to read it as text.'
+            ) from error
+
+
+def iter_csv_batches(
+    file_paths: str | List[str],
+    batch_size: int = 100_000,
+    schema: pa.Schema = None,
+    output: str = 'pandas',
+    encoding: str = 'utf8',
+    block_size: int = 16 * 1024 ** 2
+) -> Iterator[CsvBatch]:
+    '''
+    Stream one or many csv files as fixed-size batches with a stable schema
+
+    Only one block of each file is held in memory at a time, so files larger than memory can be
+    processed and written out batch by batch. Column names are cleaned once per file and empty
+    rows are dropped from every batch. Empty columns are kept so that every batch shares the
+    same columns.
+
+    Every column is parsed straight into its target type. Without a schema, types are inferred
+    from the first block of each file and numeric columns are then checked over the whole file in
+    a pass that reads only those columns, so a decimal or text value deep in a file widens the
+    column up front instead of failing mid-stream.
+
+    Examples
+    --------
+    for batch in iter_csv_batches(['drop_1.csv', 'drop_2.csv'], batch_size=500_000):
+        process(batch.data)
+
+    Parameters
+    ----------
+    file_paths: str | list
+        Csv file path or list of csv file paths
+    batch_size: int, optional
+        Number of rows per batch. The last batch of each file may be smaller. Default is 100,000.
+    schema: pa.Schema, optional
+        Target schema using cleaned column names. Defaults to the schema unified from every file,
+        with numeric types checked over whole files.
+    output: str, optional
+        'pandas' yields DataFrames, 'arrow' yields pyarrow Tables. Default is pandas.
+    encoding: str, optional
+        Text encoding of the files. Default is utf8.
+    block_size: int, optional
+        Number of bytes pyarrow reads per block. Default is 16 MB.
+
+    Returns
+    -------
+    Iterator[CsvBatch]
+    '''
+
+    if isinstance(file_paths, str):
+        file_paths = [file_paths]
+    csv_files = [file for file in file_paths if any(fnmatch(file.lower(), p) for p in csv_patterns)]
+
+    if schema is None:
+        schema = unify_schemas([__scan_types(path, encoding, block_size) for path in csv_files])
+
+    batch_index = 0
+    for path in csv_files:
+        read_options = pv.ReadOptions(encoding=encoding, block_size=block_size)
+        parse_options = pv.ParseOptions(delimiter=__delimiter(path))
+
+        # Pin every column up front so a later block cannot disagree with the type inferred from the
+        # first one. Columns outside the schema are dropped, so they are read as text and never fail.
+        raw_names = read_file_schema(path, encoding).names
+        types = {
+            raw: schema.field(clean).type if clean in schema.names else pa.string()
+            for raw, clean in zip(raw_names, clean_column_names(raw_names))
+        }
+        # Empty fields are nulls, as they are for pd.read_csv
+        convert_options = pv.ConvertOptions(column_types=types, strings_can_be_null=True)
+
+        pending = []
+        pending_rows = 0
+        row_offset = 0
+
+        def flush(rows):
+            nonlocal pending, pending_rows, row_offset, batch_index
+            table = pa.concat_tables(pending)
+            batch, rest = table.slice(0, rows), table.slice(rows)
+            pending = [rest] if len(rest) > 0 else []
+            pending_rows = len(rest)
+
+            data = __drop_empty_rows(batch)
+            result = CsvBatch(data.to_pandas() if output == 'pandas' else data, path, row_offset, rows, batch_index)
+            row_offset += rows
+            batch_index += 1
+            return result
+
+        with csv_source(path) as source:
+            reader = pv.open_csv(source, read_options=read_options, parse_options=parse_options, convert_options=convert_options)
+            names = clean_column_names(reader.schema.names)
+            for record_batch in __batches(reader, path):
+                table = pa.Table.from_batches([record_batch]).rename_columns(names)
+                pending.append(conform_table(table, schema))
+                pending_rows += record_batch.num_rows
+                while pending_rows >= batch_size:
+                    yield flush(batch_size)
+
+        if pending_rows > 0:
+            yield flush(pending_rows)
@@ -1,8 +1,10 @@
 import os
+import zipfile
+import importlib.util
 import pandas as pd
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 
 class ReadHandler(ABC):
     '''
@@ -12,9 +14,296 @@ class ReadHandler(ABC):
     ----------
     nxt: ReadHandler
         Next handler to pass input to if unsupported by current handler
+    formats: List[str]
+        File formats the handler can read
 
     Methods
     -------
+    handle: pd.DataFrame
+        Read the file if the format is supported, otherwise pass it to the next handler
     read: pd.DataFrame
         Read contents of file
-    '''
\ No newline at end of file
+    '''
+
+    formats: List[str] = []
+
+    def __init__(self, nxt: 'ReadHandler' = None):
+        '''
+        Parameters
+        ----------
+        nxt: ReadHandler, optional
+            Next handler in the chain
+        '''
+        self.nxt = nxt
+
+    def handle(self, path: str, file_format: str, **kwargs) -> pd.DataFrame:
+        '''
+        Read the file if the format is supported, otherwise pass it down the chain
+
+        Parameters
+        ----------
+        path: str
+            File path to read
+        file_format: str
+            Detected file format e.g. csv, parquet
+        **kwargs:
+            Additional reader options
+
+        Returns
+        -------
+        pd.DataFrame
+        '''
+        if file_format in self.formats:
+            return self.read(path, file_format, **kwargs)
+        if self.nxt is None:
+            raise ValueError(f'No reader registered for {file_format} file {path}')
+        return self.nxt.handle(path, file_format, **kwargs)
+
+    @abstractmethod
+    def read(self, path: str, file_format: str, **kwargs) -> pd.DataFrame:
+        '''
+        Read contents of file
+
+        Parameters
+        ----------
+        path: str
+            File path to read
+        file_format: str
+            Detected file format
+        **kwargs:
+            Additional reader options
+
+        Returns
+        -------
+        pd.DataFrame
+        '''
+
+
+class CsvHandler(ReadHandler):
+    '''
+    Reads csv and tsv files (plain, gzip or zip wrapped) with the multithreaded pyarrow engine,
+    falling back through common encodings
+    '''
+
+    formats = ['csv', 'tsv']
+    _encodings = ['utf-8', 'utf-8-sig', 'iso-8859-1', 'latin1', 'cp1252']
+
+    def read(self, path: str, file_format: str, **kwargs) -> pd.DataFrame:
+        if file_format == 'tsv':
+            kwargs.setdefault('sep', '\t')
+        kwargs.setdefault('engine', 'pyarrow')
+
+        if 'encoding' in kwargs:
+            return pd.read_csv(path, **kwargs)
+
+        for e in self._encodings:
+            try:
+                df = pd.read_csv(path, encoding=e, **kwargs)
+            except (UnicodeDecodeError, ValueError) as error:
+                last_error = error
+                continue
+            if not self._has_undecoded_columns(df):
+                return df
+            last_error = UnicodeDecodeError(e, b'', 0, 0, f'{path} contains text that is not valid {e}')
+        raise last_error
+
+    @staticmethod
+    def _has_undecoded_columns(df: pd.DataFrame) -> bool:
+        '''
+        The pyarrow engine returns invalid text as binary columns instead of raising
+
+        Parameters
+        ----------
+        df: pd.DataFrame
+            Parsed csv
+
+        Returns
+        -------
+        bool
+        '''
+        for col in df.columns:
+            if df[col].dtype != object:
+                continue
+            values = df[col].dropna()
+            if len(values.index) > 0 and isinstance(values.iloc[0], bytes):
+                return True
+        return False
+
+
+class ParquetHandler(ReadHandler):
+    '''
+    Reads parquet files through memory-mapped I/O
+    '''
+
+    formats = ['parquet']
+
+    def read(self, path: str, file_format: str, **kwargs) -> pd.DataFrame:
+        kwargs.setdefault('memory_map', True)
+        return pd.read_parquet(path, **kwargs)
+
+
+class ArrowHandler(ReadHandler):
+    '''
+    Reads Arrow IPC files, Arrow IPC streams and Feather files through memory-mapped I/O
+    '''
+
+    formats = ['arrow', 'arrow_stream', 'feather']
+
+    def read(self, path: str, file_format: str, **kwargs) -> pd.DataFrame:
+        import pyarrow as pa
+        import pyarrow.feather as feather
+
+        columns = kwargs.pop('columns', None)
+
+        if file_format == 'feather':
+            table = feather.read_table(path, columns=columns, memory_map=True)
+        else:
+            with pa.memory_map(path, 'r') as source:
+                if file_format == 'arrow':
+                    table = pa.ipc.open_file(source).read_all()
+                else:
+                    table = pa.ipc.open_stream(source).read_all()
+            if columns is not None:
+                table = table.select(columns)
+
+        return table.to_pandas(**kwargs)
+
+
+class ExcelHandler(ReadHandler):
+    '''
+    Reads xlsx and xls workbooks, using the calamine engine when it is installed
+    '''
+
+    formats = ['xlsx', 'xls']
+
+    def read(self, path: str, file_format: str, **kwargs) -> pd.DataFrame:
+        if importlib.util.find_spec('python_calamine') is not None:
+            kwargs.setdefault('engine', 'calamine')
+        kwargs.setdefault('dtype_backend', 'pyarrow')
+        return pd.read_excel(path, **kwargs)
+
+
+class JsonLinesHandler(ReadHandler):
+    '''
+    Reads JSON lines files, with the pyarrow engine for uncompressed input
+    '''
+
+    formats = ['jsonl']
+
+    def read(self, path: str, file_format: str, **kwargs) -> pd.DataFrame:
+        if kwargs.get('compression') is None:
+            kwargs.setdefault('engine', 'pyarrow')
+        return pd.read_json(path, lines=True, **kwargs)
+
+
+__handlers = [CsvHandler, ParquetHandler, ArrowHandler, ExcelHandler, JsonLinesHandler]
+
+__text_formats = {
+    '.csv': 'csv',
+    '.txt': 'csv',
+    '.tsv': 'tsv',
+    '.tab': 'tsv',
+    '.jsonl': 'jsonl',
+    '.ndjson': 'jsonl'
+}
+
+
+def register_handler(handler: type) -> None:
+    '''
+    Add a ReadHandler subclass to the front of the reader chain so it takes precedence
+
+    Parameters
+    ----------
+    handler: type
+        ReadHandler subclass
+
+    Returns
+    -------
+    None
+    '''
+    __handlers.insert(0, handler)
+
+
+def reader_chain() -> ReadHandler:
+    '''
+    Build the chain of registered read handlers
+
+    Returns
+    -------
+    ReadHandler
+        First handler in the chain
+    '''
+    chain = None
+    for handler in reversed(__handlers):
+        chain = handler(chain)
+    return chain
+
+
+def __text_format(name: str) -> str:
+    '''
+    Map the extension of a text file name to its format, defaulting to csv
+    '''
+    return __text_formats.get(os.path.splitext(name)[1].lower(), 'csv')
+
+
+def sniff_format(path: str) -> Tuple[str, str]:
+    '''
+    Detect the format of a file from its magic bytes, falling back to its extension
+
+    Parameters
+    ----------
+    path: str
+        File path to inspect
+
+    Returns
+    -------
+    Tuple[str, str]
+        File format and compression wrapper (None, 'gzip' or 'zip')
+    '''
+    with open(path, 'rb') as f:
+        magic = f.read(8)
+
+    if magic.startswith(b'PAR1'):
+        return 'parquet', None
+    if magic.startswith(b'ARROW1'):
+        return 'arrow', None
+    if magic.startswith(b'FEA1'):
+        return 'feather', None
+    if magic.startswith(b'\xff\xff\xff\xff'):
+        return 'arrow_stream', None
+    if magic.startswith(b'\xd0\xcf\x11\xe0'):
+        return 'xls', None
+    if magic.startswith(b'\x1f\x8b'):
+        name = path[:-3] if path.lower().endswith('.gz') else path
+        return __text_format(name), 'gzip'
+    if magic.startswith(b'PK\x03\x04'):
+        with zipfile.ZipFile(path) as zf:
+            names = zf.namelist()
+        if '[Content_Types].xml' in names:
+            return 'xlsx', None
+        return __text_format(names[0]), 'zip'
+
+    return __text_format(path), None
+
+
+def read_file(path: str, **kwargs) -> pd.DataFrame:
+    '''
+    Read a tabular file with the fastest available reader for its detected format
+
+    Supports csv, tsv, gzip/zip wrapped csv, parquet, feather/arrow IPC, xlsx/xls and JSON lines.
+
+    Parameters
+    ----------
+    path: str
+        File path to read
+    **kwargs:
+        Additional options for the underlying reader
+
+    Returns
+    -------
+    df: pd.DataFrame
+    '''
+    file_format, compression = sniff_format(path)
+    if compression is not None:
+        kwargs.setdefault('compression', compression)
+    return reader_chain().handle(path, file_format, **kwargs)
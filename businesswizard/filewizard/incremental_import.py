@@ -0,0 +1,205 @@
+import os
+import glob
+import json
+import hashlib
+import pandas as pd
+
+from fnmatch import fnmatch
+from typing import Dict, List
+
+from .bulk_import_csv import bulk_import_csv, csv_patterns
+from .ingest_cache import file_fingerprint
+
+
+class IncrementalImporter:
+    '''
+    Incrementally ingest a growing directory of csv files into a persistent parquet store
+
+    Every processed file is recorded in a manifest (path, size, mtime, hash and row count) and
+    stored as its own parquet part. Each run only reads files that are new or changed since the
+    last run, so runtime scales with the daily delta rather than the full history.
+
+    Attributes
+    ----------
+    store_dir: str
+        Directory holding the parquet parts and the manifest
+    hash_contents: bool
+        Compare file content hashes in addition to size and modification time
+
+    Methods
+    -------
+    run: pd.DataFrame
+        Ingest new or changed files and return their rows
+    read: pd.DataFrame
+        Read the full store
+    forget: bool
+        Remove a file from the manifest and the store
+    '''
+
+    _manifest_name = '_manifest.json'
+
+    def __init__(self, store_dir: str, hash_contents: bool = False):
+        '''
+        Parameters
+        ----------
+        store_dir: str
+            Directory holding the parquet parts and the manifest. Created if it does not exist.
+        hash_contents: bool, optional
+            Compare file content hashes in addition to size and modification time. Default is False.
+        '''
+        self.store_dir = store_dir
+        self.hash_contents = hash_contents
+        os.makedirs(self.store_dir, exist_ok=True)
+        self.manifest = self._load_manifest()
+
+    @property
+    def manifest_path(self) -> str:
+        '''
+        File path of the manifest
+
+        Returns
+        -------
+        str
+        '''
+        return os.path.join(self.store_dir, self._manifest_name)
+
+    def run(self, file_paths: str | List[str], pattern: str = '*.csv', **kwargs) -> pd.DataFrame:
+        '''
+        Ingest csv files that are new or have changed since the last run
+
+        Parameters
+        ----------
+        file_paths: str | list
+            Landing directory or list of csv file paths
+        pattern: str, optional
+            Glob pattern used when file_paths is a directory. Default is *.csv. Matched files must be
+            csv or tsv files (optionally gzip or zip wrapped), otherwise a ValueError is raised.
+        **kwargs:
+            Additional pd.read_csv options
+
+        Returns
+        -------
+        df: pd.DataFrame
+            Dataframe of the rows ingested in this run
+        '''
+        if isinstance(file_paths, str):
+            file_paths = sorted(glob.glob(os.path.join(file_paths, pattern)))
+
+        # bulk_import_csv skips other files, which would then be recorded as ingested with no rows
+        unsupported = [p for p in file_paths if not any(fnmatch(p.lower(), c) for c in csv_patterns)]
+        if len(unsupported) > 0:
+            raise ValueError(f"Only files matching {', '.join(csv_patterns)} can be ingested: {', '.join(unsupported)}")
+
+        new_data = []
+        for path in file_paths:
+            fingerprint = file_fingerprint(path, self.hash_contents)
+            if not self._has_changed(fingerprint):
+                continue
+
+            df = bulk_import_csv([path], **kwargs)
+            path_key = hashlib.blake2b(fingerprint['path'].encode(), digest_size=8).hexdigest()
+            part = f'part-{path_key}.parquet'
+            tmp = os.path.join(self.store_dir, f'{part}.tmp')
+            df.to_parquet(tmp, index=False)
+            os.replace(tmp, os.path.join(self.store_dir, part))
+
+            fingerprint['rows'] = len(df.index)
+            fingerprint['part'] = part
+            self.manifest[fingerprint['path']] = fingerprint
+            # Save after every file so an interrupted run does not re-ingest finished files
+            self._save_manifest()
+            new_data.append(df)
+
+        if len(new_data) == 0:
+            return pd.DataFrame()
+        return pd.concat(new_data, ignore_index=True)
+
+    def read(self, columns: List[str] = None) -> pd.DataFrame:
+        '''
+        Read every ingested file from the store
+
+        Parameters
+        ----------
+        columns: list, optional
+            Subset of columns to read
+
+        Returns
+        -------
+        df: pd.DataFrame
+            Dataframe of the full store
+        '''
+        parts = [
+            pd.read_parquet(os.path.join(self.store_dir, entry['part']), columns=columns, memory_map=True)
+            for entry in self.manifest.values()
+        ]
+        if len(parts) == 0:
+            return pd.DataFrame()
+        return pd.concat(parts, ignore_index=True)
+
+    def forget(self, path: str) -> bool:
+        '''
+        Remove a file from the manifest and delete its stored rows
+
+        Parameters
+        ----------
+        path: str
+            Source file path
+
+        Returns
+        -------
+        bool
+            True if the file was in the manifest
+        '''
+        entry = self.manifest.pop(os.path.abspath(path), None)
+        if entry is None:
+            return False
+
+        part = os.path.join(self.store_dir, entry['part'])
+        if os.path.exists(part):
+            os.remove(part)
+        self._save_manifest()
+        return True
+
+    def _has_changed(self, fingerprint: Dict) -> bool:
+        '''
+        Compare a file fingerprint with its manifest entry
+
+        Parameters
+        ----------
+        fingerprint: dict
+            Current fingerprint of the file
+
+        Returns
+        -------
+        bool
+        '''
+        entry = self.manifest.get(fingerprint['path'])
+        if entry is None:
+            return True
+        return any(entry.get(k) != fingerprint[k] for k in ['size', 'mtime', 'hash'])
+
+    def _load_manifest(self) -> Dict[str, Dict]:
+        '''
+        Load the manifest from the store directory
+
+        Returns
+        -------
+        dict
+        '''
+        if not os.path.exists(self.manifest_path):
+            return {}
+        with open(self.manifest_path, 'r') as f:
+            return json.load(f)
+
+    def _save_manifest(self) -> None:
+        '''
+        Atomically write the manifest to the store directory
+
+        Returns
+        -------
+        None
+        '''
+        tmp = f'{self.manifest_path}.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(self.manifest, f, indent=2)
+        os.replace(tmp, self.manifest_path)
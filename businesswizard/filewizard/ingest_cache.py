@@ -0,0 +1,352 @@
+import os
+import json
+import time
+import uuid
+import hashlib
+import contextlib
+import pandas as pd
+
+from typing import Callable, Dict, Any, List
+
+default_cache_dir = os.path.join(os.path.expanduser('~'), '.businesswizard', 'ingest_cache')
+
+
+def file_fingerprint(path: str, hash_contents: bool = False, chunk_size: int = 1 << 20) -> Dict[str, Any]:
+    '''
+    Describe a file by its absolute path, size, modification time and (optionally) content hash
+
+    Parameters
+    ----------
+    path: str
+        File path to fingerprint
+    hash_contents: bool, optional
+        When True, a blake2b hash of the file contents is included. Slower, but catches
+        files that were rewritten without changing size or modification time.
+    chunk_size: int, optional
+        Number of bytes read per chunk when hashing
+
+    Returns
+    -------
+    fingerprint: dict
+        Dictionary with path, size, mtime and hash keys
+    '''
+
+    stat = os.stat(path)
+    content_hash = None
+    if hash_contents is True:
+        h = hashlib.blake2b(digest_size=16)
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                h.update(chunk)
+        content_hash = h.hexdigest()
+
+    return {
+        'path': os.path.abspath(path),
+        'size': stat.st_size,
+        'mtime': stat.st_mtime_ns,
+        'hash': content_hash
+    }
+
+
+class IngestCache:
+    '''
+    Parquet cache for parsed CSV and Excel sources
+
+    The first read of a source file stores the parsed dataframe as Parquet in the cache directory.
+    Later reads of the same, unchanged file are served from the Parquet copy (memory mapped).
+    Entries are keyed by path, size, modification time, read options and an optional content hash.
+    The least recently used entries are evicted once the cache grows past max_bytes.
+
+    Entries the cache writes are recorded in an index file in the cache directory. Only indexed
+    entries are ever invalidated or evicted, so other files in the directory are left alone.
+    Changes to the index are made under a file lock, so one cache directory can be shared by
+    concurrent jobs and threads.
+
+    Attributes
+    ----------
+    cache_dir: str
+        Directory holding the cached parquet files
+    max_bytes: int
+        Size cap of the cache directory in bytes
+    hash_contents: bool
+        Include a content hash in the cache key
+
+    Methods
+    -------
+    read: pd.DataFrame
+        Return cached dataframe for a file, loading and caching it on a miss
+    invalidate: int
+        Remove cached entries for a file, or the whole cache
+    '''
+
+    def __init__(
+        self,
+        cache_dir: str = default_cache_dir,
+        max_bytes: int = 10 * 1024 ** 3,
+        hash_contents: bool = False
+    ):
+        '''
+        Parameters
+        ----------
+        cache_dir: str, optional
+            Directory holding the cached parquet files. Created if it does not exist.
+        max_bytes: int, optional
+            Size cap of the cache directory in bytes. Default is 10 GB.
+        hash_contents: bool, optional
+            Include a content hash in the cache key. Default is False.
+        '''
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hash_contents = hash_contents
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def read(self, path: str, loader: Callable[..., pd.DataFrame], **kwargs) -> pd.DataFrame:
+        '''
+        Return the cached dataframe for a file, loading and caching it on a miss
+
+        Parameters
+        ----------
+        path: str
+            Source file path
+        loader: Callable
+            Function used to parse the source file on a miss. Called as loader(path, **kwargs).
+        **kwargs:
+            Read options passed to the loader. They are part of the cache key.
+
+        Returns
+        -------
+        df: pd.DataFrame
+        '''
+        # Fingerprint once, as hashing the contents reads the whole file
+        fingerprint = file_fingerprint(path, self.hash_contents)
+        entry = self._entry_path(path, fingerprint, kwargs)
+
+        if os.path.exists(entry):
+            # Touch the entry so eviction sees it as recently used
+            os.utime(entry)
+            return pd.read_parquet(entry, memory_map=True)
+
+        df = loader(path, **kwargs)
+        self._store(path, entry, df, self._file_version(fingerprint))
+        return df
+
+    def invalidate(self, path: str = None) -> int:
+        '''
+        Remove cached entries for a file, or every entry when no file is given
+
+        Parameters
+        ----------
+        path: str, optional
+            Source file path to invalidate. Default removes every entry the cache wrote.
+
+        Returns
+        -------
+        removed: int
+            Number of cache entries removed
+        '''
+        source = None if path is None else os.path.abspath(path)
+        with self._index_lock():
+            index = self._load_index()
+            removed = [name for name, record in index.items() if source is None or record['path'] == source]
+            self._remove(index, removed)
+        return len(removed)
+
+    @property
+    def size(self) -> int:
+        '''
+        Total size of the cached parquet files in bytes
+
+        Returns
+        -------
+        int
+        '''
+        entries = [os.path.join(self.cache_dir, name) for name in self._load_index()]
+        return sum(os.path.getsize(f) for f in entries if os.path.exists(f))
+
+    @staticmethod
+    def _path_key(path: str) -> str:
+        '''
+        Hash of the absolute source path, shared by every cached version of the file
+
+        Parameters
+        ----------
+        path: str
+            Source file path
+
+        Returns
+        -------
+        str
+        '''
+        return hashlib.blake2b(os.path.abspath(path).encode(), digest_size=8).hexdigest()
+
+    @property
+    def _index_path(self) -> str:
+        return os.path.join(self.cache_dir, 'index.json')
+
+    def _load_index(self) -> Dict[str, Dict[str, str]]:
+        '''
+        Entries written by the cache, as entry file name to source path and file version
+
+        Returns
+        -------
+        dict
+        '''
+        try:
+            with open(self._index_path) as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    @contextlib.contextmanager
+    def _index_lock(self):
+        '''
+        Hold an exclusive lock on the index while it is read, changed and saved. The lock is
+        released by the operating system if the process dies.
+        '''
+        with open(os.path.join(self.cache_dir, 'index.lock'), 'a+b') as f:
+            if os.name == 'nt':
+                import msvcrt
+                f.seek(0)
+                while True:
+                    try:
+                        msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+                        break
+                    except OSError:
+                        time.sleep(0.01)
+            else:
+                import fcntl
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if os.name == 'nt':
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+                else:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _save_index(self, index: Dict[str, Dict[str, str]]) -> None:
+        # Replace the index in one step so readers never see a partial file
+        tmp = f'{self._index_path}.{uuid.uuid4().hex}.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(index, f)
+        os.replace(tmp, self._index_path)
+
+    def _remove(self, index: Dict[str, Dict[str, str]], names: List[str]) -> None:
+        '''
+        Delete indexed entries and save the index without them
+        '''
+        for name in names:
+            try:
+                os.remove(os.path.join(self.cache_dir, name))
+            except FileNotFoundError:
+                pass
+            index.pop(name, None)
+        self._save_index(index)
+
+    @staticmethod
+    def _file_version(fingerprint: Dict[str, Any]) -> str:
+        '''
+        Hash of a file fingerprint, shared by every read option variant of this version
+
+        Parameters
+        ----------
+        fingerprint: dict
+            Current fingerprint of the source file
+
+        Returns
+        -------
+        str
+        '''
+        return hashlib.blake2b(json.dumps(fingerprint, sort_keys=True).encode(), digest_size=16).hexdigest()
+
+    def _entry_path(self, path: str, fingerprint: Dict[str, Any], read_options: Dict[str, Any]) -> str:
+        '''
+        Build the cache entry path for the current version of a file and its read options
+
+        Parameters
+        ----------
+        path: str
+            Source file path
+        fingerprint: dict
+            Current fingerprint of the source file
+        read_options: dict
+            Keyword arguments used to parse the file
+
+        Returns
+        -------
+        str
+        '''
+        key = dict(fingerprint, options=read_options)
+        version = hashlib.blake2b(
+            json.dumps(key, sort_keys=True, default=repr).encode(), digest_size=16
+        ).hexdigest()
+        return os.path.join(self.cache_dir, f'{self._path_key(path)}-{version}.parquet')
+
+    def _store(self, path: str, entry: str, df: pd.DataFrame, version: str) -> None:
+        '''
+        Write a dataframe to the cache, removing entries for older versions of the same file.
+        Entries for other read options of the current version are kept.
+
+        Parameters
+        ----------
+        path: str
+            Source file path
+        entry: str
+            Cache entry path to write
+        df: pd.DataFrame
+            Parsed source data
+        version: str
+            Version of the source file the data was parsed from
+
+        Returns
+        -------
+        None
+        '''
+        # Write to a temporary file first so concurrent readers never see a partial entry. The
+        # name is unique per call, as threads of one process may store the same entry at once.
+        tmp = f'{entry}.{uuid.uuid4().hex}.tmp'
+        df.to_parquet(tmp, index=False)
+        os.replace(tmp, entry)
+
+        source = os.path.abspath(path)
+        with self._index_lock():
+            index = self._load_index()
+            stale = [
+                name for name, record in index.items()
+                if record['path'] == source and record['version'] != version
+            ]
+            index[os.path.basename(entry)] = {'path': source, 'version': version}
+            self._remove(index, stale)
+            self._evict(index)
+
+    def _evict(self, index: Dict[str, Dict[str, str]]) -> None:
+        '''
+        Delete the least recently used entries until the cache fits within max_bytes. Called with
+        the index lock held.
+
+        Parameters
+        ----------
+        index: dict
+            Current index
+
+        Returns
+        -------
+        None
+        '''
+        entries = []
+        for name in index:
+            f = os.path.join(self.cache_dir, name)
+            if os.path.exists(f):
+                stat = os.stat(f)
+                entries.append((stat.st_mtime_ns, stat.st_size, name))
+
+        total = sum(size for _, size, _ in entries)
+        evicted = []
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            evicted.append(name)
+            total -= size
+        if len(evicted) > 0:
+            self._remove(index, evicted)
@@ -0,0 +1,132 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from typing import Dict
+
+from pandas.tseries.api import guess_datetime_format
+
+__int_types = [
+    (np.int8, pa.int8()),
+    (np.int16, pa.int16()),
+    (np.int32, pa.int32()),
+    (np.int64, pa.int64())
+]
+
+def __smallest_int(s: pd.Series):
+    '''
+    Return the narrowest integer dtype that holds every value, keeping the series' backend
+    '''
+    lo, hi = s.min(), s.max()
+    if pd.isna(lo):
+        return s.dtype
+
+    for np_type, pa_type in __int_types:
+        info = np.iinfo(np_type)
+        if info.min <= lo and hi <= info.max:
+            if isinstance(s.dtype, pd.ArrowDtype):
+                return pd.ArrowDtype(pa_type)
+            if isinstance(s.dtype, pd.api.extensions.ExtensionDtype):
+                # Nullable Int64 -> Int8 etc.
+                return pd.api.types.pandas_dtype(np.dtype(np_type).name.capitalize())
+            return np.dtype(np_type)
+    return s.dtype
+
+def __smallest_float(s: pd.Series):
+    '''
+    Return float32 when the values survive the round trip unchanged, otherwise keep the current dtype
+    '''
+    target = pd.ArrowDtype(pa.float32()) if isinstance(s.dtype, pd.ArrowDtype) else np.float32
+    narrowed = s.astype(target)
+    if (narrowed.astype(s.dtype) == s).sum() == s.notna().sum():
+        return target
+    return s.dtype
+
+def __parse_dates(s: pd.Series) -> pd.Series:
+    '''
+    Parse a string column as datetime using a format inferred from its first value.
+    Returns None when the column is not date-like.
+    '''
+    values = s.dropna()
+    if len(values.index) == 0:
+        return None
+
+    date_format = guess_datetime_format(str(values.iloc[0]))
+    # Formats without separators (e.g. %Y%m%d) also match numeric ids, so they are left alone
+    if date_format is None or not any(c in date_format for c in '-/. :'):
+        return None
+
+    parsed = pd.to_datetime(s, format=date_format, errors='coerce')
+    if parsed.notna().sum() != len(values.index):
+        return None
+    return parsed
+
+def __optimize_column(s: pd.Series, category_threshold: float, parse_dates: bool) -> pd.Series:
+    if pd.api.types.is_bool_dtype(s.dtype):
+        return s
+    if pd.api.types.is_integer_dtype(s.dtype):
+        return s.astype(__smallest_int(s))
+    if pd.api.types.is_float_dtype(s.dtype):
+        return s.astype(__smallest_float(s))
+    if pd.api.types.is_string_dtype(s.dtype) or s.dtype == object:
+        if parse_dates is True:
+            parsed = __parse_dates(s)
+            if parsed is not None:
+                return parsed
+        if len(s.index) > 0 and s.nunique() / len(s.index) <= category_threshold:
+            return s.astype('category')
+    return s
+
+def optimize_dtypes(
+    df: pd.DataFrame,
+    schema: Dict[str, str] = None,
+    category_threshold: float = 0.5,
+    parse_dates: bool = True,
+    verbose: bool = False
+) -> pd.DataFrame:
+    '''
+    Reduce the memory footprint of a dataframe by narrowing its dtypes
+
+    Integers are downcast to the smallest width that holds their range, floats to float32 when
+    lossless, low-cardinality strings become categoricals and date-like strings are parsed as
+    datetimes with an inferred fixed format. Memory before and after is stored in
+    df.attrs['memory_report'].
+
+    Parameters
+    ----------
+    df: pd.DataFrame
+        Dataframe to optimize
+    schema: dict, optional
+        Column to dtype overrides. Listed columns are cast to the given dtype (None keeps the
+        current dtype) and are not optimized.
+    category_threshold: float, optional
+        Maximum ratio of unique values to rows for a string column to become categorical. Default is 0.5.
+    parse_dates: bool, optional
+        When True, date-like string columns are parsed as datetimes. Default is True.
+    verbose: bool, optional
+        When True, prints memory usage before and after
+
+    Returns
+    -------
+    df: pd.DataFrame
+        Dataframe with optimized dtypes
+    '''
+
+    schema = schema or {}
+    before = int(df.memory_usage(deep=True).sum())
+
+    columns = []
+    for col, s in df.items():
+        if col in schema:
+            columns.append(s if schema[col] is None else s.astype(schema[col]))
+        else:
+            columns.append(__optimize_column(s, category_threshold, parse_dates))
+
+    result = pd.concat(columns, axis=1) if len(columns) > 0 else df.copy()
+    after = int(result.memory_usage(deep=True).sum())
+    result.attrs['memory_report'] = {'before': before, 'after': after}
+
+    if verbose is True:
+        print(f'Memory usage reduced from {before / 1024 ** 2:,.1f} MB to {after / 1024 ** 2:,.1f} MB')
+
+    return result
@@ -1,31 +1,273 @@
-import re
-import duckdb
+import os
+import threading
 import pandas as pd
 
+from typing import List, Any
+
+
+class ParquetQueryEngine:
+    '''
+    Reusable DuckDB connection for querying parquet files
+
+    Parquet sources are registered as views over read_parquet, so DuckDB pushes filters and
+    projections down into the parquet row groups and skips data that cannot match.
+
+    Attributes
+    ----------
+    connection: duckdb.DuckDBPyConnection
+        DuckDB connection used to run queries
+
+    Methods
+    -------
+    register: None
+        Register a parquet file, list of files, glob or hive-partitioned directory as a view
+    query: pd.DataFrame
+        Run a SQL query and return pandas, arrow or polars output
+    explain: str
+        Return the physical plan of a query
+    session: ParquetQueryEngine
+        Engine on a new cursor whose views are private to it, for use from another thread
+    close: None
+        Close the connection
+    '''
+
+    _outputs = ['pandas', 'arrow', 'polars']
+
+    def __init__(self, threads: int = None, memory_limit: str = None, database: str = ':memory:'):
+        '''
+        Parameters
+        ----------
+        threads: int, optional
+            Number of threads DuckDB may use. Defaults to all cores.
+        memory_limit: str, optional
+            Memory limit for DuckDB e.g. '8GB'. Defaults to DuckDB's own limit.
+        database: str, optional
+            DuckDB database file. Default is an in-memory database.
+        '''
+        # Imported here so importing filewizard does not load duckdb
+        import duckdb
+
+        config = {}
+        if threads is not None:
+            config['threads'] = threads
+        if memory_limit is not None:
+            config['memory_limit'] = memory_limit
+        self.connection = duckdb.connect(database, config=config)
+        self._temporary = False
+
+    def session(self) -> 'ParquetQueryEngine':
+        '''
+        Engine on a new cursor of the same database
+
+        Views registered on a session are temporary and only visible to it, so sessions used from
+        different threads never see or replace each other's views.
+
+        Returns
+        -------
+        ParquetQueryEngine
+        '''
+        engine = ParquetQueryEngine.__new__(ParquetQueryEngine)
+        engine.connection = self.connection.cursor()
+        engine._temporary = True
+        return engine
+
+    def register(
+        self,
+        table_name: str,
+        parquet_path: str | List[str],
+        hive_partitioning: bool = None,
+        union_by_name: bool = False
+    ) -> None:
+        '''
+        Register parquet data as a view that can be referenced in queries
+
+        Parameters
+        ----------
+        table_name: str
+            Name of the view to create
+        parquet_path: str | list
+            Parquet file, list of files, glob pattern or (hive-partitioned) directory
+        hive_partitioning: bool, optional
+            Read key=value directory names as columns. DuckDB detects this automatically by default.
+        union_by_name: bool, optional
+            Combine files with different columns by name instead of position
+
+        Returns
+        -------
+        None
+        '''
+        sources = ', '.join(self._quote(s) for s in self._parquet_sources(parquet_path))
+
+        options = ''
+        if hive_partitioning is not None:
+            options += f', hive_partitioning = {str(hive_partitioning).lower()}'
+        if union_by_name is True:
+            options += ', union_by_name = true'
+
+        self.connection.execute(
+            f'CREATE OR REPLACE {"TEMP " if self._temporary else ""}VIEW "{table_name}" AS SELECT * FROM read_parquet([{sources}]{options})'
+        )
+
+    def query(self, query: str, output: str = 'pandas', params: List[Any] = None):
+        '''
+        Run a SQL query against the registered views
+
+        Parameters
+        ----------
+        query: str
+            SQL query to execute. Passed to DuckDB unchanged.
+        output: str, optional
+            Output format: 'pandas', 'arrow' or 'polars'. Default is pandas.
+        params: list, optional
+            Values for ? placeholders in the query
+
+        Returns
+        -------
+        df: pd.DataFrame | pyarrow.Table | polars.DataFrame
+            Query results
+        '''
+        if output not in self._outputs:
+            raise ValueError(f'output must be one of {self._outputs}')
+
+        result = self.connection.execute(query, params)
+
+        if output == 'arrow':
+            if hasattr(result, 'to_arrow_table'):
+                return result.to_arrow_table()
+            return result.fetch_arrow_table()
+        elif output == 'polars':
+            return result.pl()
+        return result.df()
+
+    def explain(self, query: str) -> str:
+        '''
+        Return the physical plan of a query, showing the filters and projections pushed into read_parquet
+
+        Parameters
+        ----------
+        query: str
+            SQL query to explain
+
+        Returns
+        -------
+        str
+        '''
+        return '\n'.join(row[1] for row in self.connection.execute(f'EXPLAIN {query}').fetchall())
+
+    def close(self) -> None:
+        '''
+        Close the DuckDB connection
+
+        Returns
+        -------
+        None
+        '''
+        self.connection.close()
+
+    @staticmethod
+    def _parquet_sources(parquet_path: str | List[str]) -> List[str]:
+        '''
+        Expand directories into recursive parquet globs
+
+        Parameters
+        ----------
+        parquet_path: str | list
+            Parquet file, list of files, glob pattern or directory
+
+        Returns
+        -------
+        List[str]
+        '''
+        if isinstance(parquet_path, str):
+            parquet_path = [parquet_path]
+
+        return [
+            os.path.join(p, '**', '*.parquet') if os.path.isdir(p) else p
+            for p in parquet_path
+        ]
+
+    @staticmethod
+    def _quote(value: str) -> str:
+        '''
+        Quote a value as a SQL string literal
+
+        Parameters
+        ----------
+        value: str
+            Value to quote
+
+        Returns
+        -------
+        str
+        '''
+        return "'" + str(value).replace("'", "''") + "'"
+
+
+__default_engine = None
+__default_engine_lock = threading.Lock()
+
+def default_engine() -> ParquetQueryEngine:
+    '''
+    Shared engine used by query_parquet when no engine is given
+
+    Returns
+    -------
+    ParquetQueryEngine
+    '''
+    global __default_engine
+    with __default_engine_lock:
+        if __default_engine is None:
+            __default_engine = ParquetQueryEngine()
+    return __default_engine
+
+
 def query_parquet(
-    parquet_path: str,
-    query: str
+    parquet_path: str | List[str],
+    query: str,
+    table_name: str = 'parquet',
+    output: str = 'pandas',
+    hive_partitioning: bool = None,
+    params: List[Any] = None,
+    engine: ParquetQueryEngine = None
 ) -> pd.DataFrame:
     '''
     Pre-filter a parquet file based on criteria before ingesting
 
+    Examples
+    --------
+    query_parquet('data/sales/', 'select region, sum(amount) from parquet where year = 2024 group by 1')
+
     Parameters
     ----------
-    parquet_path: str
-        File path of parquet to read
+    parquet_path: str | list
+        File path of parquet to read. Can also be a list of files, a glob or a hive-partitioned directory.
     query: str
-        SQL Query to execute against the parquet file
-    
+        SQL Query to execute against the parquet file. Reference the data by table_name.
+    table_name: str, optional
+        Name the parquet data is registered under. Default is parquet.
+    output: str, optional
+        Output format: 'pandas', 'arrow' or 'polars'. Default is pandas.
+    hive_partitioning: bool, optional
+        Read key=value directory names as columns. Detected automatically by default.
+    params: list, optional
+        Values for ? placeholders in the query
+    engine: ParquetQueryEngine, optional
+        Engine to run the query on. Defaults to a session of a shared engine, so concurrent calls
+        from several threads each query their own view.
+
     Returns
     ---------
     df: pd.DataFrame
         Dataframe(s) with filtered parquet data
     '''
 
-    query = query.lower()
-    start = re.findall(r'select.+?from', query)
-    end = re.findall(r'(where.*)', query)
+    if engine is not None:
+        engine.register(table_name, parquet_path, hive_partitioning=hive_partitioning)
+        return engine.query(query, output=output, params=params)
 
-    query = f'{start} read_parquet({parquet_path}) {end}'
-    df = duckdb.query(query).to_df()
-    return df
\ No newline at end of file
+    session = default_engine().session()
+    try:
+        session.register(table_name, parquet_path, hive_partitioning=hive_partitioning)
+        return session.query(query, output=output, params=params)
+    finally:
+        session.close()
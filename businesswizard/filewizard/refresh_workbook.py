@@ -1,5 +1,3 @@
-import win32
-
 def refresh_excel_workbook(workbook_name) -> None:
     '''
     Refresh an Excel Workbook
@@ -14,6 +12,9 @@ def refresh_excel_workbook(workbook_name) -> None:
     None
     '''
 
+    # Windows only, so imported when a workbook is refreshed rather than with the package
+    import win32com.client as win32
+
     xl = win32.Dispatch('Excel.Application')
     xl.DisplayAlerts = False
     wb = xl.Workbooks.Open(workbook_name)
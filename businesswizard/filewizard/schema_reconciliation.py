@@ -0,0 +1,386 @@
+import contextlib
+import zipfile
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pv
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from typing import Dict, List
+
+from .filereader import CsvHandler, sniff_format, read_file
+
+
+def clean_column_names(names: List[str]) -> List[str]:
+    '''
+    Apply janitor's clean_names to a list of column names without reading any data
+
+    Parameters
+    ----------
+    names: list
+        Raw column names
+
+    Returns
+    -------
+    List[str]
+    '''
+    # Registers clean_names; imported on first use as it is slow to load
+    import janitor  # noqa: F401
+
+    return list(pd.DataFrame(columns=names).clean_names().columns)
+
+
+# pandas read_csv options that import_reconciled maps onto the arrow csv reader
+__csv_kwargs = ['sep', 'delimiter', 'usecols', 'skiprows', 'na_values', 'quotechar']
+
+
+def __csv_options(file_format: str, encoding: str, sep: str = None, skiprows: int = 0, quotechar: str = '"') -> Dict:
+    return {
+        'read_options': pv.ReadOptions(encoding=encoding, skip_rows=skiprows),
+        'parse_options': pv.ParseOptions(
+            delimiter=sep or ('\t' if file_format == 'tsv' else ','),
+            quote_char=quotechar
+        ),
+    }
+
+
+def csv_source(path: str):
+    '''
+    Open a csv for the pyarrow csv reader, as a context manager
+
+    Gzip files are decompressed by pyarrow from their extension. Zip files are read from their
+    first member, as pd.read_csv does, since pyarrow cannot unwrap them.
+
+    Parameters
+    ----------
+    path: str
+        Csv file path
+
+    Returns
+    -------
+    Context manager yielding the path or an open file
+    '''
+    if sniff_format(path)[1] != 'zip':
+        return contextlib.nullcontext(path)
+    with zipfile.ZipFile(path) as zf:
+        # The member keeps the archive open after the ZipFile is closed
+        return zf.open(zf.namelist()[0])
+
+
+def scan_csv_types(
+    path: str,
+    schema: pa.Schema,
+    read_options: pv.ReadOptions,
+    parse_options: pv.ParseOptions,
+    null_values: List[str] = None
+) -> pa.Schema:
+    '''
+    Check the numeric columns of a csv schema inferred from the first block against every block
+
+    Only those columns are read, as text. Integers that later hold decimals widen to float64 and
+    numbers that later hold text become strings.
+
+    Parameters
+    ----------
+    path: str
+        Csv file path
+    schema: pa.Schema
+        Schema inferred from the first block, with the file's raw column names
+    read_options: pv.ReadOptions
+        Read options the schema was inferred with
+    parse_options: pv.ParseOptions
+        Parse options the schema was inferred with
+    null_values: list, optional
+        Values read as null. Defaults to pyarrow's.
+
+    Returns
+    -------
+    pa.Schema
+    '''
+    types = {f.name: f.type for f in schema}
+    numeric = [n for n, t in types.items() if pa.types.is_integer(t) or pa.types.is_floating(t)]
+    if len(numeric) == 0:
+        return schema
+
+    convert_options = pv.ConvertOptions(
+        column_types={n: pa.string() for n in numeric},
+        include_columns=numeric,
+        strings_can_be_null=True
+    )
+    if null_values is not None:
+        convert_options.null_values = null_values
+
+    with csv_source(path) as source:
+        reader = pv.open_csv(source, read_options=read_options, parse_options=parse_options, convert_options=convert_options)
+        for batch in reader:
+            for name, column in zip(batch.schema.names, batch.columns):
+                while not pa.types.is_string(types[name]):
+                    try:
+                        pc.cast(column, types[name])
+                        break
+                    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                        types[name] = pa.float64() if pa.types.is_integer(types[name]) else pa.string()
+            if all(pa.types.is_string(types[n]) for n in numeric):
+                break
+    return pa.schema([pa.field(n, t) for n, t in types.items()])
+
+
+def read_file_schema(path: str, encoding: str = 'utf8') -> pa.Schema:
+    '''
+    Read the column names and types of a file without loading its data
+
+    Parquet and Arrow files use their stored schema, csv files infer types from the first block
+    only, and Excel columns are typed as null (unknown) so other files decide their type.
+
+    Parameters
+    ----------
+    path: str
+        File path to inspect
+    encoding: str, optional
+        Text encoding of csv files. Default is utf8.
+
+    Returns
+    -------
+    pa.Schema
+        Schema with the file's raw column names
+    '''
+    file_format, _ = sniff_format(path)
+
+    if file_format == 'parquet':
+        return pq.read_schema(path)
+    if file_format in ['arrow', 'feather']:
+        with pa.memory_map(path, 'r') as source:
+            return pa.ipc.open_file(source).schema
+    if file_format in ['csv', 'tsv']:
+        with csv_source(path) as source, pv.open_csv(source, **__csv_options(file_format, encoding)) as reader:
+            return reader.schema
+
+    names = read_file(path, nrows=0).columns if file_format in ['xlsx', 'xls'] else read_file(path).columns
+    return pa.schema([pa.field(str(n), pa.null()) for n in names])
+
+
+def __promote(left: pa.DataType, right: pa.DataType) -> pa.DataType:
+    '''
+    Resolve two column types to one that holds both, independent of argument order
+    '''
+    if left == right:
+        return left
+    if pa.types.is_null(left):
+        return right
+    if pa.types.is_null(right):
+        return left
+
+    if pa.types.is_integer(left) and pa.types.is_integer(right):
+        return pa.int64()
+    if (pa.types.is_integer(left) or pa.types.is_floating(left)) and (pa.types.is_integer(right) or pa.types.is_floating(right)):
+        return pa.float64()
+
+    temporal = [pa.types.is_date, pa.types.is_timestamp]
+    if any(t(left) for t in temporal) and any(t(right) for t in temporal):
+        return pa.timestamp('us')
+
+    # Anything else (e.g. number vs text, bool vs date) is kept as text rather than object
+    return pa.string()
+
+
+def unify_schemas(schemas: List[pa.Schema]) -> pa.Schema:
+    '''
+    Build one target schema from many file schemas
+
+    Column names are cleaned once and unioned in first-seen order. Conflicting types are resolved
+    deterministically: integers widen to int64, mixed integers and floats become float64, mixed
+    dates and timestamps become timestamps and any other conflict becomes string.
+
+    Parameters
+    ----------
+    schemas: list
+        Schemas with raw column names
+
+    Returns
+    -------
+    pa.Schema
+        Target schema with cleaned column names
+    '''
+    types = {}
+    for schema in schemas:
+        for name, field in zip(clean_column_names(schema.names), schema):
+            types[name] = __promote(types[name], field.type) if name in types else field.type
+
+    # Columns that are null in every file still need a concrete type
+    return pa.schema([pa.field(n, pa.string() if pa.types.is_null(t) else t) for n, t in types.items()])
+
+
+def conform_table(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    '''
+    Cast a table with cleaned column names to the target schema. Missing columns are filled with nulls
+    and columns outside the schema are dropped.
+
+    Parameters
+    ----------
+    table: pa.Table
+        Table with cleaned column names
+    schema: pa.Schema
+        Target schema
+
+    Returns
+    -------
+    pa.Table
+    '''
+    columns = []
+    for field in schema:
+        if field.name in table.column_names:
+            columns.append(table[field.name].cast(field.type))
+        else:
+            columns.append(pa.nulls(len(table), field.type))
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def drop_empty(table: pa.Table) -> pa.Table:
+    '''
+    Drop rows and columns where every value is null, as janitor's remove_empty does
+
+    Parameters
+    ----------
+    table: pa.Table
+        Table to clean
+
+    Returns
+    -------
+    pa.Table
+    '''
+    if table.num_columns == 0 or len(table) == 0:
+        return table
+
+    table = table.select([i for i, c in enumerate(table.columns) if c.null_count < len(c)])
+    if table.num_columns == 0:
+        return table
+
+    mask = pc.is_valid(table.column(0))
+    for column in table.columns[1:]:
+        mask = pc.or_(mask, pc.is_valid(column))
+    return table.filter(mask)
+
+
+def __is_decode_error(error: Exception) -> bool:
+    # pyarrow decodes utf8 itself and reports invalid text as a conversion error; other encodings raise from python
+    return isinstance(error, UnicodeDecodeError) or 'invalid UTF8' in str(error)
+
+
+def __read_csv_schema(path: str, file_format: str, encodings: List[str], options: Dict, null_values: List[str]) -> tuple:
+    '''
+    Read a csv schema with the first encoding that decodes its header. Returns the schema and the encoding.
+    '''
+    for e in encodings:
+        try:
+            convert_options = pv.ConvertOptions(null_values=null_values, strings_can_be_null=True)
+            csv_options = __csv_options(file_format, e, **options)
+            with csv_source(path) as source, pv.open_csv(source, convert_options=convert_options, **csv_options) as reader:
+                schema = reader.schema
+        except (pa.ArrowInvalid, UnicodeDecodeError) as error:
+            if not __is_decode_error(error):
+                raise
+            last_error = error
+            continue
+        # Text that is not valid in the encoding is inferred as binary instead of raising
+        if not any(pa.types.is_binary(t) for t in schema.types):
+            # Types come from the first block, so numeric columns are checked over the whole file
+            return scan_csv_types(path, schema, null_values=null_values, **csv_options), e
+        last_error = UnicodeDecodeError(e, b'', 0, 0, f'{path} contains text that is not valid {e}')
+    raise last_error
+
+
+def __read_csv_table(path: str, file_format: str, encodings: List[str], options: Dict, convert_options) -> pa.Table:
+    '''
+    Read a whole csv, falling through the encodings when a later block does not decode
+    '''
+    for e in encodings:
+        try:
+            with csv_source(path) as source:
+                return pv.read_csv(source, convert_options=convert_options, **__csv_options(file_format, e, **options))
+        except (pa.ArrowInvalid, UnicodeDecodeError) as error:
+            if not __is_decode_error(error):
+                raise
+            last_error = error
+    raise last_error
+
+
+def import_reconciled(file_paths: List[str], encoding: str = None, **kwargs) -> pd.DataFrame:
+    '''
+    Read files into one arrow-backed dataframe using a single schema computed from their headers
+
+    Csv files are parsed straight into the target types, with numeric columns checked over the
+    whole file first so a late decimal or text value widens the column instead of failing. Other
+    formats are read through read_file and cast. Files are concatenated in arrow and cleaned once, so no column is upcast to object.
+
+    Parameters
+    ----------
+    file_paths: list
+        Files to read
+    encoding: str, optional
+        Text encoding of csv files. Defaults to trying utf-8 and then the same fallback encodings as read_file.
+    **kwargs:
+        Csv files accept sep, delimiter, usecols, skiprows, na_values and quotechar as in pd.read_csv;
+        other options raise a TypeError. Non-csv files pass every option to read_file.
+
+    Returns
+    -------
+    df: pd.DataFrame
+        Dataframe with pyarrow-backed dtypes
+    '''
+    formats = {path: sniff_format(path)[0] for path in file_paths}
+    has_csv = any(f in ['csv', 'tsv'] for f in formats.values())
+
+    unsupported = [k for k in kwargs if k not in __csv_kwargs]
+    if has_csv and len(unsupported) > 0:
+        raise TypeError(f'Schema reconciliation does not support the csv options {unsupported}')
+
+    encodings = [encoding] if encoding is not None else CsvHandler._encodings
+    usecols = kwargs.get('usecols')
+    null_values = pv.ConvertOptions().null_values
+    if kwargs.get('na_values') is not None:
+        na_values = kwargs['na_values']
+        null_values += [na_values] if isinstance(na_values, str) else [str(v) for v in na_values]
+    options = {
+        'sep': kwargs.get('sep', kwargs.get('delimiter')),
+        'skiprows': kwargs.get('skiprows') or 0,
+        'quotechar': kwargs.get('quotechar', '"')
+    }
+
+    # Non-csv files are read whole up front so their real column types take part in the unified schema
+    loaded = {}
+    schemas = []
+    csv_encodings = {}
+    for path in file_paths:
+        if formats[path] in ['csv', 'tsv']:
+            schema, csv_encodings[path] = __read_csv_schema(path, formats[path], encodings, options, null_values)
+            if usecols is not None:
+                schema = pa.schema([f for f in schema if (usecols(f.name) if callable(usecols) else f.name in usecols)])
+            schemas.append(schema)
+        else:
+            loaded[path] = pa.Table.from_pandas(read_file(path, **kwargs), preserve_index=False)
+            schemas.append(loaded[path].schema)
+    target = unify_schemas(schemas)
+
+    tables = []
+    for path, schema in zip(file_paths, schemas):
+        names = clean_column_names(schema.names)
+
+        if path in loaded:
+            table = loaded.pop(path)
+        else:
+            column_types = {raw: target.field(clean).type for raw, clean in zip(schema.names, names)}
+            convert_options = pv.ConvertOptions(
+                column_types=column_types,
+                include_columns=schema.names,
+                null_values=null_values,
+                strings_can_be_null=True
+            )
+            # Start from the encoding that decoded the header
+            remaining = encodings[encodings.index(csv_encodings[path]):]
+            table = __read_csv_table(path, formats[path], remaining, options, convert_options)
+
+        tables.append(conform_table(table.rename_columns(names), target))
+
+    if len(tables) == 0:
+        return pd.DataFrame()
+    return drop_empty(pa.concat_tables(tables)).to_pandas(types_mapper=pd.ArrowDtype)
@@ -0,0 +1,99 @@
+import uuid
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from typing import List
+
+
+def __dictionary_columns(table: pa.Table, dictionary_threshold: float) -> List[str]:
+    '''
+    Find string columns with few enough distinct values to benefit from dictionary encoding
+    '''
+    columns = []
+    for name, column in zip(table.column_names, table.columns):
+        if not (pa.types.is_string(column.type) or pa.types.is_large_string(column.type)):
+            continue
+        if len(column) > 0 and pc.count_distinct(column).as_py() / len(column) <= dictionary_threshold:
+            columns.append(name)
+    return columns
+
+
+def write_parquet_dataset(
+    data: pd.DataFrame | pa.Table,
+    root_path: str,
+    partition_cols: List[str] = None,
+    sort_by: List[str] = None,
+    row_group_size: int = 1_000_000,
+    compression: str = 'zstd',
+    dictionary_threshold: float = 0.1,
+    mode: str = 'overwrite'
+) -> str:
+    '''
+    Write a dataframe or arrow table to a (hive partitioned) parquet dataset
+
+    Partitioning lets query_parquet skip whole files, while sorting within files tightens the
+    min/max statistics of each row group so filters on the sort columns skip most row groups.
+
+    Examples
+    --------
+    write_parquet_dataset(df, 'data/sales', partition_cols=['year'], sort_by=['customer_id'])
+
+    Parameters
+    ----------
+    data: pd.DataFrame | pa.Table
+        Data to write
+    root_path: str
+        Directory of the dataset
+    partition_cols: list, optional
+        Columns to partition by. Each value gets its own key=value directory.
+    sort_by: list, optional
+        Columns to sort rows by within each file
+    row_group_size: int, optional
+        Target number of rows per row group. Default is 1,000,000.
+    compression: str, optional
+        Compression codec: 'zstd', 'snappy', 'gzip', 'lz4', 'brotli' or 'none'. Default is zstd.
+    dictionary_threshold: float, optional
+        String columns whose distinct-value ratio is at or below this are dictionary encoded. Default is 0.1.
+    mode: str, optional
+        'overwrite' replaces the partitions being written, 'append' adds new files next to existing ones.
+
+    Returns
+    -------
+    root_path: str
+        Directory of the dataset
+    '''
+
+    if mode not in ['overwrite', 'append']:
+        raise ValueError("mode must be 'overwrite' or 'append'")
+
+    # Imported here so importing filewizard does not load pyarrow.dataset
+    import pyarrow.dataset as ds
+
+    if isinstance(data, pd.DataFrame):
+        data = pa.Table.from_pandas(data, preserve_index=False)
+
+    if sort_by is not None:
+        data = data.sort_by([(c, 'ascending') for c in sort_by])
+
+    file_options = ds.ParquetFileFormat().make_write_options(
+        compression=compression,
+        use_dictionary=__dictionary_columns(data, dictionary_threshold),
+        write_statistics=True
+    )
+
+    ds.write_dataset(
+        data,
+        root_path,
+        format='parquet',
+        partitioning=partition_cols,
+        partitioning_flavor='hive' if partition_cols else None,
+        file_options=file_options,
+        # Unique file names per write so appends never clobber existing files
+        basename_template=f'part-{uuid.uuid4().hex}-{{i}}.parquet',
+        preserve_order=sort_by is not None,
+        min_rows_per_group=row_group_size,
+        max_rows_per_group=row_group_size,
+        existing_data_behavior='delete_matching' if mode == 'overwrite' else 'overwrite_or_ignore'
+    )
+    return root_path
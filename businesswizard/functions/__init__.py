@@ -1,17 +1,61 @@
 from .add_leading_zero import add_leading_zero
+from .business_calendar import BusinessCalendar, get_calendar, register_calendar
 from .clean_column_text import clean_column_text
 from .create_flag import create_flag
+from .create_flags import create_flags
 from .date_diff import date_diff
 from .date_list import create_date_list
 from .group_concat import group_concat
+from .group_partitions import GroupPartitions
+from .parallel_apply import parallel_apply
+from .pattern_replacer import MultiPatternReplacer, compile_replacements
+from .pipeline import Pipeline, PipelineStep
 from .subset_by_group import subset_by_group
+import importlib
+import sys
+
+# Loaded on first use so importing the package does not pay for pyarrow.dataset or polars
+__lazy = {
+    "StreamingExecutor": ".streaming",
+    "polars_backend": ".polars_backend"
+}
+
+if 'polars' in sys.modules:
+    # Registers the df.bw namespace on polars dataframes. When polars is imported later the
+    # namespace is registered by the first polars frame passed to a function, or by importing
+    # businesswizard.functions.polars_backend.
+    from . import polars_backend
+
+
+def __getattr__(name: str):
+    if name not in __lazy:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(__lazy[name], __name__)
+    value = module if name == 'polars_backend' else getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__lazy))
 
 __all__ = [
     "add_leading_zero",
+    "BusinessCalendar",
+    "get_calendar",
+    "register_calendar",
     "clean_column_text",
     "create_flag",
+    "create_flags",
     "date_diff",
     "create_date_list",
     "group_concat",
+    "GroupPartitions",
+    "parallel_apply",
+    "MultiPatternReplacer",
+    "compile_replacements",
+    "Pipeline",
+    "PipelineStep",
+    "StreamingExecutor",
     "subset_by_group"
 ]
\ No newline at end of file
@@ -1,10 +1,12 @@
 import pandas as pd
 import pandas_flavor as pf
 from typing import List
-import pydoc
+
+from .dispatch import polars_dispatch
 
 
 @pf.register_dataframe_method
+@polars_dispatch
 def add_leading_zero(
     df: pd.DataFrame,
     column_name: str | List[str],
@@ -26,8 +28,8 @@ def add_leading_zero(
     df: pd.DataFrame
         Dataframe with leading zeroes added to the desired columns
     '''
+    if isinstance(column_name, str):
+        column_name = [column_name]
     for c in column_name:
         df[c] = df[c].astype(str).str.zfill(character_length)
     return df
-
-pydoc.writedoc('add_leading_zero')
\ No newline at end of file
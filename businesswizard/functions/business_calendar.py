@@ -0,0 +1,270 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, List
+
+
+class BusinessCalendar:
+    '''
+    Business day calendar with a precomputed business day index
+
+    Every day from start to end is flagged as a business day or not once, and a running count of
+    business days is kept alongside. Counting, offsetting and checking business days are then
+    array lookups instead of calendar walks. Dates outside the index fall back to numpy's
+    business day functions with the same weekmask and holidays.
+
+    Attributes
+    ----------
+    name: str
+        Name of the calendar
+    weekmask: str
+        Seven character mask of working days starting on Monday
+    holidays: np.ndarray
+        Non-working dates as datetime64[D]
+    start: np.datetime64
+        First date covered by the index
+    end: np.datetime64
+        Last date covered by the index
+
+    Methods
+    -------
+    is_business_day: np.ndarray
+        Flag dates that are business days
+    business_days_between: np.ndarray
+        Count business days from start to end inclusive
+    add_business_days: np.ndarray
+        Move dates forward or back by a number of business days
+    business_days: np.ndarray
+        List the business days between two dates
+    '''
+
+    def __init__(
+        self,
+        name: str,
+        holidays: List = None,
+        weekmask: str = '1111100',
+        start: str = '1900-01-01',
+        end: str = '2099-12-31'
+    ):
+        '''
+        Parameters
+        ----------
+        name: str
+            Name of the calendar
+        holidays: list, optional
+            Non-working dates
+        weekmask: str, optional
+            Seven character mask of working days starting on Monday. Default is Monday to Friday.
+        start: str, optional
+            First date covered by the index. Default is 1900-01-01.
+        end: str, optional
+            Last date covered by the index. Default is 2099-12-31.
+        '''
+        self.name = name
+        self.weekmask = weekmask
+        self.start = np.datetime64(start, 'D')
+        self.end = np.datetime64(end, 'D')
+        self.holidays = np.array([] if holidays is None else pd.to_datetime(list(holidays)).values, dtype='datetime64[D]')
+
+        days = np.arange(self.start, self.end + np.timedelta64(1, 'D'), dtype='datetime64[D]')
+        self._is_business_day = np.is_busday(days, weekmask=weekmask, holidays=self.holidays)
+        # Business days up to and including each day
+        self._ordinal = np.cumsum(self._is_business_day)
+        self._business_day_positions = np.flatnonzero(self._is_business_day)
+
+    def __repr__(self) -> str:
+        return f'BusinessCalendar({self.name}, {self.start} to {self.end}, {len(self.holidays)} holidays)'
+
+    @staticmethod
+    def _days(dates) -> np.ndarray:
+        '''
+        Convert dates to a datetime64[D] array
+        '''
+        return pd.to_datetime(pd.Series(dates)).to_numpy(dtype='datetime64[ns]').astype('datetime64[D]')
+
+    def _covers(self, *days: np.ndarray) -> bool:
+        '''
+        Check that the index covers every date
+        '''
+        return all(len(d) == 0 or (d.min() >= self.start and d.max() <= self.end) for d in days)
+
+    def _positions(self, days: np.ndarray) -> np.ndarray:
+        '''
+        Convert dates covered by the index to positions in it
+        '''
+        return (days - self.start).astype('int64')
+
+    def is_business_day(self, dates) -> np.ndarray:
+        '''
+        Flag dates that are business days
+
+        Parameters
+        ----------
+        dates: array-like
+            Dates to check
+
+        Returns
+        -------
+        np.ndarray
+            Boolean array
+        '''
+        days = self._days(dates)
+        if not self._covers(days):
+            return np.is_busday(days, weekmask=self.weekmask, holidays=self.holidays)
+        return self._is_business_day[self._positions(days)]
+
+    def business_days_between(self, start_dates, end_dates) -> np.ndarray:
+        '''
+        Count business days from start to end, counting both ends. The count is 0 when the start is after the end.
+
+        Parameters
+        ----------
+        start_dates: array-like
+            Start dates
+        end_dates: array-like
+            End dates
+
+        Returns
+        -------
+        np.ndarray
+            Integer array
+        '''
+        start = self._days(start_dates)
+        end = self._days(end_dates)
+        if not self._covers(start, end):
+            counts = np.busday_count(start, end + np.timedelta64(1, 'D'), weekmask=self.weekmask, holidays=self.holidays)
+            return np.where(start > end, 0, counts)
+
+        start = self._positions(start)
+        end = self._positions(end)
+        counts = self._ordinal[end] - self._ordinal[start] + self._is_business_day[start]
+        return np.where(start > end, 0, counts)
+
+    def add_business_days(self, dates, n: int | np.ndarray) -> np.ndarray:
+        '''
+        Move dates by n business days. Dates that are not business days first roll forward to the next one.
+
+        Parameters
+        ----------
+        dates: array-like
+            Dates to offset
+        n: int | np.ndarray
+            Number of business days to move, negative to move back
+
+        Returns
+        -------
+        np.ndarray
+            datetime64[D] array
+        '''
+        days = self._days(dates)
+        if self._covers(days):
+            positions = self._positions(days)
+            # Zero based rank of the date, or of the next business day when the date is not one
+            rank = self._ordinal[positions] - self._is_business_day[positions]
+            target = rank + np.asarray(n)
+            if len(target) == 0 or (target.min() >= 0 and target.max() < len(self._business_day_positions)):
+                return self.start + self._business_day_positions[target].astype('timedelta64[D]')
+        return np.busday_offset(days, n, roll='forward', weekmask=self.weekmask, holidays=self.holidays)
+
+    def business_days(self, start_date, end_date) -> np.ndarray:
+        '''
+        List the business days between two dates, inclusive
+
+        Parameters
+        ----------
+        start_date: str | datetime
+            First date
+        end_date: str | datetime
+            Last date
+
+        Returns
+        -------
+        np.ndarray
+            datetime64[D] array
+        '''
+        days = self._days([start_date, end_date])
+        if not self._covers(days):
+            candidates = np.arange(days[0], days[1] + np.timedelta64(1, 'D'), dtype='datetime64[D]')
+            return candidates[np.is_busday(candidates, weekmask=self.weekmask, holidays=self.holidays)]
+
+        start, end = self._positions(days)
+        positions = self._business_day_positions
+        selected = positions[(positions >= start) & (positions <= end)]
+        return self.start + selected.astype('timedelta64[D]')
+
+
+def __us_federal_holidays() -> List:
+    from pandas.tseries.holiday import USFederalHolidayCalendar
+    return USFederalHolidayCalendar().holidays(start='1900-01-01', end='2099-12-31')
+
+
+# Calendars are built on first use and then kept, so the index is computed once per session
+__calendars: Dict[str, BusinessCalendar] = {}
+__calendar_specs: Dict[str, Dict] = {
+    'weekdays': {},
+    'us_federal': {'holidays': __us_federal_holidays},
+}
+
+
+def register_calendar(
+    name: str,
+    holidays: List = None,
+    weekmask: str = '1111100',
+    start: str = '1900-01-01',
+    end: str = '2099-12-31'
+) -> None:
+    '''
+    Register a named business calendar with its own holidays and working week
+
+    Examples
+    --------
+    register_calendar('uk_office', holidays=['2024-12-25', '2024-12-26'])
+    df.date_diff('start', 'end', calendar='uk_office')
+
+    Parameters
+    ----------
+    name: str
+        Name used to look up the calendar
+    holidays: list, optional
+        Non-working dates
+    weekmask: str, optional
+        Seven character mask of working days starting on Monday. Default is Monday to Friday.
+    start: str, optional
+        First date of the precomputed index. Default is 1900-01-01.
+    end: str, optional
+        Last date of the precomputed index. Default is 2099-12-31.
+
+    Returns
+    -------
+    None
+    '''
+    __calendar_specs[name] = {'holidays': holidays, 'weekmask': weekmask, 'start': start, 'end': end}
+    __calendars.pop(name, None)
+
+
+def get_calendar(calendar: str | BusinessCalendar) -> BusinessCalendar:
+    '''
+    Look up a registered business calendar, building its index on first use
+
+    Built in calendars are 'weekdays' (Monday to Friday, no holidays) and 'us_federal'
+    (Monday to Friday excluding US federal holidays).
+
+    Parameters
+    ----------
+    calendar: str | BusinessCalendar
+        Calendar name, or a BusinessCalendar which is returned as-is
+
+    Returns
+    -------
+    BusinessCalendar
+    '''
+    if isinstance(calendar, BusinessCalendar):
+        return calendar
+    if calendar not in __calendar_specs:
+        raise ValueError(f'Unknown calendar {calendar}. Registered calendars: {", ".join(__calendar_specs)}')
+
+    if calendar not in __calendars:
+        spec = dict(__calendar_specs[calendar])
+        if callable(spec.get('holidays')):
+            spec['holidays'] = spec['holidays']()
+        __calendars[calendar] = BusinessCalendar(calendar, **spec)
+    return __calendars[calendar]
@@ -1,28 +1,155 @@
+import os
 import pandas as pd
 import pandas_flavor as pf
-import re
+import pyarrow as pa
+import pyarrow.compute as pc
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict
-import pydoc
 
-def __lower_text(df, c):
-    return [str(x).lower() for x in df[c]]
+from .dispatch import polars_dispatch
+from .pattern_replacer import compile_replacements
 
-def __upper_text(df, c):
-    return [str(x).upper() for x in df[c]]
+__special_characters = '[^A-Za-z]+'
 
-def __proper_text(df, c):
-    return [str(x).title() for x in df[c]]
+__arrow_case = {
+    'upper': pc.utf8_upper,
+    'lower': pc.utf8_lower,
+    'proper': pc.utf8_title
+}
+
+__pandas_case = {
+    'upper': lambda s: s.str.upper(),
+    'lower': lambda s: s.str.lower(),
+    'proper': lambda s: s.str.title()
+}
+
+def __stringify(s: pd.Series) -> pd.Series:
+    '''
+    Convert the non-null values to python strings, keeping nulls as nulls
+    '''
+    s = s.astype(object)
+    return s.where(s.isna(), s.astype(str))
+
+def __to_string_array(s: pd.Series) -> pa.Array:
+    '''
+    Convert a column to an arrow string array, keeping nulls as nulls. Columns that are not text are
+    stringified by pandas so numbers read the same as with the pandas engine (1.0 rather than 1).
+    '''
+    try:
+        arr = pa.array(s, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        arr = None
+
+    if isinstance(arr, pa.ChunkedArray):
+        arr = arr.combine_chunks()
+    if arr is not None and pa.types.is_dictionary(arr.type):
+        arr = arr.dictionary_decode()
+    if arr is None or not (pa.types.is_string(arr.type) or pa.types.is_large_string(arr.type) or pa.types.is_null(arr.type)):
+        arr = pa.array(__stringify(s), from_pandas=True, type=pa.string())
+    return pc.cast(arr, pa.string())
+
+def __to_series(arr: pa.Array, s: pd.Series) -> pd.Series:
+    '''
+    Build the result column from a string array. Both engines return the same dtype: arrow strings for
+    arrow-backed input, otherwise the default string dtype of the installed pandas.
+    '''
+    if isinstance(s.dtype, pd.ArrowDtype):
+        return pd.Series(arr, index=s.index, name=s.name, dtype=pd.ArrowDtype(arr.type))
+    # Take the values only; the series arrow returns has its own range index
+    return pd.Series(arr.to_pandas().array, index=s.index, name=s.name)
+
+def __replace_values(
+    arr: pa.Array,
+    transformations_dictionary: Dict[str, str],
+    use_regex: bool,
+    whole_word: bool,
+    ignore_case: bool
+) -> pa.Array:
+    if use_regex is True or whole_word is True:
+        # One scan of each distinct value with all patterns compiled together
+        replacer = compile_replacements(transformations_dictionary, use_regex, whole_word, ignore_case)
+        uniques = pc.unique(arr)
+        replaced = pa.array([replacer.replace(u) for u in uniques.to_pylist()], type=arr.type)
+        return pc.take(replaced, pc.index_in(arr, value_set=uniques))
+
+    # Whole value replacement, as Series.replace does without regex
+    keys = list(transformations_dictionary.keys())
+    lookup = arr
+    if ignore_case is True:
+        keys = [k.lower() for k in keys]
+        lookup = pc.utf8_lower(arr)
+    values = pa.array(list(transformations_dictionary.values()), type=arr.type)
+    positions = pc.index_in(lookup, value_set=pa.array(keys, type=arr.type))
+    return pc.if_else(pc.is_valid(positions), pc.take(values, positions), arr)
+
+def __clean_arrow(
+    s: pd.Series,
+    transformations_dictionary: Dict[str, str],
+    remove_special_characters: bool,
+    use_regex: bool,
+    change_case: str,
+    whole_word: bool,
+    ignore_case: bool
+) -> pd.Series:
+    '''
+    Run every transformation on one column as arrow compute kernels, converting to and from pandas once
+    '''
+    arr = __to_string_array(s)
+
+    if remove_special_characters is True:
+        arr = pc.replace_substring_regex(arr, pattern=__special_characters, replacement='')
+    if change_case is not None:
+        arr = __arrow_case[change_case](arr)
+    if transformations_dictionary is not None:
+        arr = __replace_values(arr, transformations_dictionary, use_regex, whole_word, ignore_case)
+    return __to_series(pc.utf8_trim_whitespace(arr), s)
+
+def __clean_pandas(
+    s: pd.Series,
+    transformations_dictionary: Dict[str, str],
+    remove_special_characters: bool,
+    use_regex: bool,
+    change_case: str,
+    whole_word: bool,
+    ignore_case: bool
+) -> pd.Series:
+    original = s
+    s = __stringify(s)
+
+    if remove_special_characters is True:
+        s = s.str.replace(__special_characters, '', regex=True)
+    if change_case is not None:
+        s = __pandas_case[change_case](s)
+    if transformations_dictionary is not None:
+        if use_regex is True or whole_word is True:
+            s = compile_replacements(transformations_dictionary, use_regex, whole_word, ignore_case).replace_series(s)
+        elif ignore_case is True:
+            lowered = {k.lower(): v for k, v in transformations_dictionary.items()}
+            s = s.str.lower().map(lowered).where(s.str.lower().isin(lowered.keys()), s)
+        else:
+            s = s.replace(transformations_dictionary)
+    return __to_series(pa.array(s.str.strip(), from_pandas=True, type=pa.string()), original)
 
 @pf.register_dataframe_method
+@polars_dispatch
 def clean_column_text(
     df: pd.DataFrame,
     columns_to_transform: str | List[str],
     transformations_dictionary: Dict[str, str] = None,
     remove_special_characters: bool = False,
     use_regex: bool = False,
-    change_case: str = None
+    change_case: str = None,
+    whole_word: bool = False,
+    ignore_case: bool = False,
+    engine: str = 'arrow',
+    max_workers: int = None
 ) -> pd.DataFrame:
     '''
+    Clean the text of one or many columns: strip special characters, change case, replace values and trim whitespace
+
+    The arrow engine runs all steps for a column as one chain of arrow compute kernels and cleans
+    columns in parallel threads. Missing values stay missing.
+
     Parameters
     ----------
     df: pd.DataFrame
@@ -30,37 +157,51 @@ def clean_column_text(
     columns_to_transform: str | list
         Name of columns to be transformed. Can be either a string or list of strings.
     transformations_dictionary: dict, optional
-        Dictionary of word replacements to be made.
+        Dictionary of word replacements to be made. Without regex or whole_word, whole values are replaced.
+        Otherwise all keys are compiled into one pattern and applied in a single scan of each distinct value.
     remove_special_characters: bool, optional
         When True, special characters are removed from the column
     use_regex: bool, optional
         Set to True when regex should be used in word replacement.
+    whole_word: bool, optional
+        When True, dictionary keys replace whole words within the text
+    ignore_case: bool, optional
+        When True, dictionary keys match regardless of case
     change_case: str, optional
         Determines if the case of words should be changes. E.g. 'lower', 'upper', 'proper'
+    engine: str, optional
+        'arrow' for arrow compute or 'pandas' for pandas string methods. Default is arrow.
+    max_workers: int, optional
+        Number of threads used to clean columns in parallel. Defaults to one per column up to the number of cores.
     Returns
     -----------
     df: pd.Dataframe
         Dataframe containing the transformed result
     '''
 
-    case_map = {
-        'upper': __upper_text,
-        'lower': __lower_text,
-        'proper': __proper_text
-    }
-
-    for c in columns_to_transform:
-        if remove_special_characters is True:
-            df[c] = [re.sub('[^A-Za-z]+', '', str(x)) for x in df[c]]
-        
-        if change_case is not None:
-            df[c] = case_map[change_case](df, c)
-        
-        if transformations_dictionary is not None:
-            df[c].replace(transformations_dictionary, regex=use_regex, inplace = True)
-        
-        df[c] = df[c].str.strip()
-    
-    return df
+    if isinstance(columns_to_transform, str):
+        columns_to_transform = [columns_to_transform]
+    if change_case is not None and change_case not in __arrow_case:
+        raise ValueError("change_case must be one of 'lower', 'upper' or 'proper'")
+
+    if engine == 'arrow':
+        clean = __clean_arrow
+    elif engine == 'pandas':
+        clean = __clean_pandas
+    else:
+        raise ValueError("engine must be 'arrow' or 'pandas'")
+
+    def run(c):
+        return clean(df[c], transformations_dictionary, remove_special_characters, use_regex, change_case, whole_word, ignore_case)
 
-pydoc.writedoc('clean_column_text')
\ No newline at end of file
+    if engine == 'arrow' and len(columns_to_transform) > 1:
+        # Arrow kernels release the GIL, so independent columns clean concurrently
+        with ThreadPoolExecutor(max_workers or min(len(columns_to_transform), os.cpu_count() or 1)) as executor:
+            results = list(executor.map(run, columns_to_transform))
+    else:
+        results = [run(c) for c in columns_to_transform]
+
+    for c, result in zip(columns_to_transform, results):
+        df[c] = result
+
+    return df
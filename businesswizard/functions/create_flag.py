@@ -1,9 +1,12 @@
 import pandas as pd
 import pandas_flavor as pf
 from typing import List
-import pydoc
+
+from .dispatch import polars_dispatch
+from .create_flags import create_flags
 
 @pf.register_dataframe_method
+@polars_dispatch
 def create_flag(
     df: pd.DataFrame,
     lookup_column: str,
@@ -13,7 +16,7 @@ def create_flag(
     value_not_in_flag_mapping: str = 'N'
 ) -> pd.DataFrame:
     '''
-    Create a flag column in a dataframe based on list values
+    Create a flag column in a dataframe based on list values. Use create_flags to create many flags in one pass.
 
     Parameters
     ----------
@@ -39,12 +42,5 @@ def create_flag(
     if flag_column_name is None:
         flag_column_name = 'created_flag_column'
 
-    bool_values = [True, False]
-    bool_mappings = [value_in_flag_mapping, value_not_in_flag_mapping]
-    mapping_dict = dict(zip(bool_values, bool_mappings))
-
-    df[flag_column_name] = df[lookup_column].isin(lookup_list).map(mapping_dict)
-
-    return df
-
-pydoc.writedoc('create_flag')
\ No newline at end of file
+    rule = {'name': flag_column_name, 'column': lookup_column, 'isin': lookup_list}
+    return create_flags(df, [rule], output='object', values=(value_in_flag_mapping, value_not_in_flag_mapping))
@@ -0,0 +1,144 @@
+import numpy as np
+import pandas as pd
+import pandas_flavor as pf
+from typing import Dict, List, Tuple
+
+from .dispatch import polars_dispatch
+
+__rule_types = ['isin', 'between', 'regex', 'isnull', 'notnull']
+
+class _FactorizedColumn:
+    '''
+    Column factorized once so set and pattern rules are evaluated against its distinct values only
+    '''
+
+    def __init__(self, s: pd.Series):
+        self.s = s
+        self._codes = None
+        self._uniques = None
+
+    def _factorize(self):
+        if self._codes is None:
+            self._codes, self._uniques = pd.factorize(self.s, use_na_sentinel=True)
+
+    def from_uniques(self, unique_mask: np.ndarray, missing: bool = False) -> np.ndarray:
+        # Missing values have code -1, which picks the trailing value
+        return np.append(unique_mask, missing)[self._codes]
+
+    def isin(self, lookup: pd.Index) -> np.ndarray:
+        self._factorize()
+        # Missing values match a lookup that holds None or NaN, as Series.isin does
+        return self.from_uniques(pd.Index(self._uniques).isin(lookup), bool(pd.isna(lookup).any()))
+
+    def regex(self, pattern: str, case: bool) -> np.ndarray:
+        self._factorize()
+        uniques = pd.Series(self._uniques, dtype=object).astype(str)
+        return self.from_uniques(uniques.str.contains(pattern, case=case, regex=True).to_numpy(dtype=bool))
+
+def __rule_type(rule: Dict) -> str:
+    found = [t for t in __rule_types if t in rule]
+    if len(found) != 1:
+        raise ValueError(f"Each rule needs exactly one of {', '.join(__rule_types)}: {rule}")
+    return found[0]
+
+def __between(s: pd.Series, low, high, inclusive: str) -> np.ndarray:
+    '''
+    Range check where None leaves that end open. Missing values never match.
+    '''
+    mask = s.notna()
+    if low is not None:
+        mask &= (s >= low) if inclusive in ['both', 'left'] else (s > low)
+    if high is not None:
+        mask &= (s <= high) if inclusive in ['both', 'right'] else (s < high)
+    return mask.fillna(False).to_numpy(dtype=bool)
+
+def __evaluate(rule: Dict, column, lookups: Dict[Tuple, pd.Index]) -> np.ndarray:
+    rule_type = __rule_type(rule)
+
+    if rule_type == 'isin':
+        values = tuple(rule['isin'])
+        # Lookup lists shared between rules are hashed once
+        if values not in lookups:
+            lookups[values] = pd.Index(values)
+        mask = column.isin(lookups[values])
+    elif rule_type == 'regex':
+        mask = column.regex(rule['regex'], not rule.get('ignore_case', False))
+    elif rule_type == 'between':
+        mask = __between(column.s, *rule['between'], rule.get('inclusive', 'both'))
+    else:
+        # {'isnull': False} reads as notnull and vice versa
+        mask = column.s.isna().to_numpy() == (bool(rule[rule_type]) == (rule_type == 'isnull'))
+
+    if rule.get('negate', False) is True:
+        mask = ~mask
+    return mask
+
+def __to_output(mask: np.ndarray, output: str, values: Tuple[str, str], index: pd.Index) -> pd.Series:
+    if output == 'bool':
+        return pd.Series(mask, index=index)
+    if output == 'category':
+        codes = (~mask).astype('int8')
+        return pd.Series(pd.Categorical.from_codes(codes, categories=list(values)), index=index)
+    return pd.Series(np.where(mask, values[0], values[1]).astype(object), index=index)
+
+@pf.register_dataframe_method
+@polars_dispatch
+def create_flags(
+    df: pd.DataFrame,
+    rules: List[Dict],
+    output: str = 'category',
+    values: Tuple[str, str] = ('Y', 'N')
+) -> pd.DataFrame:
+    '''
+    Create many flag columns in one pass from a list of rules
+
+    Each column used by a rule is factorized once, so list and pattern rules on the same column
+    are checked against its distinct values rather than every row. All flag columns are added
+    to the dataframe in a single assignment.
+
+    Examples
+    --------
+    df.create_flags([
+        {'name': 'is_priority', 'column': 'state', 'isin': ['NY', 'CA']},
+        {'name': 'is_large', 'column': 'amount', 'between': (10_000, None)},
+        {'name': 'is_po_box', 'column': 'address', 'regex': r'p\\.?o\\.? box', 'ignore_case': True},
+        {'name': 'missing_zip', 'column': 'zip', 'isnull': True}
+    ])
+
+    Parameters
+    ----------
+    df: pd.DataFrame
+        Dataframe
+    rules: list
+        Rule dicts with a 'name' for the flag column, the 'column' to check and exactly one of:
+        'isin' (list of values), 'between' ((low, high) tuple, None for an open end, with optional
+        'inclusive'), 'regex' (pattern, with optional 'ignore_case'), 'isnull' or 'notnull'.
+        Set 'negate' to True to invert a rule.
+    output: str, optional
+        'category' for a categorical of the two flag values, 'bool' for True/False or 'object'
+        for plain strings. Default is category.
+    values: tuple, optional
+        Flag values used when the rule matches and when it does not. Default is ('Y', 'N').
+
+    Returns
+    -------
+    df: pd.DataFrame
+        Dataframe with the flag columns added
+    '''
+
+    if output not in ['category', 'bool', 'object']:
+        raise ValueError("output must be one of 'category', 'bool' or 'object'")
+
+    columns = {}
+    lookups = {}
+    flags = {}
+    for rule in rules:
+        name = rule['column']
+        if name not in columns:
+            columns[name] = _FactorizedColumn(df[name])
+
+        flags[rule['name']] = __to_output(__evaluate(rule, columns[name], lookups), output, values, df.index)
+
+    if len(flags) > 0:
+        df[list(flags)] = pd.DataFrame(flags, index=df.index)
+    return df
@@ -1,45 +1,75 @@
 import pandas as pd
 import numpy as np
 import pandas_flavor as pf
-from datetime import datetime, timedelta
-import pydoc
 
+from .dispatch import polars_dispatch
+from .business_calendar import BusinessCalendar, get_calendar
 
-def __business_day_calc(
-    start_date: str,
-    end_date: str
-):
+
+def __to_datetime(s: pd.Series) -> pd.Series:
     '''
-    Function to compute the number of business days
+    Parse a column as datetime in one vectorized pass, falling back to per-value format inference
+    for columns that mix date formats
     '''
-    weekday_friday = 4
-    if start_date.weekday() > weekday_friday:
-        start_date = start_date + timedelta(days=7 - start_date.weekday())
+    if pd.api.types.is_datetime64_any_dtype(s.dtype):
+        return s
+    try:
+        return pd.to_datetime(s)
+    except (ValueError, TypeError):
+        return pd.to_datetime(s, format='mixed')
 
-    if end_date.weekday() > weekday_friday:
-        end_date = end_date - timedelta(days=end_date.weekday()-weekday_friday)
 
-    if start_date > end_date:
-        return 0
+def __to_output(values: np.ndarray, missing: np.ndarray, index: pd.Index) -> pd.Series:
+    '''
+    Build an integer result column, using nullable Int64 only when a date was missing
+    '''
+    if missing.any():
+        return pd.Series(pd.arrays.IntegerArray(values.astype('int64'), missing), index=index)
+    return pd.Series(values.astype('int64'), index=index)
+
+
+def __business_days(
+    start: pd.Series,
+    end: pd.Series,
+    missing: np.ndarray,
+    weekmask: str,
+    calendar: str | BusinessCalendar
+) -> np.ndarray:
+    '''
+    Count business days from start to end inclusive, or 0 when start is after end
+    '''
+    if calendar is not None:
+        counts = np.zeros(len(missing), dtype='int64')
+        counts[~missing] = get_calendar(calendar).business_days_between(start[~missing], end[~missing])
+    else:
+        # Missing dates are replaced with a placeholder so busday_count can run on the whole array
+        start_days = start.to_numpy(dtype='datetime64[ns]').astype('datetime64[D]')
+        end_days = end.to_numpy(dtype='datetime64[ns]').astype('datetime64[D]')
+        start_days[missing] = np.datetime64('1970-01-01')
+        end_days[missing] = np.datetime64('1970-01-01')
 
-    diff_days = (end_date - start_date).days + 1
-    weeks = int(diff_days/7)
-    remainder = end_date.weekday() - start_date.weekday() + 1
+        counts = np.busday_count(start_days, end_days + np.timedelta64(1, 'D'), weekmask=weekmask)
 
-    if remainder != 0 and end_date.weekday() < start_date.weekday():
-        remainder = 5 + remainder   
-    return weeks * 5 + remainder
+    after = np.zeros(len(missing), dtype=bool)
+    after[~missing] = (start.to_numpy()[~missing] > end.to_numpy()[~missing])
+    return np.where(after, 0, counts)
 
 
 @pf.register_dataframe_method
+@polars_dispatch
 def date_diff(
     df: pd.DataFrame,
     start_date_column: str,
     end_date_column: str,
-    calculation: str = 'days'
+    calculation: str = 'days',
+    weekmask: str = '1111100',
+    calendar: str | BusinessCalendar = None
 ) -> pd.DataFrame:
     '''
-    Computes difference between two date columns in business days (calendar and business), months, or years
+    Computes difference between two date columns in days (calendar and business), weeks, months, quarters, years or hours
+
+    Business days count both the start and end date and are 0 when the start is after the end.
+    Rows with a missing start or end date get a missing result.
 
     Examples
     --------
@@ -54,36 +84,53 @@ def date_diff(
     end_date_column: str
         Name of the column containing ending dates
     calculation: str, optional
-       Determines the date differencing calculation to apply. Default is days. Months and years are also options.
+       Determines the date differencing calculation to apply. Default is days. Weeks, months, quarters, years and hours are also options.
+    weekmask: str, optional
+        Seven character mask of working days starting on Monday e.g. '1111110' for a six day week. Default is Monday to Friday.
+    calendar: str | BusinessCalendar, optional
+        Registered calendar name (e.g. 'us_federal') or BusinessCalendar whose holidays and weekmask are used for business days instead of weekmask
     Returns
     -------
     result: pd.Dataframe
         Dataframe appended with date calculation column(s) added
     '''
 
-    start_list = [pd.to_datetime(x) for x in df[start_date_column].tolist()]
-    end_list = [pd.to_datetime(x) for x in df[end_date_column].tolist()]
+    start = __to_datetime(df[start_date_column])
+    end = __to_datetime(df[end_date_column])
+    missing = (start.isna() | end.isna()).to_numpy()
 
-    # Make calculation parameter lowercase 
+    # Make calculation parameter lowercase
     calculation = calculation.lower()
 
+    # Whole days elapsed, floored like timedelta.days
+    elapsed = (end - start).dt.days.fillna(0).to_numpy()
+
     # Day Calculation and Assignment
     if calculation in ['day', 'd', 'days']:
-        calendar_diff_list = [(x - y).days for x, y in zip(end_list, start_list)]
-        business_day_diff_list = [__business_day_calc(x, y) for x, y in zip(start_list, end_list)]
+        df['date_diff_calendar_days'] = __to_output(elapsed, missing, df.index)
+        df['date_diff_business_days'] = __to_output(__business_days(start, end, missing, weekmask, calendar), missing, df.index)
 
-        # Assign day calcylation output to columns
-        df['date_diff_calendar_days'] = calendar_diff_list
-        df['date_diff_business_days'] = business_day_diff_list
+    # Week calculation and assignment
+    elif calculation in ['week', 'w', 'weeks']:
+        df['date_diff_weeks'] = __to_output(elapsed // 7, missing, df.index)
 
     # Month calculation and assignment
     elif calculation in ['month', 'm', 'months']:
-        month_diff_list = [(x.year - y.year) * 12 + x.month - y.month for x, y in zip(end_list, start_list)]
-        df['date_diff_months'] = month_diff_list
+        months = (end.dt.year - start.dt.year) * 12 + end.dt.month - start.dt.month
+        df['date_diff_months'] = __to_output(months.fillna(0).to_numpy(), missing, df.index)
+
+    # Quarter calculation and assignment
+    elif calculation in ['quarter', 'q', 'quarters']:
+        quarters = (end.dt.year - start.dt.year) * 4 + end.dt.quarter - start.dt.quarter
+        df['date_diff_quarters'] = __to_output(quarters.fillna(0).to_numpy(), missing, df.index)
+
     # Year calcuation and assignment
     elif calculation in ['year', 'y', 'years']:
-        year_diff_list = [(x.year - y.year) for x, y in zip(end_list, start_list)]
-        df['date_diff_years'] = year_diff_list
-    return df
+        years = end.dt.year - start.dt.year
+        df['date_diff_years'] = __to_output(years.fillna(0).to_numpy(), missing, df.index)
 
-pydoc.writedoc('date_diff')
+    # Hour calculation and assignment
+    elif calculation in ['hour', 'h', 'hours']:
+        hours = (end - start).dt.total_seconds().fillna(0).to_numpy() // 3600
+        df['date_diff_hours'] = __to_output(hours, missing, df.index)
+    return df
@@ -1,26 +1,72 @@
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
-import pydoc
+from datetime import datetime
+from typing import Iterator
+
+from .business_calendar import BusinessCalendar, get_calendar
+
+__frequencies = ['D', 'B', 'W', 'MS', 'ME', 'QS', 'QE']
+
+def __to_day(value, date_format: str) -> np.datetime64:
+    if isinstance(value, str):
+        value = datetime.strptime(value, date_format)
+    return np.datetime64(pd.Timestamp(value).date(), 'D')
 
 def __date_range_calc(
-    start_date, 
-    end_date, 
-    number_of_days, 
-    date_format = '%Y-%m-%d'
-) -> list:
-    
-    start_date = datetime.strptime(start_date, date_format)
-    end_date = datetime.strptime(end_date, date_format)
-
-    d1 = pd.period_range(start_date, end_date, periods=number_of_days)
-    d1 = sorted(d1)
-    return d1
-
-def __month_output(dl, date_format):
-    date_list = date_list[date_list.day==1]
-    date_list = sorted(date_list)
-    date_list = [x.strftime(date_format) for x in date_list]
-    return date_list
+    start: np.datetime64,
+    end: np.datetime64,
+    anchor: np.datetime64,
+    frequency: str,
+    number_of_days: int
+) -> np.ndarray:
+    '''
+    Generate the dates of a frequency that fall between start and end, stepping from anchor
+    '''
+    if end < start:
+        return np.array([], dtype='datetime64[D]')
+
+    if frequency in ['D', 'B', 'W']:
+        step = 7 if frequency == 'W' else (number_of_days if frequency == 'D' else 1)
+        # Align to the anchor so chunks continue the same sequence
+        offset = -((anchor - start).astype('int64') // step) * step
+        first = anchor + np.timedelta64(offset, 'D') if start > anchor else anchor
+        return np.arange(first, end + np.timedelta64(1, 'D'), step, dtype='datetime64[D]')
+
+    months = np.arange(start.astype('datetime64[M]'), end.astype('datetime64[M]') + 1, dtype='datetime64[M]')
+    if frequency in ['QS', 'QE']:
+        months = months[months.astype('int64') % 3 == (0 if frequency == 'QS' else 2)]
+    if frequency in ['MS', 'QS']:
+        dates = months.astype('datetime64[D]')
+    else:
+        dates = (months + 1).astype('datetime64[D]') - np.timedelta64(1, 'D')
+    return dates[(dates >= start) & (dates <= end)]
+
+def __filter_dates(dates: np.ndarray, frequency: str, remove_weekends: bool, calendar) -> np.ndarray:
+    '''
+    Drop weekends and holidays with array masks
+    '''
+    if calendar is not None:
+        dates = dates[get_calendar(calendar).is_business_day(dates)]
+    elif remove_weekends is True or frequency == 'B':
+        dates = dates[np.is_busday(dates)]
+    return dates
+
+def __format_dates(dates: np.ndarray, output_format: str):
+    if output_format is None:
+        return dates
+    if output_format == '%Y-%m-%d':
+        return np.datetime_as_string(dates, unit='D')
+    return pd.DatetimeIndex(dates).strftime(output_format).to_numpy()
+
+def __iter_dates(start, end, frequency, number_of_days, remove_weekends, calendar, output_format, chunk_days) -> Iterator[np.ndarray]:
+    window_start = start
+    while window_start <= end:
+        window_end = min(window_start + np.timedelta64(chunk_days - 1, 'D'), end)
+        dates = __date_range_calc(window_start, window_end, start, frequency, number_of_days)
+        dates = __filter_dates(dates, frequency, remove_weekends, calendar)
+        if len(dates) > 0:
+            yield __format_dates(dates, output_format)
+        window_start = window_end + np.timedelta64(1, 'D')
 
 def create_date_list(
     start_date: str,
@@ -28,38 +74,67 @@ def create_date_list(
     number_of_days: int = 1,
     date_format: str = "%Y-%m-%d",
     remove_weekends: bool = False,
-    output_months: bool= False
-) -> list:
+    output_months: bool= False,
+    calendar: str | BusinessCalendar = None,
+    frequency: str = 'D',
+    output_format: str = None,
+    iterator: bool = False,
+    chunk_days: int = 100_000
+) -> np.ndarray | Iterator[np.ndarray]:
     """
-    Creates a list of months based on the first day of each month.
+    Creates a sequence of dates between two dates, inclusive
+
+    Examples
+    --------
+    create_date_list('2024-01-01', '2024-12-31', frequency='ME', output_format='%m/%d/%Y')
+
+    for dates in create_date_list('1900-01-01', '2099-12-31', iterator=True):
+        process(dates)
 
     Parameters
     ----------
-    start_date: str
+    start_date: str | datetime
         Starting Date
-    end_date: str
+    end_date: str | datetime
         Ending Date
     number_of_days: int, optional
-        Number of days to increment dates by
+        Number of days to increment dates by for daily frequency
     date_format: str, optional
-        Optional date format. YYYY-MM-DD is the default
+        Format of start_date and end_date when given as strings. YYYY-MM-DD is the default
     remove_weekends: bool, optional
         Determines if dates that fall on a weekend should be removed
     output_months: bool, optional
-        Determines if dates should reflect the start of the month
-    
+        Determines if dates should reflect the start of the month. Same as frequency='MS'
+    calendar: str | BusinessCalendar, optional
+        Registered calendar name (e.g. 'us_federal') or BusinessCalendar used to drop non-business days
+    frequency: str, optional
+        'D' daily, 'B' business daily, 'W' weekly, 'MS'/'ME' month start/end or 'QS'/'QE' quarter start/end. Default is daily
+    output_format: str, optional
+        strftime format to return formatted strings instead of datetime64 values
+    iterator: bool, optional
+        When True, returns an iterator of arrays covering chunk_days days each instead of one array
+    chunk_days: int, optional
+        Number of days covered by each array in iterator mode. Default is 100,000
+
     Returns
     -----------
-    date_list: list
-        Sorted list of dates
+    date_list: np.ndarray | Iterator[np.ndarray]
+        Sorted datetime64[D] array, or array of strings when output_format is given
     """
 
-    date_list = __date_range_calc(start_date, end_date, number_of_days, date_format)
-    
     if output_months == True:
-       date_list = __month_output(date_list, date_format)
-    else:
-        date_list = [ x.strftime(date_format) for x in date_list if remove_weekends==True ]
-    return date_list
+        frequency = 'MS'
+    if frequency not in __frequencies:
+        raise ValueError(f"frequency must be one of {', '.join(__frequencies)}")
+
+    start = __to_day(start_date, date_format)
+    end = __to_day(end_date, date_format)
+
+    date_iterator = __iter_dates(start, end, frequency, number_of_days, remove_weekends, calendar, output_format, chunk_days)
+    if iterator == True:
+        return date_iterator
 
-pydoc.writedoc('create_date_list')
+    chunks = list(date_iterator)
+    if len(chunks) == 0:
+        return __format_dates(np.array([], dtype='datetime64[D]'), output_format)
+    return np.concatenate(chunks)
@@ -0,0 +1,15 @@
+import functools
+
+
+def polars_dispatch(func):
+    '''
+    Route polars dataframes to the polars implementation of the same name, so they are processed
+    natively instead of being converted to pandas
+    '''
+    @functools.wraps(func)
+    def wrapper(df, *args, **kwargs):
+        if type(df).__module__.split('.')[0] == 'polars':
+            from . import polars_backend
+            return getattr(polars_backend, func.__name__)(df, *args, **kwargs)
+        return func(df, *args, **kwargs)
+    return wrapper
@@ -1,20 +1,122 @@
 import pandas as pd
 import numpy as np
 import pandas_flavor as pf
+import pyarrow as pa
+import pyarrow.compute as pc
 from typing import List
-import pydoc
+
+from .dispatch import polars_dispatch
+
+
+def __joiner(separator: str, distinct: bool, max_items: int):
+    '''
+    Build the per-group join used by the pandas path
+    '''
+    def join(values):
+        values = list(values)
+        if distinct is True:
+            values = list(dict.fromkeys(values))
+        if max_items is not None:
+            values = values[:max_items]
+        return separator.join(values)
+    return join
+
+
+def __group_concat_pandas(df, group_column, concat_column, separator, distinct, max_items) -> pd.DataFrame:
+    col_dict = {}
+    for col in df:
+        if (col in concat_column):
+            col_dict[col] = __joiner(separator, distinct, max_items)
+        else:
+            col_dict[col] = 'first'
+
+    return df.groupby(group_column, as_index=False).agg(col_dict)
+
+
+def __join_column(values: pd.Series, codes: np.ndarray, n_groups: int, separator: str, distinct: bool, max_items: int) -> pd.Series:
+    '''
+    Join the values of one column per group. codes must be sorted so each group is contiguous.
+    '''
+    keep = values.notna().to_numpy().copy()
+    if distinct is True:
+        keep &= ~pd.DataFrame({'code': codes, 'value': values.to_numpy()}).duplicated().to_numpy()
+
+    codes = codes[keep]
+    try:
+        arr = pa.array(values[keep], from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        arr = None
+    if arr is not None and pa.types.is_dictionary(arr.type):
+        arr = arr.dictionary_decode()
+    if arr is None or not pa.types.is_string(arr.type):
+        # Numbers read as str() writes them, e.g. 1.0 rather than 1
+        arr = pa.array(values[keep].astype(object).astype(str).tolist(), type=pa.string())
+
+    counts = np.bincount(codes, minlength=n_groups)
+    if max_items is not None:
+        # Position of each value within its group
+        starts = np.cumsum(counts) - counts
+        rank = np.arange(len(codes)) - starts[codes]
+        arr = arr.filter(pa.array(rank < max_items))
+        counts = np.minimum(counts, max_items)
+
+    offsets = np.concatenate([[0], np.cumsum(counts)]).astype('int32')
+    joined = pc.binary_join(pa.ListArray.from_arrays(pa.array(offsets), arr), separator)
+    # Groups where every value was missing get a missing result rather than an empty string
+    joined = pc.if_else(pa.array(counts > 0), joined, pa.scalar(None, pa.string()))
+    return pd.Series(joined.to_pandas(), name=values.name)
+
+
+def __first_valid(values: pd.Series, codes: np.ndarray, n_groups: int) -> pd.Series:
+    '''
+    First non-missing value of each group, as groupby's 'first'. codes must be sorted.
+    '''
+    valid = np.flatnonzero(values.notna().to_numpy())
+    groups, first = np.unique(codes[valid], return_index=True)
+    taken = values.iloc[valid[first]].reset_index(drop=True)
+    if len(groups) == n_groups:
+        return taken
+    return pd.Series(taken.to_numpy(), index=groups, name=values.name).reindex(np.arange(n_groups)).reset_index(drop=True)
+
+
+def __group_concat_arrow(df, group_column, concat_column, separator, distinct, max_items) -> pd.DataFrame:
+    keys = [group_column] if isinstance(group_column, str) else list(group_column)
+
+    # Factorize the keys once; codes follow sorted key order and rows with a missing key get -1
+    codes = df.groupby(keys, sort=True).ngroup().fillna(-1).to_numpy(dtype='int64')
+    n_groups = int(codes.max()) + 1 if len(codes) > 0 else 0
+
+    in_group = codes >= 0
+    order = np.flatnonzero(in_group)[np.argsort(codes[in_group], kind='stable')]
+    ordered = df.iloc[order].reset_index(drop=True)
+    codes = codes[order]
+
+    columns = {}
+    for col in df.columns:
+        if col in concat_column:
+            columns[col] = __join_column(ordered[col], codes, n_groups, separator, distinct, max_items)
+        else:
+            columns[col] = __first_valid(ordered[col], codes, n_groups)
+    return pd.DataFrame(columns)
 
 
 @pf.register_dataframe_method
+@polars_dispatch
 def group_concat(
     df: pd.DataFrame,
     group_column: str | List[str],
     concat_column: str | List[str],
-    delimiter: str = '|'
+    delimiter: str = '|',
+    order_by: str | List[str] = None,
+    distinct: bool = False,
+    max_items: int = None,
+    engine: str = 'arrow'
 ) -> pd.DataFrame:
     '''
     Collapse multiple values across groups into a single row per group
 
+    Columns that are not concatenated keep their first non-missing value in each group.
+
     Parameters
     ----------
     df: pd.DataFrame
@@ -24,21 +126,30 @@ def group_concat(
     concat_column: str | List[str]
         Name of column(s) to collapse. Multiple names must be in a list
     delimiter: str
-        Type of delimiter to use for separation of concat column values   
+        Type of delimiter to use for separation of concat column values
+    order_by: str | List[str], optional
+        Column(s) that set the order of values within each group. Defaults to the row order.
+    distinct: bool, optional
+        When True, repeated values within a group are concatenated once
+    max_items: int, optional
+        Maximum number of values concatenated per group
+    engine: str, optional
+        'arrow' factorizes the groups once and joins values with arrow list kernels, skipping missing values.
+        'pandas' joins each group in Python. Default is arrow.
     Return
     ------
     result: pd.DataFrame
         Summarised dataframe with one row (grouping) and multiple values
     '''
 
-    col_dict = {}
-    for col in df:
-        if (col in concat_column):
-            col_dict[col] = f' {delimiter} '.join
-        else:
-            col_dict[col] = 'first'
-               
-    result = df.groupby(group_column, as_index=False).agg(col_dict)
-    return result
+    if isinstance(concat_column, str):
+        concat_column = [concat_column]
+    if order_by is not None:
+        df = df.sort_values(order_by, kind='stable')
 
-pydoc.writedoc('group_concat')
\ No newline at end of file
+    separator = f' {delimiter} '
+    if engine == 'arrow':
+        return __group_concat_arrow(df, group_column, concat_column, separator, distinct, max_items)
+    if engine == 'pandas':
+        return __group_concat_pandas(df, group_column, concat_column, separator, distinct, max_items)
+    raise ValueError("engine must be 'arrow' or 'pandas'")
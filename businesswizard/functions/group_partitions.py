@@ -0,0 +1,152 @@
+import hashlib
+import os
+import re
+import pandas as pd
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List
+
+
+class GroupPartitions(Mapping):
+    '''
+    Read-only mapping of group key to sub-dataframe that builds each group only when it is accessed
+
+    Group row positions are computed once. Groups whose rows are already contiguous (e.g. a frame
+    sorted by the group columns) are returned as slices, other groups are gathered on access. The
+    most recently used groups are kept in an LRU cache.
+
+    Attributes
+    ----------
+    by: str | list
+        Column(s) the dataframe is grouped by
+    cache_size: int
+        Number of sub-dataframes kept in the cache
+
+    Methods
+    -------
+    to_files: dict
+        Write every group to its own parquet or csv file in parallel
+    '''
+
+    def __init__(self, df: pd.DataFrame, by: str | List[str], cache_size: int = 32):
+        '''
+        Parameters
+        ----------
+        df: pd.DataFrame
+            Dataframe to partition
+        by: str | list
+            Column(s) to group by
+        cache_size: int, optional
+            Number of sub-dataframes kept in the cache. Default is 32.
+        '''
+        self.by = by
+        self.cache_size = cache_size
+        self._df = df
+        # Keys come back sorted, as groupby iterates them
+        self._indices = df.groupby(by, sort=True).indices
+        if isinstance(by, list) and len(by) == 1:
+            # Grouping by a one-column list yields 1-tuple keys when iterated, but scalar indices keys
+            self._indices = {(k,): v for k, v in self._indices.items()}
+        self._cache = OrderedDict()
+
+    def __repr__(self) -> str:
+        return f'GroupPartitions({len(self)} groups by {self.by})'
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __iter__(self) -> Iterator:
+        return iter(self._indices)
+
+    def __contains__(self, key) -> bool:
+        return key in self._indices
+
+    def _build(self, key) -> pd.DataFrame:
+        positions = self._indices[key]
+        start, stop = positions[0], positions[-1] + 1
+        if stop - start == len(positions):
+            return self._df.iloc[start:stop]
+        return self._df.take(positions)
+
+    def __getitem__(self, key) -> pd.DataFrame:
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        frame = self._build(key)
+        if self.cache_size > 0:
+            self._cache[key] = frame
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return frame
+
+    @staticmethod
+    def _file_name(key: Any) -> str:
+        '''
+        File-system safe name for a group key
+        '''
+        parts = key if isinstance(key, tuple) else (key,)
+        return re.sub(r'[^\w\-. ]+', '_', '_'.join(str(p) for p in parts))
+
+    def _file_names(self) -> Dict[Any, str]:
+        '''
+        File-system safe name for every group key. Keys whose names would clash, e.g. 'a/b' and 'a_b'
+        or names differing only in case, get a short hash of the key appended.
+        '''
+        names = {key: self._file_name(key) for key in self._indices}
+        counts = {}
+        for name in names.values():
+            counts[name.lower()] = counts.get(name.lower(), 0) + 1
+        return {
+            key: name if counts[name.lower()] == 1 else f'{name}-{hashlib.sha1(repr(key).encode()).hexdigest()[:8]}'
+            for key, name in names.items()
+        }
+
+    def to_files(
+        self,
+        directory: str,
+        file_format: str = 'parquet',
+        max_workers: int = None,
+        **kwargs
+    ) -> Dict[Any, str]:
+        '''
+        Write every group to its own file in parallel threads
+
+        Each group is built, written and released inside its worker, so at most max_workers
+        groups are held in memory at once and the cache is not used. Every group gets its own
+        file, even when two keys sanitize to the same name.
+
+        Parameters
+        ----------
+        directory: str
+            Output directory, created if it does not exist
+        file_format: str, optional
+            'parquet' or 'csv'. Default is parquet.
+        max_workers: int, optional
+            Number of writer threads. Defaults to the number of cores.
+        **kwargs:
+            Additional options for to_parquet or to_csv
+
+        Returns
+        -------
+        dict
+            Group key to written file path
+        '''
+        if file_format not in ['parquet', 'csv']:
+            raise ValueError("file_format must be 'parquet' or 'csv'")
+        os.makedirs(directory, exist_ok=True)
+        kwargs.setdefault('index', False)
+        names = self._file_names()
+
+        def write(key):
+            path = os.path.join(directory, f'{names[key]}.{file_format}')
+            frame = self._build(key)
+            if file_format == 'parquet':
+                frame.to_parquet(path, **kwargs)
+            else:
+                frame.to_csv(path, **kwargs)
+            return key, path
+
+        with ThreadPoolExecutor(max_workers or os.cpu_count() or 1) as executor:
+            return dict(executor.map(write, self._indices))
@@ -0,0 +1,179 @@
+import importlib
+import math
+import os
+import pickle
+import pandas as pd
+import pandas_flavor as pf
+import pyarrow as pa
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Callable
+
+# Functions that combine rows across the frame and would give wrong results on row partitions
+__group_functions = ['group_concat', 'subset_by_group']
+
+
+def __write_stream(table: pa.Table, sink) -> int:
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.size() if isinstance(sink, pa.MockOutputStream) else sink.tell()
+
+
+def _to_shared(df: pd.DataFrame):
+    '''
+    Write a dataframe to a shared memory block as an Arrow IPC stream. Frames arrow cannot
+    represent (e.g. object columns of mixed types) are pickled into the block instead.
+
+    Returns the block name, the number of bytes written, the encoding and the column dtypes,
+    which arrow does not always round trip (object text comes back as str).
+    '''
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        table = None
+
+    if table is not None:
+        # Measure the stream first so it can be written straight into the block
+        size = __write_stream(table, pa.MockOutputStream())
+        block = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        target = pa.py_buffer(block.buf)
+        __write_stream(table, pa.FixedSizeBufferWriter(target))
+        # The block cannot be closed while arrow still points into it
+        del target
+        encoding = 'arrow'
+    else:
+        payload = pickle.dumps(df, protocol=pickle.HIGHEST_PROTOCOL)
+        size = len(payload)
+        block = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        block.buf[:size] = payload
+        encoding = 'pickle'
+
+    block.close()
+    return block.name, size, encoding, df.dtypes
+
+
+def _from_shared(name: str, size: int, encoding: str, dtypes: pd.Series) -> pd.DataFrame:
+    '''
+    Read a dataframe written by _to_shared with its original dtypes and free its shared memory block
+    '''
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        # One copy out of the block so it can be freed while the frame lives on
+        data = pa.py_buffer(bytes(block.buf[:size]))
+    finally:
+        block.close()
+        block.unlink()
+
+    if encoding == 'pickle':
+        return pickle.loads(data)
+    df = pa.ipc.open_stream(data).read_all().to_pandas()
+    if not df.columns.is_unique:
+        return df
+    for column, dtype in dtypes.items():
+        if df[column].dtype != dtype:
+            values = df[column].astype(dtype)
+            # Arrow nulls are None in object columns, as pyarrow converts them, not NaN
+            df[column] = values.where(df[column].notna(), None) if dtype == object else values
+    return df
+
+
+def _run_partition(name: str, size: int, encoding: str, dtypes: pd.Series, func: Callable, args: tuple, kwargs: dict):
+    '''
+    Worker: read a partition from shared memory, apply the function and write the result back
+    '''
+    df = _from_shared(name, size, encoding, dtypes)
+    return _to_shared(func(df, *args, **kwargs))
+
+
+def _resolve(func: Callable | str) -> Callable:
+    if isinstance(func, str):
+        func = getattr(importlib.import_module(__package__), func)
+    if getattr(func, '__name__', None) in __group_functions:
+        raise ValueError(f'{func.__name__} combines rows across the frame and cannot run on row partitions')
+    return func
+
+
+@pf.register_dataframe_method
+def parallel_apply(
+    df: pd.DataFrame,
+    func: Callable | str,
+    *args,
+    max_workers: int = None,
+    partitions: int = None,
+    min_partition_rows: int = 250_000,
+    **kwargs
+) -> pd.DataFrame:
+    '''
+    Run a row-local function on row partitions of a dataframe in a pool of processes
+
+    The frame is split into contiguous row partitions that travel to the workers and back as
+    Arrow IPC streams in shared memory, so they are not pickled. Results are reassembled in the
+    original row order with the dtypes the function returned. Frames too small to fill two
+    partitions run in the current process on a copy, so in both cases the input frame is left
+    unchanged and the result matches a serial run of the function.
+
+    The function must transform each row independently (add_leading_zero, clean_column_text,
+    create_flag, create_flags, date_diff) and be importable by the workers, so lambdas and
+    functions defined in a notebook cell do not work. On Windows and macOS the calling script
+    needs an if __name__ == '__main__' guard.
+
+    Examples
+    --------
+    df = df.parallel_apply('date_diff', 'opened', 'closed', max_workers=32)
+    df = parallel_apply(df, clean_column_text, ['city', 'street'], change_case='upper')
+
+    Parameters
+    ----------
+    df: pd.DataFrame
+        Dataframe
+    func: Callable | str
+        Function taking the dataframe first and returning a dataframe, or the name of a businesswizard function
+    *args:
+        Arguments after the dataframe
+    max_workers: int, optional
+        Number of processes. Defaults to the number of cores.
+    partitions: int, optional
+        Number of row partitions. Defaults to one per worker, limited so that no partition has fewer than min_partition_rows rows.
+    min_partition_rows: int, optional
+        Smallest partition worth sending to another process. Default is 250,000.
+    **kwargs:
+        Keyword arguments for the function
+
+    Returns
+    -------
+    df: pd.DataFrame
+        Result of the function over every partition, in the original row order
+    '''
+
+    func = _resolve(func)
+    max_workers = max_workers or os.cpu_count() or 1
+    if partitions is None:
+        partitions = min(max_workers, math.ceil(len(df) / min_partition_rows))
+
+    if partitions <= 1 or max_workers <= 1:
+        # Most functions assign columns on the frame they are given
+        return func(df.copy(), *args, **kwargs)
+
+    bounds = [len(df) * i // partitions for i in range(partitions + 1)]
+    blocks = []
+    futures = []
+    try:
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            blocks.append(_to_shared(df.iloc[start:stop]))
+        with ProcessPoolExecutor(min(max_workers, partitions)) as executor:
+            futures = [executor.submit(_run_partition, *block, func, args, kwargs) for block in blocks]
+        # Leaving the pool waits for every partition, so a failure is raised only once all have finished
+        for future in futures:
+            if future.exception() is not None:
+                raise future.exception()
+        results = [_from_shared(*future.result()) for future in futures]
+    finally:
+        # Free input blocks no worker got to and output blocks that were not read back
+        names = [block[0] for block in blocks]
+        names += [f.result()[0] for f in futures if f.done() and not f.cancelled() and f.exception() is None]
+        for name in names:
+            try:
+                shared_memory.SharedMemory(name=name).unlink()
+            except FileNotFoundError:
+                pass
+    return pd.concat(results)
@@ -0,0 +1,185 @@
+import re
+import numpy as np
+import pandas as pd
+from functools import lru_cache
+from typing import Dict, Tuple
+
+
+class MultiPatternReplacer:
+    '''
+    Replace many patterns in a single scan of each string
+
+    All keys are compiled into one regex: literal keys as a character trie, regex keys as named
+    alternatives. Each string is scanned once and every match is replaced by the value of the key
+    that matched. When keys overlap, the leftmost match wins and, for literal keys, the longest.
+
+    Attributes
+    ----------
+    replacements: dict
+        Key to replacement mapping
+    use_regex: bool
+        Keys are regular expressions rather than literal text
+    whole_word: bool
+        Keys only match whole words
+    ignore_case: bool
+        Keys match regardless of case
+    pattern: re.Pattern
+        Combined compiled pattern
+
+    Methods
+    -------
+    replace: str
+        Apply all replacements to one string
+    replace_series: pd.Series
+        Apply all replacements to each unique value of a series
+    '''
+
+    def __init__(
+        self,
+        replacements: Dict[str, str],
+        use_regex: bool = False,
+        whole_word: bool = False,
+        ignore_case: bool = False
+    ):
+        '''
+        Parameters
+        ----------
+        replacements: dict
+            Key to replacement mapping. Replacement values are inserted as-is.
+        use_regex: bool, optional
+            Treat keys as regular expressions. Numbered groups and backreferences inside keys are not supported.
+        whole_word: bool, optional
+            Only match keys that are not part of a longer word
+        ignore_case: bool, optional
+            Match keys regardless of case
+        '''
+        self.replacements = dict(replacements)
+        self.use_regex = use_regex
+        self.whole_word = whole_word
+        self.ignore_case = ignore_case
+
+        keys = [k for k in self.replacements if k != '']
+        if use_regex is True:
+            self._values = [self.replacements[k] for k in keys]
+            body = '|'.join(f'(?P<_{i}>{k})' for i, k in enumerate(keys))
+        else:
+            self._values = {self._fold(k): v for k, v in self.replacements.items() if k != ''}
+            body = self._literal_pattern(keys)
+
+        if whole_word is True:
+            body = rf'(?<!\w)(?:{body})(?!\w)'
+        self.pattern = re.compile(body, re.IGNORECASE if ignore_case else 0) if len(keys) > 0 else None
+
+    @staticmethod
+    def _trie_pattern(node: Dict) -> str:
+        '''
+        Build a regex from a character trie. Optional endings are greedy, so the longest key wins.
+        '''
+        branches = [
+            re.escape(char) + MultiPatternReplacer._trie_pattern(child)
+            for char, child in sorted(node.items()) if char != ''
+        ]
+        if len(branches) == 0:
+            return ''
+
+        pattern = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if '' in node:
+            pattern = '(?:' + pattern + ')?'
+        return pattern
+
+    @staticmethod
+    def _literal_pattern(keys) -> str:
+        trie = {}
+        for key in keys:
+            node = trie
+            for char in key:
+                node = node.setdefault(char, {})
+            node[''] = {}
+        return MultiPatternReplacer._trie_pattern(trie)
+
+    def __repr__(self) -> str:
+        return f'MultiPatternReplacer({len(self.replacements)} patterns, use_regex={self.use_regex}, whole_word={self.whole_word}, ignore_case={self.ignore_case})'
+
+    def _fold(self, text: str) -> str:
+        return text.lower() if self.ignore_case else text
+
+    def _lookup(self, match: re.Match) -> str:
+        if self.use_regex is True:
+            return self._values[int(match.lastgroup[1:])]
+        return self._values[self._fold(match.group(0))]
+
+    def replace(self, text: str) -> str:
+        '''
+        Apply all replacements to one string
+
+        Parameters
+        ----------
+        text: str
+            Text to transform
+
+        Returns
+        -------
+        str
+        '''
+        if self.pattern is None or not isinstance(text, str):
+            return text
+        return self.pattern.sub(self._lookup, text)
+
+    def __call__(self, text: str) -> str:
+        return self.replace(text)
+
+    def replace_series(self, s: pd.Series) -> pd.Series:
+        '''
+        Apply all replacements to a series, scanning each distinct value once
+
+        Parameters
+        ----------
+        s: pd.Series
+            Text column
+
+        Returns
+        -------
+        pd.Series
+        '''
+        codes, uniques = pd.factorize(s, use_na_sentinel=True)
+        replaced = np.array([self.replace(u) for u in uniques] + [None], dtype=object)
+        # Missing values have code -1, which picks the trailing None
+        return pd.Series(replaced[codes], index=s.index, name=s.name).where(codes != -1, s)
+
+
+@lru_cache(maxsize=32)
+def __compile(items: Tuple, use_regex: bool, whole_word: bool, ignore_case: bool) -> MultiPatternReplacer:
+    return MultiPatternReplacer(dict(items), use_regex, whole_word, ignore_case)
+
+
+def compile_replacements(
+    replacements: Dict[str, str],
+    use_regex: bool = False,
+    whole_word: bool = False,
+    ignore_case: bool = False
+) -> MultiPatternReplacer:
+    '''
+    Compile a replacement dictionary into a MultiPatternReplacer, reusing the compiled pattern
+    when the same dictionary and options were compiled before
+
+    Examples
+    --------
+    replacer = compile_replacements({'street': 'st', 'avenue': 'ave'}, whole_word=True, ignore_case=True)
+    replacer.replace('12 Main Street')
+
+    Parameters
+    ----------
+    replacements: dict
+        Key to replacement mapping
+    use_regex: bool, optional
+        Treat keys as regular expressions
+    whole_word: bool, optional
+        Only match keys that are not part of a longer word
+    ignore_case: bool, optional
+        Match keys regardless of case
+
+    Returns
+    -------
+    MultiPatternReplacer
+    '''
+    return __compile(tuple(replacements.items()), use_regex, whole_word, ignore_case)
@@ -0,0 +1,354 @@
+import inspect
+import os
+import time
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List
+
+from .add_leading_zero import add_leading_zero
+from .clean_column_text import clean_column_text
+from .create_flag import create_flag
+from .create_flags import create_flags
+from .date_diff import date_diff
+from .group_concat import group_concat
+
+__date_diff_columns = {
+    'days': ['date_diff_calendar_days', 'date_diff_business_days'],
+    'weeks': ['date_diff_weeks'],
+    'months': ['date_diff_months'],
+    'quarters': ['date_diff_quarters'],
+    'years': ['date_diff_years'],
+    'hours': ['date_diff_hours']
+}
+
+
+def _as_list(columns) -> List[str]:
+    return [columns] if isinstance(columns, str) else list(columns)
+
+
+def _date_diff_columns(calculation: str) -> List[str]:
+    '''
+    Names of the columns date_diff writes for a calculation
+    '''
+    for unit, columns in __date_diff_columns.items():
+        if calculation.lower() in [unit, unit[:-1], unit[0]]:
+            return columns
+    return []
+
+
+class PipelineStep:
+    '''
+    One recorded function call of a Pipeline
+
+    Attributes
+    ----------
+    name: str
+        Name of the function
+    func: Callable
+        Function taking the dataframe as its first argument
+    kwargs: dict
+        Arguments of the call, excluding the dataframe
+    reads: list
+        Columns the step reads, or None when it may read any column
+    writes: list
+        Columns the step creates or overwrites, or None when unknown, in which case the step is always kept
+    column_arg: str
+        For column-local steps, the argument holding the columns they transform in place.
+        Each of those columns depends only on itself, so the step can run one column at a time.
+    args: tuple
+        Positional arguments after the dataframe, for functions recorded with Pipeline.apply
+    '''
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable,
+        kwargs: Dict,
+        reads: List[str] = None,
+        writes: List[str] = None,
+        column_arg: str = None,
+        args: tuple = ()
+    ):
+        self.name = name
+        self.func = func
+        self.kwargs = kwargs
+        self.reads = reads
+        self.writes = writes
+        self.column_arg = column_arg
+        self.args = args
+
+    def run(self, df, **overrides):
+        '''
+        Call the function on a dataframe, optionally overriding recorded arguments
+        '''
+        return self.func(df, *self.args, **{**self.kwargs, **overrides})
+
+    @property
+    def column_local(self) -> bool:
+        return self.column_arg is not None
+
+    def for_columns(self, columns: List[str]) -> 'PipelineStep':
+        '''
+        Copy of a column-local step restricted to some of its columns
+        '''
+        kwargs = {**self.kwargs, self.column_arg: list(columns)}
+        return PipelineStep(self.name, self.func, kwargs, list(columns), list(columns), self.column_arg)
+
+    def __repr__(self) -> str:
+        target = self.kwargs.get(self.column_arg) if self.column_local else self.writes
+        return f'{self.name}({target})'
+
+
+class Pipeline:
+    '''
+    Record function calls as a plan and run them in one go
+
+    At run time the plan is optimized before any data is touched: steps whose output is never
+    used are skipped, only the input columns the remaining steps need are copied, and runs of
+    column-local steps (add_leading_zero, clean_column_text) are fused so each column goes
+    through all of them in one pass. The source dataframe is not modified.
+
+    Examples
+    --------
+    pipeline = (
+        Pipeline()
+        .add_leading_zero('zip', 5)
+        .clean_column_text(['city', 'street'], change_case='upper')
+        .create_flag('state', ['NY', 'NJ'], 'tri_state')
+        .date_diff('opened', 'closed')
+        .select(['zip', 'city', 'tri_state', 'date_diff_business_days'])
+    )
+    result = pipeline.run(df)
+    pipeline.timings
+
+    Attributes
+    ----------
+    steps: list
+        Recorded PipelineStep objects
+    timings: pd.DataFrame
+        Seconds spent in each step by the last run
+
+    Methods
+    -------
+    run: pd.DataFrame
+        Execute the plan on a dataframe
+    explain: str
+        Describe the optimized plan for a set of columns
+    '''
+
+    def __init__(self):
+        self.steps: List[PipelineStep] = []
+        self.timings = pd.DataFrame(columns=['step', 'seconds'])
+        self._select = None
+
+    def __repr__(self) -> str:
+        return f'Pipeline({" -> ".join(repr(s) for s in self.steps)})'
+
+    def _record(self, func: Callable, args, kwargs, reads=None, writes=None, column_arg=None) -> 'Pipeline':
+        bound = inspect.signature(func).bind(None, *args, **kwargs)
+        call = dict(list(bound.arguments.items())[1:])
+        self.steps.append(PipelineStep(func.__name__, func, call, reads, writes, column_arg))
+        return self
+
+    def add_leading_zero(self, column_name, *args, **kwargs) -> 'Pipeline':
+        return self._record(add_leading_zero, (_as_list(column_name),) + args, kwargs, column_arg='column_name')
+
+    def clean_column_text(self, columns_to_transform, *args, **kwargs) -> 'Pipeline':
+        return self._record(clean_column_text, (_as_list(columns_to_transform),) + args, kwargs, column_arg='columns_to_transform')
+
+    def create_flag(self, lookup_column: str, lookup_list: List, flag_column_name: str = 'created_flag_column', *args, **kwargs) -> 'Pipeline':
+        return self._record(
+            create_flag, (lookup_column, lookup_list, flag_column_name) + args, kwargs,
+            reads=[lookup_column], writes=[flag_column_name or 'created_flag_column']
+        )
+
+    def create_flags(self, rules: List[Dict], *args, **kwargs) -> 'Pipeline':
+        return self._record(
+            create_flags, (rules,) + args, kwargs,
+            reads=list(dict.fromkeys(r['column'] for r in rules)), writes=[r['name'] for r in rules]
+        )
+
+    def date_diff(self, start_date_column: str, end_date_column: str, calculation: str = 'days', *args, **kwargs) -> 'Pipeline':
+        return self._record(
+            date_diff, (start_date_column, end_date_column, calculation) + args, kwargs,
+            reads=[start_date_column, end_date_column], writes=_date_diff_columns(calculation)
+        )
+
+    def group_concat(self, *args, **kwargs) -> 'Pipeline':
+        # Changes the rows of the frame, so every column before it is needed
+        return self._record(group_concat, args, kwargs)
+
+    def apply(self, func: Callable, *args, reads: List[str] = None, writes: List[str] = None, **kwargs) -> 'Pipeline':
+        '''
+        Record any function that takes the dataframe first and returns a dataframe
+
+        Parameters
+        ----------
+        func: Callable
+            Function to call
+        *args:
+            Arguments after the dataframe
+        reads: list, optional
+            Columns the function reads. When omitted every column is kept for it.
+        writes: list, optional
+            Columns the function creates or overwrites. When omitted the step is never skipped.
+        **kwargs:
+            Keyword arguments for the function
+
+        Returns
+        -------
+        Pipeline
+        '''
+        self.steps.append(PipelineStep(getattr(func, '__name__', 'apply'), func, kwargs, reads, writes, args=args))
+        return self
+
+    def select(self, columns: str | List[str]) -> 'Pipeline':
+        '''
+        Set the output columns. Steps and input columns that do not contribute to them are skipped.
+
+        Parameters
+        ----------
+        columns: str | list
+            Columns of the result
+
+        Returns
+        -------
+        Pipeline
+        '''
+        self._select = _as_list(columns)
+        return self
+
+    def _plan(self, columns: List[str]):
+        '''
+        Walk the steps backwards from the output columns, keeping only steps that produce a
+        needed column and narrowing column-local steps to their needed columns
+
+        Returns the kept steps in run order and the input columns they need, or None for all
+        '''
+        needed = set(columns) if columns is not None else None
+        plan = []
+        for step in reversed(self.steps):
+            if needed is None:
+                plan.append(step)
+                continue
+
+            if step.column_local:
+                kept = [c for c in step.kwargs[step.column_arg] if c in needed]
+                if len(kept) > 0:
+                    plan.append(step.for_columns(kept))
+                continue
+
+            if step.writes is not None and len(step.writes) > 0 and not needed.intersection(step.writes):
+                continue
+            plan.append(step)
+            if step.reads is None:
+                # The step may read anything, so every column before it is needed
+                needed = None
+            else:
+                # Columns the step creates are not needed from the steps before it
+                needed.difference_update(step.writes or [])
+                needed.update(step.reads)
+
+        return list(reversed(plan)), needed
+
+    def _stages(self, plan: List[PipelineStep]) -> List[List[PipelineStep]]:
+        '''
+        Group consecutive column-local steps into fused stages
+        '''
+        stages = []
+        for step in plan:
+            if step.column_local and len(stages) > 0 and stages[-1][0].column_local:
+                stages[-1].append(step)
+            else:
+                stages.append([step])
+        return stages
+
+    def explain(self, columns: List[str] = None) -> str:
+        '''
+        Describe the optimized plan
+
+        Parameters
+        ----------
+        columns: list, optional
+            Output columns. Defaults to the columns set with select, or every column.
+
+        Returns
+        -------
+        str
+        '''
+        plan, needed = self._plan(columns if columns is not None else self._select)
+        lines = [f'columns used: {"all" if needed is None else sorted(needed)}']
+        for stage in self._stages(plan):
+            if stage[0].column_local:
+                lines.append('fused per column: ' + ' -> '.join(repr(s) for s in stage))
+            else:
+                lines.append(repr(stage[0]))
+        skipped = len(self.steps) - len(plan)
+        if skipped > 0:
+            lines.append(f'skipped steps: {skipped}')
+        return '\n'.join(lines)
+
+    def _run_fused(self, work: pd.DataFrame, stage: List[PipelineStep], seconds: Dict[str, float], max_workers: int) -> pd.DataFrame:
+        columns = list(dict.fromkeys(c for step in stage for c in step.kwargs[step.column_arg]))
+
+        def run_column(c):
+            frame = work[[c]].copy()
+            elapsed = []
+            for step in stage:
+                if c in step.kwargs[step.column_arg]:
+                    start = time.perf_counter()
+                    frame = step.run(frame, **{step.column_arg: [c]})
+                    elapsed.append((step, time.perf_counter() - start))
+            return frame[c], elapsed
+
+        with ThreadPoolExecutor(max_workers or min(len(columns), os.cpu_count() or 1)) as executor:
+            results = list(executor.map(run_column, columns))
+
+        for (s, elapsed), c in zip(results, columns):
+            for step, t in elapsed:
+                seconds[id(step)] += t
+        work[columns] = pd.concat([s for s, _ in results], axis=1)
+        return work
+
+    def run(self, df: pd.DataFrame, max_workers: int = None) -> pd.DataFrame:
+        '''
+        Execute the plan
+
+        Parameters
+        ----------
+        df: pd.DataFrame
+            Source dataframe, which is not modified
+        max_workers: int, optional
+            Number of threads for fused column stages. Defaults to one per column up to the number of cores.
+
+        Returns
+        -------
+        df: pd.DataFrame
+            Result of all steps, limited to the selected columns when select was used
+        '''
+        plan, needed = self._plan(self._select)
+        seconds = {id(step): 0.0 for step in plan}
+
+        if not isinstance(df, pd.DataFrame):
+            # Other frame types (e.g. polars) run step by step through their own backend
+            work = df if needed is None else df.select([c for c in df.columns if c in needed])
+            for step in plan:
+                start = time.perf_counter()
+                work = step.run(work)
+                seconds[id(step)] = time.perf_counter() - start
+        else:
+            # One copy of just the input columns the plan uses
+            work = df.copy() if needed is None else df[[c for c in df.columns if c in needed]].copy()
+            for stage in self._stages(plan):
+                if stage[0].column_local:
+                    work = self._run_fused(work, stage, seconds, max_workers)
+                else:
+                    start = time.perf_counter()
+                    work = stage[0].run(work)
+                    seconds[id(stage[0])] = time.perf_counter() - start
+
+        self.timings = pd.DataFrame({'step': [repr(s) for s in plan], 'seconds': [seconds[id(s)] for s in plan]})
+
+        if self._select is not None:
+            work = work[self._select] if isinstance(work, pd.DataFrame) else work.select(self._select)
+        return work
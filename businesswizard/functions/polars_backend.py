@@ -0,0 +1,340 @@
+import polars as pl
+from typing import Dict, List, Tuple
+
+from .business_calendar import BusinessCalendar, get_calendar
+from .pattern_replacer import compile_replacements
+
+__special_characters = '[^A-Za-z]+'
+
+__case_expressions = {
+    'upper': lambda e: e.str.to_uppercase(),
+    'lower': lambda e: e.str.to_lowercase(),
+    'proper': lambda e: e.str.to_titlecase()
+}
+
+
+def __as_list(columns: str | List[str]) -> List[str]:
+    return [columns] if isinstance(columns, str) else list(columns)
+
+
+def __check_engine(engine: str) -> None:
+    '''
+    The engine option picks a pandas code path; polars frames always run natively
+    '''
+    if engine not in ['arrow', 'pandas']:
+        raise ValueError("engine must be 'arrow' or 'pandas'")
+
+
+def __as_text(df: pl.DataFrame, column: str) -> pl.Expr:
+    '''
+    Cast a column to text the way str() writes its values, as the pandas version does
+    '''
+    if df.schema[column] == pl.Boolean:
+        # Without an otherwise, missing values stay missing
+        return pl.when(pl.col(column)).then(pl.lit('True')).when(~pl.col(column)).then(pl.lit('False'))
+
+    text = pl.col(column).cast(pl.String)
+    if df.schema[column].is_float():
+        # polars spells very small, very large and non-finite floats differently (0.00001, 1e16, NaN),
+        # so those few distinct values are respelled as python does
+        values = df.get_column(column).drop_nulls().unique()
+        odd = values.filter(
+            values.is_nan() | values.is_infinite() | (values.abs() >= 1e16) | ((values.abs() < 1e-4) & (values != 0))
+        )
+        if len(odd) > 0:
+            text = text.replace(dict(zip(odd.cast(pl.String).to_list(), [str(v) for v in odd.to_list()])))
+    return text
+
+
+def add_leading_zero(df: pl.DataFrame, column_name: str | List[str], character_length: int = 10) -> pl.DataFrame:
+    '''
+    Polars version of add_leading_zero. Missing values stay missing.
+    '''
+    return df.with_columns([
+        __as_text(df, c).str.zfill(character_length).alias(c) for c in __as_list(column_name)
+    ])
+
+
+def __replace_expression(
+    df: pl.DataFrame,
+    expr: pl.Expr,
+    transformations_dictionary: Dict[str, str],
+    use_regex: bool,
+    whole_word: bool,
+    ignore_case: bool
+) -> pl.Expr:
+    if use_regex is True or whole_word is True:
+        # Run the compiled patterns once per distinct value, then map every row with a hash lookup
+        replacer = compile_replacements(transformations_dictionary, use_regex, whole_word, ignore_case)
+        uniques = df.select(expr.unique()).to_series().drop_nulls().to_list()
+        return expr.replace({u: replacer.replace(u) for u in uniques})
+
+    if ignore_case is True:
+        lowered = {k.lower(): v for k, v in transformations_dictionary.items()}
+        lower = expr.str.to_lowercase()
+        return pl.when(lower.is_in(list(lowered))).then(lower.replace(lowered)).otherwise(expr)
+    return expr.replace(transformations_dictionary)
+
+
+def clean_column_text(
+    df: pl.DataFrame,
+    columns_to_transform: str | List[str],
+    transformations_dictionary: Dict[str, str] = None,
+    remove_special_characters: bool = False,
+    use_regex: bool = False,
+    change_case: str = None,
+    whole_word: bool = False,
+    ignore_case: bool = False,
+    engine: str = 'arrow',
+    max_workers: int = None
+) -> pl.DataFrame:
+    '''
+    Polars version of clean_column_text. Every column is cleaned by one expression chain and
+    polars evaluates the columns in parallel, so engine and max_workers are accepted for
+    compatibility and otherwise ignored.
+    '''
+    __check_engine(engine)
+    if change_case is not None and change_case not in __case_expressions:
+        raise ValueError("change_case must be one of 'lower', 'upper' or 'proper'")
+
+    expressions = []
+    for c in __as_list(columns_to_transform):
+        expr = __as_text(df, c)
+        if remove_special_characters is True:
+            expr = expr.str.replace_all(__special_characters, '')
+        if change_case is not None:
+            expr = __case_expressions[change_case](expr)
+        if transformations_dictionary is not None:
+            # Replacement of distinct values needs the text as it is after the earlier steps
+            expr = __replace_expression(df, expr, transformations_dictionary, use_regex, whole_word, ignore_case)
+        expressions.append(expr.str.strip_chars().alias(c))
+    return df.with_columns(expressions)
+
+
+def __rule_expression(rule: Dict) -> pl.Expr:
+    col = pl.col(rule['column'])
+
+    if 'isin' in rule:
+        lookup = [v for v in rule['isin'] if v is not None and v == v]
+        # Missing values match a lookup that holds None or NaN, as Series.isin does
+        missing = len(lookup) < len(rule['isin'])
+        expr = pl.when(col.is_null()).then(pl.lit(missing)).otherwise(col.is_in(lookup))
+    elif 'regex' in rule:
+        pattern = rule['regex']
+        if rule.get('ignore_case', False) is True:
+            pattern = '(?i)' + pattern
+        expr = col.cast(pl.String).str.contains(pattern)
+    elif 'between' in rule:
+        low, high = rule['between']
+        inclusive = rule.get('inclusive', 'both')
+        expr = col.is_not_null()
+        if low is not None:
+            expr = expr & ((col >= low) if inclusive in ['both', 'left'] else (col > low))
+        if high is not None:
+            expr = expr & ((col <= high) if inclusive in ['both', 'right'] else (col < high))
+    elif 'isnull' in rule:
+        expr = col.is_null() if rule['isnull'] else col.is_not_null()
+    elif 'notnull' in rule:
+        expr = col.is_not_null() if rule['notnull'] else col.is_null()
+    else:
+        raise ValueError(f"Each rule needs one of isin, between, regex, isnull, notnull: {rule}")
+
+    expr = expr.fill_null(False)
+    if rule.get('negate', False) is True:
+        expr = ~expr
+    return expr
+
+
+def create_flags(
+    df: pl.DataFrame,
+    rules: List[Dict],
+    output: str = 'category',
+    values: Tuple[str, str] = ('Y', 'N')
+) -> pl.DataFrame:
+    '''
+    Polars version of create_flags. 'category' output is a two-value Enum.
+    '''
+    if output not in ['category', 'bool', 'object']:
+        raise ValueError("output must be one of 'category', 'bool' or 'object'")
+
+    expressions = []
+    for rule in rules:
+        expr = __rule_expression(rule)
+        if output == 'category':
+            expr = pl.when(expr).then(pl.lit(values[0])).otherwise(pl.lit(values[1])).cast(pl.Enum(list(values)))
+        elif output == 'object':
+            expr = pl.when(expr).then(pl.lit(values[0])).otherwise(pl.lit(values[1]))
+        expressions.append(expr.alias(rule['name']))
+    return df.with_columns(expressions)
+
+
+def create_flag(
+    df: pl.DataFrame,
+    lookup_column: str,
+    lookup_list: List[str],
+    flag_column_name: str = 'created_flag_column',
+    value_in_flag_mapping: str = 'Y',
+    value_not_in_flag_mapping: str = 'N'
+) -> pl.DataFrame:
+    '''
+    Polars version of create_flag
+    '''
+    if flag_column_name is None:
+        flag_column_name = 'created_flag_column'
+    rule = {'name': flag_column_name, 'column': lookup_column, 'isin': lookup_list}
+    return create_flags(df, [rule], output='object', values=(value_in_flag_mapping, value_not_in_flag_mapping))
+
+
+def __to_datetime(df: pl.DataFrame, column: str) -> pl.Expr:
+    dtype = df.schema[column]
+    if dtype == pl.String:
+        return pl.col(column).str.to_datetime()
+    if dtype == pl.Date:
+        return pl.col(column).cast(pl.Datetime)
+    return pl.col(column)
+
+
+def date_diff(
+    df: pl.DataFrame,
+    start_date_column: str,
+    end_date_column: str,
+    calculation: str = 'days',
+    weekmask: str = '1111100',
+    calendar: str | BusinessCalendar = None
+) -> pl.DataFrame:
+    '''
+    Polars version of date_diff. Business days use polars' business_day_count with the weekmask,
+    or the holidays and weekmask of a registered calendar.
+    '''
+    start = __to_datetime(df, start_date_column)
+    end = __to_datetime(df, end_date_column)
+    # Floor to whole units like timedelta.days; integer floor division in polars rounds down
+    elapsed = (end - start).dt.total_microseconds()
+    calculation = calculation.lower()
+
+    if calculation in ['day', 'd', 'days']:
+        holidays = []
+        if calendar is not None:
+            calendar = get_calendar(calendar)
+            weekmask = calendar.weekmask
+            holidays = calendar.holidays.tolist()
+        # business_day_count excludes the end date, so count up to the day after it
+        business = pl.business_day_count(
+            start.dt.date(),
+            end.dt.date().dt.offset_by('1d'),
+            week_mask=[c == '1' for c in weekmask],
+            holidays=holidays
+        )
+        return df.with_columns(
+            (elapsed // 86_400_000_000).alias('date_diff_calendar_days'),
+            pl.when(start > end).then(0).otherwise(business).cast(pl.Int64).alias('date_diff_business_days')
+        )
+    if calculation in ['week', 'w', 'weeks']:
+        return df.with_columns((elapsed // (7 * 86_400_000_000)).alias('date_diff_weeks'))
+    if calculation in ['month', 'm', 'months']:
+        months = (end.dt.year() - start.dt.year()) * 12 + end.dt.month().cast(pl.Int64) - start.dt.month().cast(pl.Int64)
+        return df.with_columns(months.cast(pl.Int64).alias('date_diff_months'))
+    if calculation in ['quarter', 'q', 'quarters']:
+        quarters = (end.dt.year() - start.dt.year()) * 4 + end.dt.quarter().cast(pl.Int64) - start.dt.quarter().cast(pl.Int64)
+        return df.with_columns(quarters.cast(pl.Int64).alias('date_diff_quarters'))
+    if calculation in ['year', 'y', 'years']:
+        return df.with_columns((end.dt.year() - start.dt.year()).cast(pl.Int64).alias('date_diff_years'))
+    if calculation in ['hour', 'h', 'hours']:
+        return df.with_columns((elapsed // 3_600_000_000).alias('date_diff_hours'))
+    return df
+
+
+def group_concat(
+    df: pl.DataFrame,
+    group_column: str | List[str],
+    concat_column: str | List[str],
+    delimiter: str = '|',
+    order_by: str | List[str] = None,
+    distinct: bool = False,
+    max_items: int = None,
+    engine: str = 'arrow'
+) -> pl.DataFrame:
+    '''
+    Polars version of group_concat. Missing values are skipped and groups are sorted by key.
+    engine is accepted for compatibility and otherwise ignored.
+    '''
+    __check_engine(engine)
+    keys = __as_list(group_column)
+    concat_column = __as_list(concat_column)
+
+    df = df.filter(pl.all_horizontal(pl.col(keys).is_not_null()))
+    if order_by is not None:
+        df = df.sort(order_by, nulls_last=True, maintain_order=True)
+
+    aggregations = []
+    for c in df.columns:
+        if c in keys:
+            continue
+        if c in concat_column:
+            values = __as_text(df, c).drop_nulls()
+            if distinct is True:
+                values = values.unique(maintain_order=True)
+            if max_items is not None:
+                values = values.head(max_items)
+            joined = pl.when(values.len() > 0).then(values.str.join(f' {delimiter} ')).otherwise(None)
+            aggregations.append(joined.alias(c))
+        else:
+            aggregations.append(pl.col(c).drop_nulls().first().alias(c))
+
+    result = df.group_by(keys, maintain_order=False).agg(aggregations)
+    return result.sort(keys).select(df.columns)
+
+
+def subset_by_group(df: pl.DataFrame, column_name: List[str] | str, lazy: bool = False, cache_size: int = 32) -> dict:
+    '''
+    Polars version of subset_by_group. Keys are sorted and rows with a missing key are dropped,
+    as pandas groupby does. polars partitions every group in one pass, so lazy and cache_size are
+    accepted for compatibility and a dict is always returned.
+    '''
+    partitions = df.partition_by(column_name, as_dict=True, maintain_order=True)
+    if isinstance(column_name, str):
+        partitions = {key[0]: frame for key, frame in partitions.items()}
+    partitions = {
+        key: frame for key, frame in partitions.items()
+        if not any(k is None for k in (key if isinstance(key, tuple) else (key,)))
+    }
+    return dict(sorted(partitions.items()))
+
+
+@pl.api.register_dataframe_namespace('bw')
+class BusinessWizardFrame:
+    '''
+    businesswizard functions on polars dataframes, available as df.bw
+
+    The namespace is registered when this module loads: on import of businesswizard when polars is
+    already imported, otherwise on the first polars frame passed to a businesswizard function or on
+    import businesswizard.functions.polars_backend.
+
+    Examples
+    --------
+    df.bw.group_concat('customer_id', 'order_id')
+    '''
+
+    def __init__(self, df: pl.DataFrame):
+        self._df = df
+
+    def add_leading_zero(self, *args, **kwargs) -> pl.DataFrame:
+        return add_leading_zero(self._df, *args, **kwargs)
+
+    def clean_column_text(self, *args, **kwargs) -> pl.DataFrame:
+        return clean_column_text(self._df, *args, **kwargs)
+
+    def create_flag(self, *args, **kwargs) -> pl.DataFrame:
+        return create_flag(self._df, *args, **kwargs)
+
+    def create_flags(self, *args, **kwargs) -> pl.DataFrame:
+        return create_flags(self._df, *args, **kwargs)
+
+    def date_diff(self, *args, **kwargs) -> pl.DataFrame:
+        return date_diff(self._df, *args, **kwargs)
+
+    def group_concat(self, *args, **kwargs) -> pl.DataFrame:
+        return group_concat(self._df, *args, **kwargs)
+
+    def subset_by_group(self, *args, **kwargs) -> dict:
+        return subset_by_group(self._df, *args, **kwargs)
@@ -0,0 +1,309 @@
+import os
+import shutil
+import tempfile
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from fnmatch import fnmatch
+from typing import Iterator, List
+
+from .pipeline import Pipeline, PipelineStep, _as_list
+
+__csv_patterns = ['*.csv', '*.csv.gz', '*.csv.zip', '*.tsv', '*.tsv.gz']
+
+# Steps that need every row of a group at once; all other steps are applied batch by batch
+__group_steps = ['group_concat']
+
+
+def __source_format(paths: List[str]) -> str:
+    if all(any(fnmatch(p.lower(), pattern) for pattern in __csv_patterns) for p in paths):
+        return 'csv'
+    return 'parquet'
+
+
+def _read_batches(source: str | List[str], source_format: str, batch_size: int, columns: set) -> Iterator[pd.DataFrame]:
+    '''
+    Stream the source as dataframes of at most batch_size rows, reading only the needed columns
+    '''
+    paths = _as_list(source)
+    if source_format is None:
+        source_format = __source_format(paths)
+
+    if source_format == 'parquet':
+        dataset = ds.dataset(paths if len(paths) > 1 else paths[0], format='parquet', partitioning='hive')
+        names = [c for c in dataset.schema.names if columns is None or c in columns]
+        for batch in dataset.to_batches(columns=names, batch_size=batch_size):
+            if batch.num_rows > 0:
+                yield batch.to_pandas()
+    elif source_format == 'csv':
+        # Imported here so parquet streams do not load the file readers
+        from ..filewizard.csv_batches import iter_csv_batches
+        for batch in iter_csv_batches(paths, batch_size=batch_size, output='arrow'):
+            table = batch.data if columns is None else batch.data.select([c for c in batch.data.column_names if c in columns])
+            if len(table) > 0:
+                yield table.to_pandas()
+    else:
+        raise ValueError("source_format must be 'parquet' or 'csv'")
+
+
+def _partition_of(df: pd.DataFrame, keys: List[str], partitions: int) -> np.ndarray:
+    '''
+    Hash partition of each row by its key values. Batches can hold the same key under different
+    dtypes (an int column turns float when a batch has a null, a bool column object), so numeric
+    keys are hashed as float64 and missing values hash the same whatever their column type.
+    '''
+    combined = np.zeros(len(df), dtype='uint64')
+    for key in keys:
+        column = df[key]
+        if pd.api.types.is_bool_dtype(column) or pd.api.types.is_numeric_dtype(column) or (
+            column.dtype == object
+            and pd.api.types.infer_dtype(column, skipna=True) in ['boolean', 'integer', 'floating', 'mixed-integer-float', 'empty']
+        ):
+            column = column.astype('float64')
+        hashed = np.where(column.isna().to_numpy(), np.uint64(0), pd.util.hash_pandas_object(column, index=False).to_numpy())
+        combined = combined * np.uint64(1_000_003) ^ hashed
+    return combined % partitions
+
+
+def _segments(plan: List[PipelineStep]) -> List[tuple]:
+    '''
+    Split the plan into (batch steps, group step) pairs. The group step of the last pair may be None.
+    '''
+    segments = []
+    current = []
+    for step in plan:
+        if step.name in __group_steps:
+            segments.append((current, step))
+            current = []
+        else:
+            current.append(step)
+    segments.append((current, None))
+    return segments
+
+
+class StreamingExecutor:
+    '''
+    Run a Pipeline over a parquet dataset or csv files that do not fit in memory
+
+    Row-local steps (add_leading_zero, clean_column_text, create_flag, create_flags, date_diff and
+    steps recorded with Pipeline.apply) run on one batch at a time, and each result batch is written
+    to the output parquet dataset before the next is read. A group-level step (group_concat) first
+    hash-partitions the rows by its group columns into temporary parquet files, so that every row of
+    a group lands in the same partition, then runs on one partition at a time. Memory use is
+    bounded by the batch size, or by the size of one partition for group-level steps.
+
+    Groups are sorted by key within each partition, not across the output dataset.
+
+    Examples
+    --------
+    pipeline = (
+        Pipeline()
+        .add_leading_zero('zip', 5)
+        .date_diff('opened', 'closed')
+        .group_concat('customer_id', 'order_id')
+    )
+    executor = StreamingExecutor(pipeline, batch_size=500_000, partitions=128)
+    executor.run('data/orders', 'data/orders_by_customer')
+
+    Attributes
+    ----------
+    pipeline: Pipeline
+        Steps to apply
+    batch_size: int
+        Number of rows read per batch
+    partitions: int
+        Number of hash partitions used for group-level steps
+    rows_read: int
+        Rows read from the source by the last run
+    rows_written: int
+        Rows written to the output by the last run
+
+    Methods
+    -------
+    run: str
+        Stream the source through the pipeline into a parquet dataset
+    iter_batches: Iterator[pd.DataFrame]
+        Stream the source through the pipeline without writing it
+    '''
+
+    def __init__(
+        self,
+        pipeline: Pipeline,
+        batch_size: int = 100_000,
+        partitions: int = 64,
+        spill_directory: str = None,
+        max_workers: int = None
+    ):
+        '''
+        Parameters
+        ----------
+        pipeline: Pipeline
+            Steps to apply. select is applied to the output and its columns limit what is read.
+        batch_size: int, optional
+            Number of rows read per batch. Default is 100,000.
+        partitions: int, optional
+            Number of hash partitions for group-level steps. Raise it when a partition does not fit in memory. Default is 64.
+        spill_directory: str, optional
+            Directory for temporary partition files. Defaults to the system temp directory.
+        max_workers: int, optional
+            Number of threads for fused column steps within a batch
+        '''
+        self.pipeline = pipeline
+        self.batch_size = batch_size
+        self.partitions = partitions
+        self.spill_directory = spill_directory
+        self.max_workers = max_workers
+        self.rows_read = 0
+        self.rows_written = 0
+
+    def __repr__(self) -> str:
+        return f'StreamingExecutor({self.pipeline}, batch_size={self.batch_size}, partitions={self.partitions})'
+
+    def _run_steps(self, df: pd.DataFrame, steps: List[PipelineStep]) -> pd.DataFrame:
+        if len(steps) == 0:
+            return df
+        segment = Pipeline()
+        segment.steps = steps
+        return segment.run(df, max_workers=self.max_workers)
+
+    def _apply(self, stream: Iterator[pd.DataFrame], steps: List[PipelineStep]) -> Iterator[pd.DataFrame]:
+        for df in stream:
+            yield self._run_steps(df, steps)
+
+    def _spill(self, stream: Iterator[pd.DataFrame], keys: List[str], directory: str) -> List[List[str]]:
+        '''
+        Write each batch's rows to the partition of their key hash. Files keep the stream order,
+        so rows of a group stay in their original order.
+        '''
+        files = [[] for _ in range(self.partitions)]
+        for batch_number, df in enumerate(stream):
+            partition = _partition_of(df, keys, self.partitions)
+            order = np.argsort(partition, kind='stable')
+            bounds = np.searchsorted(partition[order], np.arange(self.partitions + 1))
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            for p in range(self.partitions):
+                if bounds[p] == bounds[p + 1]:
+                    continue
+                path = os.path.join(directory, f'partition-{p:05d}-batch-{batch_number:07d}.parquet')
+                pq.write_table(table.take(order[bounds[p]:bounds[p + 1]]), path)
+                files[p].append(path)
+        return files
+
+    def _partitioned(self, stream: Iterator[pd.DataFrame], step: PipelineStep, directory: str) -> Iterator[pd.DataFrame]:
+        keys = _as_list(step.kwargs['group_column'])
+        for files in self._spill(stream, keys, directory):
+            if len(files) == 0:
+                continue
+            # Batches can disagree on types of columns that were empty in some of them
+            df = pa.concat_tables([pq.read_table(f) for f in files], promote_options='permissive').to_pandas()
+            for f in files:
+                os.remove(f)
+            yield step.run(df)
+
+    def iter_batches(self, source: str | List[str], source_format: str = None) -> Iterator[pd.DataFrame]:
+        '''
+        Stream the source through the pipeline, yielding result dataframes
+
+        Parameters
+        ----------
+        source: str | list
+            Parquet file, parquet dataset directory or csv file path(s)
+        source_format: str, optional
+            'parquet' or 'csv'. Defaults to csv when every path has a csv or tsv extension.
+
+        Returns
+        -------
+        Iterator[pd.DataFrame]
+        '''
+        select = self.pipeline._select
+        plan, needed = self.pipeline._plan(select)
+
+        def counted(stream):
+            for df in stream:
+                self.rows_read += len(df)
+                yield df
+
+        self.rows_read = 0
+        stream = counted(_read_batches(source, source_format, self.batch_size, needed))
+        with tempfile.TemporaryDirectory(dir=self.spill_directory) as directory:
+            for number, (steps, group_step) in enumerate(_segments(plan)):
+                stream = self._apply(stream, steps)
+                if group_step is not None:
+                    stage = os.path.join(directory, f'stage-{number}')
+                    os.makedirs(stage)
+                    stream = self._partitioned(stream, group_step, stage)
+
+            for df in stream:
+                yield df if select is None else df[select]
+
+    def run(
+        self,
+        source: str | List[str],
+        output_path: str,
+        source_format: str = None,
+        partition_cols: List[str] = None,
+        compression: str = 'zstd',
+        mode: str = 'overwrite'
+    ) -> str:
+        '''
+        Stream the source through the pipeline into a parquet dataset
+
+        Parameters
+        ----------
+        source: str | list
+            Parquet file, parquet dataset directory or csv file path(s)
+        output_path: str
+            Directory of the output dataset
+        source_format: str, optional
+            'parquet' or 'csv'. Defaults to csv when every path has a csv or tsv extension.
+        partition_cols: list, optional
+            Columns to hive partition the output by
+        compression: str, optional
+            Parquet compression codec. Default is zstd.
+        mode: str, optional
+            'overwrite' replaces output_path once every batch is written, 'append' adds new files next to existing ones
+
+        Returns
+        -------
+        output_path: str
+            Directory of the output dataset
+        '''
+        if mode not in ['overwrite', 'append']:
+            raise ValueError("mode must be 'overwrite' or 'append'")
+        if mode == 'append':
+            self._write(source, output_path, source_format, partition_cols, compression)
+            return output_path
+
+        # Write next to the output and swap it in at the end, so the source can live inside the
+        # output (e.g. rewriting a dataset in place) and a failed run leaves the old output intact
+        parent = os.path.dirname(os.path.abspath(output_path))
+        os.makedirs(parent, exist_ok=True)
+        staging = tempfile.mkdtemp(prefix='.staging-', dir=parent)
+        try:
+            self._write(source, staging, source_format, partition_cols, compression)
+            if os.path.isdir(output_path):
+                shutil.rmtree(output_path)
+            os.replace(staging, output_path)
+        finally:
+            if os.path.isdir(staging):
+                shutil.rmtree(staging)
+        return output_path
+
+    def _write(self, source, output_path: str, source_format: str, partition_cols: List[str], compression: str) -> None:
+        file_options = ds.ParquetFileFormat().make_write_options(compression=compression)
+        run_id = os.urandom(4).hex()
+        self.rows_written = 0
+        for number, df in enumerate(self.iter_batches(source, source_format)):
+            ds.write_dataset(
+                pa.Table.from_pandas(df, preserve_index=False),
+                output_path,
+                format='parquet',
+                partitioning=partition_cols,
+                partitioning_flavor='hive' if partition_cols else None,
+                file_options=file_options,
+                basename_template=f'part-{run_id}-{number:07d}-{{i}}.parquet',
+                existing_data_behavior='overwrite_or_ignore'
+            )
+            self.rows_written += len(df)
@@ -2,13 +2,18 @@ import pandas as pd
 import pandas_flavor as pf
 
 from typing import List
-import pydoc
+
+from .dispatch import polars_dispatch
+from .group_partitions import GroupPartitions
 
 @pf.register_dataframe_method
+@polars_dispatch
 def subset_by_group(
     df: pd.DataFrame,
-    column_name: List[str] | str
-) -> dict:
+    column_name: List[str] | str,
+    lazy: bool = False,
+    cache_size: int = 32
+) -> dict | GroupPartitions:
 
     """
     Subsets dataframe based on categories in separate dictionary of dataframes
@@ -19,14 +24,18 @@ def subset_by_group(
         Dataframe
     column_name: List[str] | str
         List or string of name to subset by
+    lazy: bool, optional
+        When True, returns a GroupPartitions mapping that builds each group on access instead of copying every group up front
+    cache_size: int, optional
+        Number of groups the lazy mapping keeps cached. Default is 32.
     
     Returns
     -------
-    result: dict
+    result: dict | GroupPartitions
         Dictionary of dataframes subset by specified category
     """
 
+    if lazy is True:
+        return GroupPartitions(df, column_name, cache_size)
     return dict(iter(df.groupby(column_name)))
 
-pydoc.writedoc('subset_by_group')
-
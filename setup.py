@@ -14,7 +14,7 @@ setup(
     author_email = '<soloemoon@gmail.com>',
     description=DESCRIPTION,
     packages = find_packages(),
-    install_requires = ['pandas', 'numpy', 'pyjanitor', 'datetime', 'python-dateutil', 'xlwings', 'polars'],
+    install_requires = ['pandas', 'numpy', 'pyarrow', 'pyjanitor', 'datetime', 'python-dateutil', 'xlwings', 'polars'],
     keywords = ['python','bizwiz', 'businesswizard', 'business', 'helper'],
     classifiers=[
         'Development Status :: 3 - Alpha',
@@ -0,0 +1,129 @@
+import time
+
+import matplotlib
+
+matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+from matplotlib.collections import LineCollection, PolyCollection
+
+from businesswizard.chartwizard import bullet_graph
+
+
+@pytest.fixture
+def kpis():
+    return pd.DataFrame({
+        'kpi': ['revenue', 'margin', 'churn'],
+        'value': [55.0, 90.0, 10.0],
+        'target': [70.0, 85.0, 15.0],
+    })
+
+
+@pytest.fixture(autouse=True)
+def close_figures():
+    yield
+    plt.close('all')
+
+
+def _collections(fig):
+    ax, = fig.axes
+    bands, bars = [c for c in ax.collections if isinstance(c, PolyCollection)]
+    targets, = [c for c in ax.collections if isinstance(c, LineCollection)]
+    return ax, bands, bars, targets
+
+
+def test_collection_mode_draws_one_axes_with_three_collections(kpis):
+    fig = kpis.bullet_graph('kpi', 'value', 'target', mode='collection')
+    ax, bands, bars, targets = _collections(fig)
+
+    assert len(ax.collections) == 3
+    assert len(ax.patches) == 0
+    assert len(bands.get_paths()) == 3 * 4
+    assert len(bars.get_paths()) == 3
+
+
+def test_collection_mode_matches_subplots(kpis):
+    subplots = kpis.bullet_graph('kpi', 'value', 'target')
+    collection = kpis.bullet_graph('kpi', 'value', 'target', mode='collection')
+    _, bands, bars, targets = _collections(collection)
+
+    # Subplots draws the bands and then the value bar as patches, and the target as vlines
+    expected_bands = [(p.get_x(), p.get_x() + p.get_width()) for ax in subplots.axes for p in ax.patches[:-1]]
+    expected_bars = [ax.patches[-1].get_width() for ax in subplots.axes]
+    expected_targets = [ax.collections[0].get_segments()[0][0, 0] for ax in subplots.axes]
+    expected_labels = [ax.get_yticklabels()[0].get_text() for ax in subplots.axes]
+
+    band_extents = [(path.vertices[:, 0].min(), path.vertices[:, 0].max()) for path in bands.get_paths()]
+    assert band_extents == expected_bands
+    assert [np.ptp(path.vertices[:, 0]) for path in bars.get_paths()] == expected_bars
+    assert [segment[0, 0] for segment in targets.get_segments()] == expected_targets
+    # Rows run top down in frame order, like the subplots
+    row_heights = [segment[:, 1].mean() for segment in targets.get_segments()]
+    assert row_heights == sorted(row_heights, reverse=True)
+    texts = [t.get_text() for t in collection.axes[0].texts]
+    assert texts[:3] == expected_labels
+    assert texts[3:] == ['Poor', 'Ok', 'Good', 'Excellent']
+
+
+def test_collection_mode_band_colors_follow_limits(kpis):
+    fig = kpis.bullet_graph('kpi', 'value', 'target', limits=[50, 100], labels=None, mode='collection')
+    ax, bands, _, _ = _collections(fig)
+
+    colors = bands.get_facecolors()
+    assert len(colors) == 3 * 2
+    np.testing.assert_array_equal(colors[0], colors[2])
+    assert not np.array_equal(colors[0], colors[1])
+    assert [t.get_text() for t in ax.texts] == ['revenue', 'margin', 'churn']
+
+
+def test_collection_mode_x_axis_fits_values_over_the_last_limit(kpis):
+    kpis.loc[1, 'value'] = 140.0
+    kpis.loc[2, 'target'] = np.nan
+
+    fig = kpis.bullet_graph('kpi', 'value', 'target', mode='collection')
+    fig.canvas.draw()
+
+    assert fig.axes[0].get_xlim() == (0.0, 140.0)
+
+
+def test_collection_mode_handles_an_empty_frame():
+    df = pd.DataFrame({'kpi': [], 'value': [], 'target': []})
+
+    fig = df.bullet_graph('kpi', 'value', 'target', mode='collection')
+    fig.canvas.draw()
+
+    assert len(fig.axes) == 1
+
+
+def test_collection_mode_sets_title_and_axis_label(kpis):
+    fig = bullet_graph(kpis, 'kpi', 'value', 'target', axis_label='Score', title='KPIs', formatter='{x:.0f}%', mode='collection')
+    fig.canvas.draw()
+
+    assert fig.axes[0].get_xlabel() == 'Score'
+    assert fig._suptitle.get_text() == 'KPIs'
+    assert fig.axes[0].get_xticklabels()[-1].get_text().endswith('%')
+
+
+def test_collection_mode_renders_a_large_board_quickly():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'kpi': [f'kpi {i}' for i in range(500)],
+        'value': rng.uniform(0, 100, 500),
+        'target': rng.uniform(0, 100, 500),
+    })
+
+    start = time.perf_counter()
+    fig = df.bullet_graph('kpi', 'value', 'target', size=(8, 60), mode='collection')
+    fig.canvas.draw()
+    elapsed = time.perf_counter() - start
+
+    assert len(fig.axes) == 1
+    assert elapsed < 5
+
+
+def test_unknown_mode_is_rejected(kpis):
+    with pytest.raises(ValueError, match='mode'):
+        kpis.bullet_graph('kpi', 'value', 'target', mode='grid')
@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from businesswizard.functions import BusinessCalendar, date_diff, get_calendar, register_calendar
+
+
+@pytest.fixture
+def calendar():
+    return BusinessCalendar('test', holidays=['1965-07-05', '2024-07-04', '2024-12-25'], start='2000-01-01', end='2030-12-31')
+
+
+def _numpy_count(calendar, start, end):
+    start = np.array(start, dtype='datetime64[D]')
+    end = np.array(end, dtype='datetime64[D]')
+    counts = np.busday_count(start, end + np.timedelta64(1, 'D'), holidays=calendar.holidays)
+    return np.where(start > end, 0, counts)
+
+
+def test_index_matches_numpy(calendar):
+    rng = np.random.default_rng(1)
+    start = np.datetime64('2020-01-01') + rng.integers(0, 1500, 300).astype('timedelta64[D]')
+    end = start + rng.integers(-10, 300, 300).astype('timedelta64[D]')
+
+    np.testing.assert_array_equal(calendar.business_days_between(start, end), _numpy_count(calendar, start, end))
+    np.testing.assert_array_equal(
+        calendar.add_business_days(start, 7),
+        np.busday_offset(start, 7, roll='forward', holidays=calendar.holidays)
+    )
+
+
+def test_dates_outside_the_index_fall_back(calendar):
+    start = ['1965-07-01', '1999-12-30', '2024-07-01']
+    end = ['1965-07-09', '2000-01-04', '2031-01-03']
+
+    np.testing.assert_array_equal(calendar.business_days_between(start, end), _numpy_count(calendar, start, end))
+    assert calendar.business_days_between(start, end)[0] == 6
+    assert calendar.is_business_day(['1965-07-05', '1965-07-06']).tolist() == [False, True]
+    assert calendar.add_business_days(['1965-07-02'], 1)[0] == np.datetime64('1965-07-06')
+    assert calendar.add_business_days(['2030-12-31'], 1)[0] == np.datetime64('2031-01-01')
+    assert list(calendar.business_days('1965-07-02', '1965-07-06')) == [np.datetime64('1965-07-02'), np.datetime64('1965-07-06')]
+
+
+def test_date_diff_with_a_calendar_before_1970():
+    df = pd.DataFrame({'start': ['1960-01-04', '1969-12-29'], 'end': ['1960-01-08', '1970-01-02']})
+
+    result = date_diff(df, 'start', 'end', calendar='us_federal')
+
+    # New Year's Day 1970 is a federal holiday
+    assert result['date_diff_business_days'].tolist() == [5, 4]
+
+
+def test_registered_calendars_are_built_once():
+    register_calendar('four_day', weekmask='1111000', holidays=['2024-01-01'])
+
+    calendar = get_calendar('four_day')
+
+    assert get_calendar('four_day') is calendar
+    assert calendar.business_days_between(['2024-01-01'], ['2024-01-07']).tolist() == [3]
+    with pytest.raises(ValueError, match='Unknown calendar'):
+        get_calendar('missing')
@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from businesswizard.functions import clean_column_text
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({
+        'text': ['  New York ', 'san-francisco!', None, 'BOSTON', 'new york'],
+        'floats': [1.0, 2.5, np.nan, 3.0, 4.0],
+        'ints': [1, 2, 3, 4, 5],
+        'mixed': pd.Series([1, 'a b', None, 2.5, True], dtype=object),
+        'category': pd.Series(['x', 'y', 'x', None, 'y'], dtype='category')
+    })
+
+
+@pytest.mark.parametrize('kwargs', [
+    {},
+    {'change_case': 'upper'},
+    {'change_case': 'proper', 'remove_special_characters': True},
+    {'transformations_dictionary': {'BOSTON': 'Boston', '1.0': 'one'}},
+    {'transformations_dictionary': {'new york': 'NYC'}, 'ignore_case': True},
+    {'transformations_dictionary': {'york': 'Yorkshire'}, 'whole_word': True},
+    {'transformations_dictionary': {r'[aeiou]': '*'}, 'use_regex': True}
+])
+def test_engines_agree(df, kwargs):
+    columns = list(df.columns)
+    arrow = clean_column_text(df.copy(), columns, engine='arrow', **kwargs)
+    pandas = clean_column_text(df.copy(), columns, engine='pandas', **kwargs)
+
+    pd.testing.assert_frame_equal(arrow, pandas)
+
+
+def test_numbers_are_stringified_as_pandas_does(df):
+    result = clean_column_text(df, ['floats', 'ints', 'mixed'])
+
+    assert result['floats'].tolist()[:2] == ['1.0', '2.5']
+    assert result['floats'].isna().tolist() == [False, False, True, False, False]
+    assert result['ints'].tolist() == ['1', '2', '3', '4', '5']
+    assert result['mixed'].tolist()[:2] == ['1', 'a b']
+    assert result['mixed'].tolist()[3:] == ['2.5', 'True']
+
+
+def test_values_and_missing_values(df):
+    result = clean_column_text(df, 'text', change_case='lower', remove_special_characters=True)
+
+    assert result['text'].tolist()[:2] == ['newyork', 'sanfrancisco']
+    assert result['text'].isna().tolist() == [False, False, True, False, False]
+
+
+def test_arrow_backed_columns_stay_arrow_backed():
+    df = pd.DataFrame({'text': pd.array([' a ', None], dtype=pd.ArrowDtype(pa.string()))})
+
+    for engine in ['arrow', 'pandas']:
+        result = clean_column_text(df.copy(), 'text', change_case='upper', engine=engine)
+        assert result['text'].dtype == pd.ArrowDtype(pa.string())
+        assert result['text'].iloc[0] == 'A'
+        assert result['text'].isna().tolist() == [False, True]
+
+
+def test_threads_give_the_same_result(df):
+    columns = ['text', 'floats', 'mixed']
+    serial = clean_column_text(df.copy(), columns, change_case='upper', max_workers=1)
+    threaded = clean_column_text(df.copy(), columns, change_case='upper', max_workers=3)
+
+    pd.testing.assert_frame_equal(serial, threaded)
+
+
+def test_invalid_options(df):
+    with pytest.raises(ValueError, match='change_case'):
+        clean_column_text(df, 'text', change_case='title')
+    with pytest.raises(ValueError, match='engine'):
+        clean_column_text(df, 'text', engine='numba')
@@ -0,0 +1,80 @@
+import os
+import tarfile
+import zipfile
+
+import pytest
+
+from businesswizard.filewizard import compress_file, create_archive
+
+
+@pytest.fixture
+def files(tmp_path):
+    text = tmp_path / 'report.csv'
+    text.write_bytes(b''.join(f'{i},customer {i % 97},{i * 3.5}\n'.encode() for i in range(20_000)))
+    noise = tmp_path / 'noise.bin'
+    noise.write_bytes(os.urandom(300_000))
+    parquet = tmp_path / 'data.parquet'
+    parquet.write_bytes(os.urandom(1000))
+    empty = tmp_path / 'empty.txt'
+    empty.write_bytes(b'')
+    return [str(text), str(noise), str(parquet), str(empty)]
+
+
+def _contents(path):
+    with zipfile.ZipFile(path) as zf:
+        assert zf.testzip() is None
+        return {os.path.basename(info.filename): (zf.read(info), info.compress_type) for info in zf.infolist()}
+
+
+@pytest.mark.parametrize('max_workers', [1, 4])
+def test_chunked_parallel_deflate_round_trips(tmp_path, files, max_workers):
+    archive = str(tmp_path / 'out.zip')
+    stats = create_archive(files, archive, max_workers=max_workers, chunk_size=64 * 1024)
+    contents = _contents(archive)
+
+    for f in files:
+        with open(f, 'rb') as fh:
+            assert contents[os.path.basename(f)][0] == fh.read()
+    assert contents['report.csv'][1] == zipfile.ZIP_DEFLATED
+    assert contents['data.parquet'][1] == zipfile.ZIP_STORED
+    assert stats.files == 4
+    assert stats.bytes_out == os.path.getsize(archive)
+    assert stats.ratio > 1
+
+
+def test_codecs_apply_to_every_member(tmp_path, files):
+    stored = _contents(create_archive(files, str(tmp_path / 'stored.zip'), codec='stored').archive_name)
+    deflated = _contents(create_archive(files, str(tmp_path / 'deflate.zip'), codec='deflate').archive_name)
+
+    assert {t for _, t in stored.values()} == {zipfile.ZIP_STORED}
+    assert {t for _, t in deflated.values()} == {zipfile.ZIP_DEFLATED}
+    assert {k: v for k, (v, _) in stored.items()} == {k: v for k, (v, _) in deflated.items()}
+
+
+def test_zstd_tar(tmp_path, files):
+    zstandard = pytest.importorskip('zstandard')
+    archive = str(tmp_path / 'out.tar.zst')
+    create_archive(files, archive, codec='zstd')
+    with open(archive, 'rb') as fh, zstandard.ZstdDecompressor().stream_reader(fh) as reader:
+        with tarfile.open(fileobj=reader, mode='r|') as tar:
+            names = [os.path.basename(member.name) for member in tar]
+    assert names == [os.path.basename(f) for f in files]
+
+
+def test_compress_file_accepts_a_single_path(tmp_path, files):
+    archive = str(tmp_path / 'single.zip')
+    assert compress_file(files[0], archive) == archive
+    assert list(_contents(archive)) == ['report.csv']
+
+
+def test_unknown_codec(tmp_path, files):
+    with pytest.raises(ValueError, match='codec'):
+        create_archive(files, str(tmp_path / 'out.zip'), codec='bz2')
+
+
+def test_compress_file_rejects_zstd(tmp_path, files):
+    archive = tmp_path / 'out.zip'
+
+    with pytest.raises(ValueError, match='create_archive'):
+        compress_file(files, str(archive), codec='zstd')
+    assert not archive.exists()
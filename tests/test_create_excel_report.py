@@ -0,0 +1,68 @@
+import sys
+
+import numpy as np
+import pandas as pd
+
+from businesswizard.filewizard import create_excel_report, create_excel_reports
+
+# The function shadows its module on the package
+excel_report_module = sys.modules['businesswizard.filewizard.create_excel_report']
+
+
+def _frame():
+    return pd.DataFrame({
+        'name': ['a', 'bb', None, 'dddd'],
+        'amount': [1.5, np.nan, 3.0, 4.25],
+        'count': [1, 2, 3, 4],
+        'day': pd.to_datetime(['2024-01-01', '2024-01-02', None, '2024-01-04'])
+    })
+
+
+def test_streaming_matches_in_memory(tmp_path):
+    df = _frame()
+    create_excel_report(df, str(tmp_path / 'memory.xlsx'))
+    create_excel_report(df, str(tmp_path / 'streaming.xlsx'), streaming=True, chunk_size=3)
+
+    memory = pd.read_excel(tmp_path / 'memory.xlsx', sheet_name=None)
+    streaming = pd.read_excel(tmp_path / 'streaming.xlsx', sheet_name=None)
+
+    assert list(memory) == list(streaming) == ['Report']
+    pd.testing.assert_frame_equal(memory['Report'], streaming['Report'])
+    assert streaming['Report']['name'].isna().tolist() == [False, False, True, False]
+    assert streaming['Report']['count'].tolist() == [1, 2, 3, 4]
+
+
+def test_streaming_empty_frame_writes_header(tmp_path):
+    create_excel_report(_frame().iloc[:0], str(tmp_path / 'empty.xlsx'), streaming=True)
+
+    assert pd.read_excel(tmp_path / 'empty.xlsx').columns.tolist() == ['name', 'amount', 'count', 'day']
+
+
+def test_long_frames_split_across_sheets(tmp_path, monkeypatch):
+    monkeypatch.setattr(excel_report_module, 'excel_max_rows', 4)
+    df = pd.DataFrame({'id': range(7)})
+
+    for streaming in [False, True]:
+        path = tmp_path / f'split-{streaming}.xlsx'
+        create_excel_report(df, str(path), sheet_name='x' * 40, streaming=streaming)
+        sheets = pd.read_excel(path, sheet_name=None)
+
+        assert list(sheets) == ['x' * 29 + '_1', 'x' * 29 + '_2', 'x' * 29 + '_3']
+        assert pd.concat(sheets.values())['id'].tolist() == list(range(7))
+
+
+def test_create_excel_reports_serial_and_parallel(tmp_path):
+    df = _frame()
+    specs = [
+        (df, str(tmp_path / 'a.xlsx')),
+        (df.head(2), str(tmp_path / 'b.xlsx'), 'Second'),
+        {'df': df.tail(1), 'file_name': str(tmp_path / 'c.xlsx'), 'sheet_name': 'Third'}
+    ]
+
+    for max_workers in [1, 2]:
+        files = create_excel_reports(specs, max_workers=max_workers, streaming=True)
+
+        assert files == [str(tmp_path / name) for name in ['a.xlsx', 'b.xlsx', 'c.xlsx']]
+        assert list(pd.read_excel(files[1], sheet_name=None)) == ['Second']
+        assert len(pd.read_excel(files[0])) == 4
+        assert pd.read_excel(files[2], sheet_name='Third')['count'].tolist() == [4]
@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from businesswizard.functions import create_flag, create_flags
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({
+        'state': ['NY', None, 'CA', np.nan, 'TX', 'NY'],
+        'amount': [5.0, 20_000.0, np.nan, 10_000.0, 9_999.0, 0.0],
+        'address': ['PO Box 1', '1 Main', None, 'p.o. box 9', 'Box Hill', '2 Oak']
+    })
+
+
+def _reference(df, column, lookup, values=('Y', 'N')):
+    # The isin/map implementation create_flag used before create_flags
+    return df[column].isin(lookup).map(dict(zip([True, False], values))).tolist()
+
+
+@pytest.mark.parametrize('lookup', [['NY', 'CA'], ['NY', None], ['TX', np.nan], [None], []])
+def test_create_flag_matches_isin(df, lookup):
+    result = create_flag(df.copy(), 'state', lookup)
+
+    assert result['created_flag_column'].tolist() == _reference(df, 'state', lookup)
+
+
+def test_missing_values_match_a_lookup_with_missing_values():
+    df = pd.DataFrame({'code': ['a', None, 'b', 'a', np.nan]})
+
+    assert create_flag(df.copy(), 'code', ['b', None])['created_flag_column'].tolist() == ['N', 'Y', 'Y', 'N', 'Y']
+    assert create_flag(df.copy(), 'code', ['a', 'b'])['created_flag_column'].tolist() == ['Y', 'N', 'Y', 'Y', 'N']
+
+
+def test_rule_types(df):
+    result = create_flags(df, [
+        {'name': 'priority', 'column': 'state', 'isin': ['NY', 'CA']},
+        {'name': 'not_priority', 'column': 'state', 'isin': ['NY', 'CA'], 'negate': True},
+        {'name': 'large', 'column': 'amount', 'between': (10_000, None)},
+        {'name': 'small', 'column': 'amount', 'between': (None, 10_000), 'inclusive': 'neither'},
+        {'name': 'po_box', 'column': 'address', 'regex': r'p\.?o\.? box', 'ignore_case': True},
+        {'name': 'missing_state', 'column': 'state', 'isnull': True},
+        {'name': 'has_amount', 'column': 'amount', 'notnull': True}
+    ], output='bool')
+
+    assert result['priority'].tolist() == [True, False, True, False, False, True]
+    assert (result['not_priority'] == ~result['priority']).all()
+    assert result['large'].tolist() == [False, True, False, True, False, False]
+    assert result['small'].tolist() == [True, False, False, False, True, True]
+    assert result['po_box'].tolist() == [True, False, False, True, False, False]
+    assert result['missing_state'].tolist() == [False, True, False, True, False, False]
+    assert result['has_amount'].tolist() == [True, True, False, True, True, True]
+
+
+def test_outputs(df):
+    rule = [{'name': 'flag', 'column': 'state', 'isin': ['NY']}]
+
+    category = create_flags(df.copy(), rule)['flag']
+    text = create_flags(df.copy(), rule, output='object', values=('yes', 'no'))['flag']
+
+    assert list(category.cat.categories) == ['Y', 'N']
+    assert category.tolist() == ['Y', 'N', 'N', 'N', 'N', 'Y']
+    assert text.tolist() == ['yes', 'no', 'no', 'no', 'no', 'yes']
+
+
+def test_invalid_rules(df):
+    with pytest.raises(ValueError, match='exactly one'):
+        create_flags(df, [{'name': 'x', 'column': 'state', 'isin': ['NY'], 'regex': 'N'}])
+    with pytest.raises(ValueError, match='output'):
+        create_flags(df, [], output='int')
@@ -0,0 +1,100 @@
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from businesswizard.filewizard import bulk_import_csv, iter_csv_batches
+
+
+def _write(path, rows, header='Customer ID,Amount,Note'):
+    path.write_text(header + '\n' + ''.join(f'{row}\n' for row in rows))
+    return str(path)
+
+
+def test_batches_cover_every_row_in_order(tmp_path):
+    first = _write(tmp_path / 'a.csv', [f'{i},{i * 2},x' for i in range(25)] + [',,'])
+    second = _write(tmp_path / 'b.csv', [f'{i},{i * 2},' for i in range(25, 32)])
+
+    batches = list(iter_csv_batches([first, second], batch_size=10))
+
+    assert [(b.source_file, b.row_offset, b.source_rows, b.batch_index) for b in batches] == [
+        (first, 0, 10, 0), (first, 10, 10, 1), (first, 20, 6, 2), (second, 0, 7, 3)
+    ]
+    df = pd.concat([b.data for b in batches], ignore_index=True)
+    assert df.columns.tolist() == ['customer_id', 'amount', 'note']
+    assert df['customer_id'].tolist() == list(range(32))
+
+
+def test_streaming_matches_bulk_import(tmp_path):
+    paths = [
+        _write(tmp_path / 'a.csv', [f'{i},{i / 4},n{i}' for i in range(40)]),
+        _write(tmp_path / 'b.csv', [f'{i},{i / 4},' for i in range(40, 50)])
+    ]
+
+    streamed = pd.concat([b.data for b in iter_csv_batches(paths, batch_size=7)], ignore_index=True)
+    # bulk_import_csv stacks later files first
+    eager = bulk_import_csv(paths).sort_values('customer_id', ignore_index=True)
+
+    assert streamed['customer_id'].tolist() == eager['customer_id'].tolist()
+    assert streamed['amount'].tolist() == eager['amount'].tolist()
+    assert streamed['note'].isna().tolist() == eager['note'].isna().tolist()
+
+
+def test_decimals_after_the_first_block_do_not_break_the_stream(tmp_path):
+    rows = [f'{i},{i},{i}' for i in range(20_000)] + ['20000,1.5,x', '20001,7,']
+    path = _write(tmp_path / 'drift.csv', rows)
+
+    batches = list(iter_csv_batches(path, batch_size=5_000, output='arrow', block_size=4096))
+
+    schema = batches[0].data.schema
+    assert [schema.field(c).type for c in ['customer_id', 'amount', 'note']] == [pa.int64(), pa.float64(), pa.string()]
+    assert all(b.data.schema == schema for b in batches)
+    assert batches[-1].data.column('amount').to_pylist()[-2:] == [1.5, 7.0]
+    assert batches[-1].data.column('note').to_pylist()[-2:] == ['x', None]
+    assert sum(len(b.data) for b in batches) == 20_002
+
+
+def test_integer_columns_stay_integers(tmp_path):
+    path = _write(tmp_path / 'ints.csv', [f'{i},{i * 2},' for i in range(50)])
+
+    df = pd.concat([b.data for b in iter_csv_batches(path, batch_size=20)])
+
+    assert df['customer_id'].dtype == 'int64'
+    assert df['amount'].tolist() == pd.read_csv(path)['Amount'].tolist()
+
+
+def test_explicit_schema_keeps_integers_and_reports_bad_values(tmp_path):
+    schema = pa.schema([('customer_id', pa.int64()), ('amount', pa.int64())])
+    path = _write(tmp_path / 'a.csv', [f'{i},{i},x' for i in range(5)])
+
+    table = next(iter_csv_batches(path, schema=schema, output='arrow')).data
+    assert table.schema == schema
+
+    bad = _write(tmp_path / 'bad.csv', [f'{i},{i},x' for i in range(20_000)] + ['1,oops,x'])
+    with pytest.raises(ValueError, match='bad.csv'):
+        list(iter_csv_batches(bad, schema=schema, block_size=4096))
+
+
+def test_text_after_the_first_block_in_a_string_column(tmp_path):
+    rows = [f'{i},{i},' for i in range(20_000)] + ['1,1,late text']
+    path = _write(tmp_path / 'late.csv', rows)
+
+    notes = pd.concat([b.data for b in iter_csv_batches(path, block_size=4096)])['note']
+
+    assert notes.dropna().tolist() == ['late text']
+
+
+def test_zip_and_gzip_wrapped_files(tmp_path):
+    df = pd.DataFrame({'Customer ID': range(50), 'Amount': [i / 2 for i in range(50)], 'Note': ['x', None] * 25})
+    plain = str(tmp_path / 'plain.csv')
+    df.to_csv(plain, index=False)
+    df.to_csv(tmp_path / 'wrapped.csv.zip', index=False)
+    df.to_csv(tmp_path / 'wrapped.csv.gz', index=False)
+
+    expected = pd.concat(b.data for b in iter_csv_batches(plain, batch_size=20))
+    for name in ['wrapped.csv.zip', 'wrapped.csv.gz']:
+        streamed = pd.concat(b.data for b in iter_csv_batches(str(tmp_path / name), batch_size=20))
+        pd.testing.assert_frame_equal(streamed, expected)
+
+    reconciled = bulk_import_csv([str(tmp_path / 'wrapped.csv.zip')], reconcile_schema=True)
+    assert reconciled['customer_id'].tolist() == list(range(50))
+    assert reconciled['amount'].tolist() == df['Amount'].tolist()
@@ -0,0 +1,83 @@
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from businesswizard.functions import BusinessCalendar, date_diff
+
+
+def _business_days_reference(start, end):
+    # The row-by-row calculation date_diff replaced
+    if start.weekday() > 4:
+        start = start + timedelta(days=7 - start.weekday())
+    if end.weekday() > 4:
+        end = end - timedelta(days=end.weekday() - 4)
+    if start > end:
+        return 0
+    weeks = int(((end - start).days + 1) / 7)
+    remainder = end.weekday() - start.weekday() + 1
+    if remainder != 0 and end.weekday() < start.weekday():
+        remainder = 5 + remainder
+    return weeks * 5 + remainder
+
+
+@pytest.fixture
+def dates():
+    rng = np.random.default_rng(0)
+    start = pd.Timestamp('2020-01-01') + pd.to_timedelta(rng.integers(0, 1500, 500), unit='D')
+    end = start + pd.to_timedelta(rng.integers(-20, 400, 500), unit='D')
+    return pd.DataFrame({'start': start.strftime('%Y-%m-%d'), 'end': end.strftime('%Y-%m-%d')})
+
+
+def test_days_match_the_row_by_row_calculation(dates):
+    result = date_diff(dates.copy(), 'start', 'end')
+
+    start = pd.to_datetime(dates['start'])
+    end = pd.to_datetime(dates['end'])
+    assert result['date_diff_calendar_days'].tolist() == [(e - s).days for s, e in zip(start, end)]
+    assert result['date_diff_business_days'].tolist() == [_business_days_reference(s, e) for s, e in zip(start, end)]
+
+
+def test_other_calculations(dates):
+    start = pd.to_datetime(dates['start'])
+    end = pd.to_datetime(dates['end'])
+
+    months = date_diff(dates.copy(), 'start', 'end', calculation='M')['date_diff_months']
+    years = date_diff(dates.copy(), 'start', 'end', calculation='years')['date_diff_years']
+    weeks = date_diff(dates.copy(), 'start', 'end', calculation='w')['date_diff_weeks']
+
+    assert months.tolist() == [(e.year - s.year) * 12 + e.month - s.month for s, e in zip(start, end)]
+    assert years.tolist() == [e.year - s.year for s, e in zip(start, end)]
+    assert weeks.tolist() == [(e - s).days // 7 for s, e in zip(start, end)]
+
+
+def test_hours_and_mixed_formats():
+    df = pd.DataFrame({'start': ['2024-01-01 08:00', '01/02/2024'], 'end': ['2024-01-01 17:30', '2024-01-03']})
+
+    result = date_diff(df, 'start', 'end', calculation='hours')
+
+    assert result['date_diff_hours'].tolist() == [9, 24]
+
+
+def test_missing_dates_give_missing_results():
+    df = pd.DataFrame({'start': ['2024-01-01', None, '2024-01-05'], 'end': ['2024-01-08', '2024-01-02', None]})
+
+    result = date_diff(df, 'start', 'end')
+
+    assert result['date_diff_business_days'].dtype == 'Int64'
+    assert result['date_diff_business_days'].isna().tolist() == [False, True, True]
+    assert result['date_diff_business_days'].iloc[0] == 6
+
+
+def test_weekmask_and_calendar():
+    df = pd.DataFrame({'start': ['2024-07-01'], 'end': ['2024-07-07']})
+
+    six_day = date_diff(df.copy(), 'start', 'end', weekmask='1111110')
+    calendar = BusinessCalendar('test', holidays=['2024-07-04'])
+    holiday = date_diff(df.copy(), 'start', 'end', calendar=calendar)
+    federal = date_diff(df.copy(), 'start', 'end', calendar='us_federal')
+
+    assert six_day['date_diff_business_days'].tolist() == [6]
+    assert holiday['date_diff_business_days'].tolist() == [4]
+    assert federal['date_diff_business_days'].tolist() == [4]
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from businesswizard.functions import create_date_list
+
+
+def _expected(start, end, freq):
+    return pd.date_range(start, end, freq=freq).to_numpy().astype('datetime64[D]')
+
+
+@pytest.mark.parametrize('frequency, pandas_frequency', [
+    ('D', 'D'), ('B', 'B'), ('MS', 'MS'), ('ME', 'ME'), ('QS', 'QS-JAN'), ('QE', 'QE-DEC')
+])
+def test_frequencies_match_pandas(frequency, pandas_frequency):
+    result = create_date_list('2023-01-15', '2025-02-10', frequency=frequency)
+
+    np.testing.assert_array_equal(result, _expected('2023-01-15', '2025-02-10', pandas_frequency))
+
+
+def test_steps_and_weeks_start_on_the_start_date():
+    np.testing.assert_array_equal(create_date_list('2024-01-03', '2024-02-01', number_of_days=5), _expected('2024-01-03', '2024-02-01', '5D'))
+    np.testing.assert_array_equal(create_date_list('2024-01-03', '2024-03-01', frequency='W'), _expected('2024-01-03', '2024-03-01', '7D'))
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'number_of_days': 3}, {'frequency': 'W'}, {'frequency': 'MS'}, {'frequency': 'QE'},
+    {'remove_weekends': True}, {'calendar': 'us_federal'}
+])
+def test_iterator_chunks_match_a_single_array(kwargs):
+    eager = create_date_list('1999-12-20', '2001-03-05', **kwargs)
+    chunks = list(create_date_list('1999-12-20', '2001-03-05', iterator=True, chunk_days=17, **kwargs))
+
+    np.testing.assert_array_equal(np.concatenate(chunks), eager)
+
+
+def test_weekends_and_holidays_are_removed():
+    weekdays = create_date_list('2024-07-01', '2024-07-07', remove_weekends=True)
+    business = create_date_list('2024-07-01', '2024-07-07', calendar='us_federal')
+
+    assert len(weekdays) == 5
+    assert np.datetime64('2024-07-04') in weekdays
+    assert np.datetime64('2024-07-04') not in business
+    assert len(business) == 4
+
+
+def test_formats_and_edge_cases():
+    assert create_date_list('01/30/2024', '02/02/2024', date_format='%m/%d/%Y', output_format='%m/%d/%Y').tolist() == [
+        '01/30/2024', '01/31/2024', '02/01/2024', '02/02/2024'
+    ]
+    assert create_date_list('2024-01-01', '2024-03-31', output_months=True, output_format='%Y-%m-%d').tolist() == [
+        '2024-01-01', '2024-02-01', '2024-03-01'
+    ]
+    assert len(create_date_list('2024-02-01', '2024-01-01')) == 0
+    assert create_date_list(pd.Timestamp('2024-01-01'), pd.Timestamp('2024-01-01')).tolist() == [np.datetime64('2024-01-01')]
+    with pytest.raises(ValueError, match='frequency'):
+        create_date_list('2024-01-01', '2024-02-01', frequency='H')
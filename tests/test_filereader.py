@@ -0,0 +1,86 @@
+import gzip
+import zipfile
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import pytest
+
+from businesswizard.filewizard import ReadHandler, read_file, register_handler, sniff_format
+from businesswizard.filewizard import filereader as filereader_module
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({'id': [1, 2, 3], 'name': ['a', 'b', 'c']})
+
+
+def _check(result, df):
+    assert result['id'].tolist() == df['id'].tolist()
+    assert result['name'].astype(str).tolist() == df['name'].tolist()
+
+
+def test_plain_and_wrapped_csv(tmp_path, df):
+    text = df.to_csv(index=False).encode()
+    (tmp_path / 'a.csv').write_bytes(text)
+    (tmp_path / 'a.tsv').write_bytes(df.to_csv(index=False, sep='\t').encode())
+    with gzip.open(tmp_path / 'a.csv.gz', 'wb') as f:
+        f.write(text)
+    with zipfile.ZipFile(tmp_path / 'a.zip', 'w') as zf:
+        zf.writestr('a.csv', text)
+
+    assert sniff_format(str(tmp_path / 'a.csv.gz')) == ('csv', 'gzip')
+    assert sniff_format(str(tmp_path / 'a.zip')) == ('csv', 'zip')
+    for name in ['a.csv', 'a.tsv', 'a.csv.gz', 'a.zip']:
+        _check(read_file(str(tmp_path / name)), df)
+
+
+def test_csv_encoding_fallback(tmp_path):
+    (tmp_path / 'latin.csv').write_bytes('city\nMünchen\nZürich\n'.encode('latin1'))
+
+    assert read_file(str(tmp_path / 'latin.csv'))['city'].tolist() == ['München', 'Zürich']
+
+
+def test_binary_formats_are_sniffed_regardless_of_extension(tmp_path, df):
+    df.to_parquet(tmp_path / 'parquet.dat')
+    feather.write_feather(pa.Table.from_pandas(df), str(tmp_path / 'feather.dat'))
+    with pa.OSFile(str(tmp_path / 'stream.dat'), 'wb') as sink:
+        with pa.ipc.new_stream(sink, pa.Table.from_pandas(df).schema) as writer:
+            writer.write_table(pa.Table.from_pandas(df))
+    df.to_excel(tmp_path / 'book.dat', index=False, engine='openpyxl')
+
+    assert sniff_format(str(tmp_path / 'parquet.dat')) == ('parquet', None)
+    assert sniff_format(str(tmp_path / 'feather.dat')) == ('arrow', None)
+    assert sniff_format(str(tmp_path / 'stream.dat')) == ('arrow_stream', None)
+    assert sniff_format(str(tmp_path / 'book.dat')) == ('xlsx', None)
+    for name in ['parquet.dat', 'feather.dat', 'stream.dat', 'book.dat']:
+        _check(read_file(str(tmp_path / name)), df)
+    assert read_file(str(tmp_path / 'feather.dat'), columns=['name']).columns.tolist() == ['name']
+
+
+def test_json_lines(tmp_path, df):
+    df.to_json(tmp_path / 'a.jsonl', orient='records', lines=True)
+
+    _check(read_file(str(tmp_path / 'a.jsonl')), df)
+
+
+def test_registered_handler_takes_precedence(tmp_path):
+    class Fixed(ReadHandler):
+        formats = ['csv']
+
+        def read(self, path, file_format, **kwargs):
+            return pd.DataFrame({'handled': [path]})
+
+    (tmp_path / 'a.csv').write_text('x\n1\n')
+    handlers = vars(filereader_module)['__handlers']
+    original = list(handlers)
+    try:
+        register_handler(Fixed)
+        assert read_file(str(tmp_path / 'a.csv'))['handled'].tolist() == [str(tmp_path / 'a.csv')]
+    finally:
+        handlers[:] = original
+
+
+def test_unknown_format(tmp_path):
+    with pytest.raises(ValueError, match='No reader registered'):
+        filereader_module.reader_chain().handle('x.bin', 'bin')
@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from businesswizard.functions import group_concat
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(3)
+    n = 300
+    return pd.DataFrame({
+        'region': rng.choice(['east', 'west', 'north'], n),
+        'team': rng.choice(['a', 'b'], n),
+        'item': rng.choice(['pen', 'ink', 'pad', 'cup'], n),
+        'rank': rng.permutation(n),
+        'owner': rng.choice(['x', 'y', 'z'], n)
+    })
+
+
+@pytest.mark.parametrize('kwargs', [
+    {},
+    {'distinct': True},
+    {'max_items': 3},
+    {'distinct': True, 'max_items': 2, 'order_by': 'rank'},
+    {'delimiter': ','}
+])
+@pytest.mark.parametrize('group_column', ['region', ['region', 'team']])
+def test_engines_agree(df, kwargs, group_column):
+    arrow = group_concat(df, group_column, ['item', 'owner'], engine='arrow', **kwargs)
+    pandas = group_concat(df, group_column, ['item', 'owner'], engine='pandas', **kwargs)
+
+    pd.testing.assert_frame_equal(arrow, pandas)
+
+
+def test_missing_values_are_skipped():
+    df = pd.DataFrame({'k': ['a', 'a', 'b', None], 'v': ['x', None, None, 'z'], 'other': [None, 1.0, 2.0, 3.0]})
+
+    result = group_concat(df, 'k', 'v')
+
+    assert result['k'].tolist() == ['a', 'b']
+    assert result['v'].iloc[0] == 'x'
+    assert pd.isna(result['v'].iloc[1])
+    assert result['other'].tolist() == [1.0, 2.0]
+
+
+def test_numbers_are_joined_as_text():
+    df = pd.DataFrame({'k': [1, 1, 2], 'v': [1.0, 2.5, 3.0]})
+
+    assert group_concat(df, 'k', 'v', delimiter=';')['v'].tolist() == ['1.0 ; 2.5', '3.0']
+
+
+def test_empty_frame_and_invalid_engine(df):
+    assert len(group_concat(df.iloc[:0], 'region', 'item')) == 0
+    with pytest.raises(ValueError, match='engine'):
+        group_concat(df, 'region', 'item', engine='numpy')
@@ -0,0 +1,55 @@
+import os
+
+import pytest
+
+from businesswizard.filewizard import IncrementalImporter
+
+
+def test_only_new_or_changed_files_are_read(tmp_path):
+    landing = tmp_path / 'landing'
+    landing.mkdir()
+    (landing / 'a.csv').write_text('x\n1\n2\n')
+    importer = IncrementalImporter(str(tmp_path / 'store'))
+
+    assert len(importer.run(str(landing))) == 2
+    assert len(importer.run(str(landing))) == 0
+
+    (landing / 'b.csv').write_text('x\n3\n')
+    assert importer.run(str(landing))['x'].tolist() == [3]
+
+    (landing / 'a.csv').write_text('x\n1\n2\n4\n')
+    os.utime(landing / 'a.csv', ns=(0, 10 ** 18))
+    assert len(importer.run(str(landing))) == 3
+    assert sorted(importer.read()['x'].tolist()) == [1, 2, 3, 4]
+
+
+def test_manifest_survives_a_new_importer(tmp_path):
+    landing = tmp_path / 'landing'
+    landing.mkdir()
+    (landing / 'a.csv').write_text('x\n1\n')
+    IncrementalImporter(str(tmp_path / 'store')).run(str(landing))
+
+    assert len(IncrementalImporter(str(tmp_path / 'store')).run(str(landing))) == 0
+
+
+def test_unsupported_files_are_rejected_not_recorded(tmp_path):
+    landing = tmp_path / 'landing'
+    landing.mkdir()
+    (landing / 'a.txt').write_text('x\n1\n')
+    importer = IncrementalImporter(str(tmp_path / 'store'))
+
+    with pytest.raises(ValueError, match='a.txt'):
+        importer.run(str(landing), pattern='*.txt')
+    assert importer.manifest == {}
+
+
+def test_forget_removes_rows(tmp_path):
+    landing = tmp_path / 'landing'
+    landing.mkdir()
+    (landing / 'a.csv').write_text('x\n1\n')
+    importer = IncrementalImporter(str(tmp_path / 'store'))
+    importer.run(str(landing))
+
+    assert importer.forget(str(landing / 'a.csv')) is True
+    assert importer.read().empty
+    assert len(importer.run(str(landing))) == 1
@@ -0,0 +1,142 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pandas as pd
+
+import businesswizard.filewizard.ingest_cache as ingest_cache
+from businesswizard.filewizard import IngestCache
+
+
+def counting_loader(calls):
+    def load(path, **kwargs):
+        calls.append(kwargs)
+        df = pd.read_csv(path)
+        return df[kwargs['columns']] if 'columns' in kwargs else df
+    return load
+
+
+def test_hit_returns_cached_frame(tmp_path):
+    source = tmp_path / 'a.csv'
+    source.write_text('x,y\n1,2\n3,4\n')
+    cache = IngestCache(str(tmp_path / 'cache'))
+    calls = []
+
+    first = cache.read(str(source), counting_loader(calls))
+    second = cache.read(str(source), counting_loader(calls))
+
+    assert len(calls) == 1
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_read_option_variants_are_kept(tmp_path):
+    source = tmp_path / 'a.csv'
+    source.write_text('x,y\n1,2\n')
+    cache = IngestCache(str(tmp_path / 'cache'))
+    calls = []
+    load = counting_loader(calls)
+
+    cache.read(str(source), load)
+    cache.read(str(source), load, columns=['x'])
+    cache.read(str(source), load)
+    cache.read(str(source), load, columns=['x'])
+
+    assert len(calls) == 2
+
+
+def test_changed_file_evicts_stale_versions(tmp_path):
+    source = tmp_path / 'a.csv'
+    source.write_text('x\n1\n')
+    cache = IngestCache(str(tmp_path / 'cache'))
+    cache.read(str(source), counting_loader([]))
+
+    source.write_text('x\n1\n2\n')
+    os.utime(source, ns=(0, 10 ** 18))
+    df = cache.read(str(source), counting_loader([]))
+
+    assert len(df) == 2
+    assert len([f for f in os.listdir(cache.cache_dir) if f.endswith('.parquet')]) == 1
+
+
+def test_invalidate_leaves_foreign_files(tmp_path):
+    cache_dir = tmp_path / 'cache'
+    cache_dir.mkdir()
+    foreign = cache_dir / 'mine.parquet'
+    pd.DataFrame({'a': [1]}).to_parquet(foreign)
+    source = tmp_path / 'a.csv'
+    source.write_text('x\n1\n')
+    cache = IngestCache(str(cache_dir))
+    cache.read(str(source), counting_loader([]))
+
+    assert cache.invalidate() == 1
+    assert foreign.exists()
+    assert cache.size == 0
+
+
+def test_eviction_only_touches_indexed_entries(tmp_path):
+    cache_dir = tmp_path / 'cache'
+    cache_dir.mkdir()
+    foreign = cache_dir / 'mine.parquet'
+    pd.DataFrame({'a': range(1000)}).to_parquet(foreign)
+    source = tmp_path / 'a.csv'
+    source.write_text('x\n1\n')
+    cache = IngestCache(str(cache_dir), max_bytes=0)
+    cache.read(str(source), counting_loader([]))
+
+    assert foreign.exists()
+    assert cache.size == 0
+
+
+def _cache_files(cache):
+    return {f for f in os.listdir(cache.cache_dir) if f.endswith('.parquet')}
+
+
+def _read_in_process(cache_dir, source):
+    return len(IngestCache(cache_dir).read(source, counting_loader([])))
+
+
+def _sources(tmp_path, n):
+    sources = []
+    for i in range(n):
+        source = tmp_path / f'{i}.csv'
+        source.write_text('x\n' + '\n'.join(str(v) for v in range(i + 1)) + '\n')
+        sources.append(str(source))
+    return sources
+
+
+def test_concurrent_threads_keep_every_entry_indexed(tmp_path):
+    sources = _sources(tmp_path, 24)
+    cache = IngestCache(str(tmp_path / 'cache'))
+
+    with ThreadPoolExecutor(8) as executor:
+        lengths = list(executor.map(lambda s: len(cache.read(s, counting_loader([]))), sources * 2))
+
+    assert lengths == [i + 1 for i in range(24)] * 2
+    assert set(cache._load_index()) == _cache_files(cache)
+    assert len(_cache_files(cache)) == 24
+    assert not any(f.endswith('.tmp') for f in os.listdir(cache.cache_dir))
+
+
+def test_concurrent_processes_keep_every_entry_indexed(tmp_path):
+    sources = _sources(tmp_path, 16)
+    cache_dir = str(tmp_path / 'cache')
+
+    with ProcessPoolExecutor(4) as executor:
+        list(executor.map(_read_in_process, [cache_dir] * 16, sources))
+
+    cache = IngestCache(cache_dir)
+    assert set(cache._load_index()) == _cache_files(cache)
+    assert cache.size == sum(os.path.getsize(os.path.join(cache_dir, f)) for f in _cache_files(cache))
+
+
+def test_content_hash_is_computed_once_per_read(tmp_path, monkeypatch):
+    source = tmp_path / 'a.csv'
+    source.write_text('x\n1\n')
+    cache = IngestCache(str(tmp_path / 'cache'), hash_contents=True)
+    calls = []
+    fingerprint = ingest_cache.file_fingerprint
+    monkeypatch.setattr(ingest_cache, 'file_fingerprint', lambda *args: calls.append(args) or fingerprint(*args))
+
+    cache.read(str(source), counting_loader([]))
+    cache.read(str(source), counting_loader([]))
+
+    assert len(calls) == 2
@@ -0,0 +1,74 @@
+import importlib.util
+import os
+import subprocess
+import sys
+
+import pytest
+
+import businesswizard
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run(code):
+    # A fresh interpreter, so nothing the other tests imported is already in sys.modules
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, cwd=root, check=True)
+    return result.stdout.split()
+
+
+@pytest.mark.parametrize('module', ['businesswizard', 'businesswizard.filewizard'])
+def test_import_does_not_load_heavy_modules(module):
+    loaded = _run(
+        f'import sys, {module}\n'
+        "heavy = ['janitor', 'duckdb', 'pyodbc', 'matplotlib', 'polars', 'win32com', 'pyarrow.dataset']\n"
+        'print(*[m for m in heavy if m in sys.modules])'
+    )
+    assert loaded == []
+
+
+def test_star_import_exports_functions_and_filewizard():
+    missing = _run(
+        'from businesswizard import *\n'
+        'import businesswizard.functions as functions, businesswizard.filewizard as filewizard\n'
+        'print(*[n for n in functions.__all__ + filewizard.__all__ if n not in globals()])'
+    )
+    assert missing == []
+
+
+def test_star_import_skips_uninstalled_optional_modules():
+    names = businesswizard.__all__
+    assert ('query_database' in names) == (importlib.util.find_spec('pyodbc') is not None)
+    assert 'date_diff' in names and 'write_parquet_dataset' in names
+
+
+def test_polars_imported_after_businesswizard_gets_namespace_on_first_use():
+    pytest.importorskip('polars')
+    output = _run(
+        'import importlib.util, businesswizard\n'
+        "importlib.util.find_spec('polars')\n"
+        'import polars as pl\n'
+        "df = pl.DataFrame({'zip': ['1']})\n"
+        "print(hasattr(df, 'bw'))\n"
+        "businesswizard.add_leading_zero(df, 'zip', 3)\n"
+        "print(df.bw.add_leading_zero('zip', 3)['zip'][0])"
+    )
+    assert output == ['False', '001']
+
+
+def test_polars_backend_import_registers_namespace():
+    pytest.importorskip('polars')
+    output = _run(
+        'import businesswizard, polars as pl\n'
+        'import businesswizard.functions.polars_backend\n'
+        "print(pl.DataFrame({'zip': ['1']}).bw.add_leading_zero('zip', 3)['zip'][0])"
+    )
+    assert output == ['001']
+
+
+def test_polars_imported_before_businesswizard_gets_namespace():
+    pytest.importorskip('polars')
+    output = _run(
+        'import polars as pl, businesswizard\n'
+        "print(pl.DataFrame({'zip': ['1']}).bw.add_leading_zero('zip', 3)['zip'][0])"
+    )
+    assert output == ['001']
@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from businesswizard.filewizard import bulk_import_csv, optimize_dtypes
+
+
+def test_integers_take_the_smallest_width_and_keep_their_backend():
+    df = pd.DataFrame({
+        'small': [1, -5, 100],
+        'medium': [1, 40_000, -3],
+        'nullable': pd.array([1, None, 300], dtype='Int64'),
+        'arrow': pd.array([1, 2, 3], dtype=pd.ArrowDtype(pa.int64())),
+        'empty': pd.array([None, None, None], dtype='Int64')
+    })
+
+    result = optimize_dtypes(df)
+
+    assert result['small'].dtype == np.int8
+    assert result['medium'].dtype == np.int32
+    assert result['nullable'].dtype == 'Int16'
+    assert result['arrow'].dtype == pd.ArrowDtype(pa.int8())
+    assert result['empty'].dtype == 'Int64'
+    pd.testing.assert_frame_equal(result.astype(df.dtypes), df)
+
+
+def test_floats_narrow_only_when_lossless():
+    df = pd.DataFrame({'halves': [0.5, 1.25, np.nan], 'precise': [0.1, 1 / 3, 2.0]})
+
+    result = optimize_dtypes(df)
+
+    assert result['halves'].dtype == np.float32
+    assert result['precise'].dtype == np.float64
+
+
+def test_strings_become_dates_and_categories():
+    df = pd.DataFrame({
+        'day': ['2024-01-31', '2024-02-01', None, '2024-03-05'],
+        'region': ['north', 'south', 'north', 'north'],
+        'id': ['a1', 'b2', 'c3', 'd4'],
+        'compact': ['20240131', '20240201', '20240301', '20240305']
+    })
+
+    result = optimize_dtypes(df)
+
+    assert pd.api.types.is_datetime64_any_dtype(result['day'])
+    assert result['day'].isna().tolist() == [False, False, True, False]
+    assert isinstance(result['region'].dtype, pd.CategoricalDtype)
+    assert not isinstance(result['id'].dtype, pd.CategoricalDtype)
+    # Separator-free formats also match numeric ids and are not parsed
+    assert not pd.api.types.is_datetime64_any_dtype(result['compact'])
+    assert optimize_dtypes(df, parse_dates=False)['day'].dtype == df['day'].dtype
+
+
+def test_schema_pins_columns_and_memory_report():
+    df = pd.DataFrame({'a': [1, 2, 3] * 100, 'b': ['x', 'y', 'z'] * 100})
+
+    result = optimize_dtypes(df, schema={'a': 'float64', 'b': None})
+
+    assert result['a'].dtype == np.float64
+    assert result['b'].dtype == df['b'].dtype
+    report = optimize_dtypes(df).attrs['memory_report']
+    assert report['after'] < report['before']
+
+
+def test_empty_frame():
+    assert optimize_dtypes(pd.DataFrame()).empty
+
+
+def test_bulk_import_optimizes_after_concatenating(tmp_path):
+    pd.DataFrame({'n': [1, 2], 'kind': ['a', 'a']}).to_csv(tmp_path / '1.csv', index=False)
+    pd.DataFrame({'n': [3, 4], 'kind': ['b', 'a']}).to_csv(tmp_path / '2.csv', index=False)
+
+    df = bulk_import_csv([str(tmp_path / '1.csv'), str(tmp_path / '2.csv')], optimize=True)
+
+    assert df['n'].dtype == np.int8
+    assert isinstance(df['kind'].dtype, pd.CategoricalDtype)
+    assert sorted(df['kind'].cat.categories) == ['a', 'b']
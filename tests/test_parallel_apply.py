@@ -0,0 +1,87 @@
+import glob
+
+import numpy as np
+import pandas as pd
+import pandas.testing as tm
+import pytest
+
+from businesswizard.functions import clean_column_text, create_flag, parallel_apply
+
+
+def _fail_on_first_partition(df):
+    # The later partitions still write output blocks that are never read back
+    if df.index[0] == 0:
+        raise RuntimeError('partition failed')
+    return df
+
+
+def _mixed_objects(df):
+    df = df.copy()
+    df['mixed'] = [1 if i % 2 else 'a' for i in range(len(df))]
+    return df
+
+
+def _shared_blocks():
+    return set(glob.glob('/dev/shm/psm_*'))
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    start = pd.Timestamp('2020-01-01') + pd.to_timedelta(rng.integers(0, 1500, 400), unit='D')
+    end = start + pd.to_timedelta(rng.integers(-20, 400, 400), unit='D')
+    return pd.DataFrame({
+        'opened': start.strftime('%Y-%m-%d'),
+        'closed': end.strftime('%Y-%m-%d'),
+        'city': rng.choice([' new york ', 'Boston', None, 'san  josé'], 400),
+    })
+
+
+def test_date_diff_matches_serial(frame):
+    before = _shared_blocks()
+    expected = frame.date_diff('opened', 'closed')
+    result = frame.parallel_apply('date_diff', 'opened', 'closed', max_workers=2, min_partition_rows=50)
+    tm.assert_frame_equal(result, expected)
+    assert _shared_blocks() <= before
+
+
+def test_clean_column_text_matches_serial(frame):
+    expected = clean_column_text(frame, ['city'], change_case='upper')
+    result = parallel_apply(frame, clean_column_text, ['city'], change_case='upper', max_workers=2, partitions=3)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_small_frame_runs_serially(frame):
+    result = frame.parallel_apply('date_diff', 'opened', 'closed', max_workers=2)
+    tm.assert_frame_equal(result, frame.date_diff('opened', 'closed'))
+
+
+def test_unarrowable_results_are_pickled(frame):
+    result = frame.parallel_apply(_mixed_objects, max_workers=2, partitions=2)
+    tm.assert_frame_equal(result, _mixed_objects(frame))
+
+
+def test_group_functions_are_rejected(frame):
+    with pytest.raises(ValueError, match='group_concat'):
+        frame.parallel_apply('group_concat', 'city', 'opened', max_workers=2)
+
+
+def test_failed_partition_frees_shared_memory(frame):
+    before = _shared_blocks()
+    with pytest.raises(RuntimeError, match='partition failed'):
+        frame.parallel_apply(_fail_on_first_partition, max_workers=2, partitions=4)
+    assert _shared_blocks() <= before
+
+
+@pytest.mark.parametrize('partitions', [1, 3])
+def test_untouched_columns_keep_their_dtypes_and_the_input_is_left_alone(frame, partitions):
+    frame['o'] = pd.Series(['x', None, 'y', 'z'] * 100, dtype=object)
+    frame['n'] = pd.array(range(400), dtype='Int64')
+    original = frame.copy()
+
+    expected = create_flag(frame.copy(), 'city', ['Boston'], 'is_boston')
+    result = frame.parallel_apply('create_flag', 'city', ['Boston'], 'is_boston', max_workers=2, partitions=partitions)
+
+    tm.assert_frame_equal(result, expected)
+    assert result['o'].dtype == object and result['n'].dtype == 'Int64'
+    tm.assert_frame_equal(frame, original)
@@ -0,0 +1,62 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+from businesswizard.functions import MultiPatternReplacer, compile_replacements
+
+
+def _sequential(text, replacements, flags=0):
+    # Non-overlapping keys give the same result whether applied one by one or in one scan
+    for key, value in replacements.items():
+        text = re.sub(key, lambda _: value, text, flags=flags)
+    return text
+
+
+def test_single_scan_matches_sequential_replacement():
+    rng = np.random.default_rng(2)
+    words = ['street', 'avenue', 'road', 'main', 'north', 'a.b', 'x+y']
+    replacements = {'street': 'st', 'avenue': 'ave', 'a.b': 'AB', 'x+y': 'XY'}
+    texts = [' '.join(rng.choice(words, 6)) for _ in range(200)]
+
+    replacer = MultiPatternReplacer(replacements)
+    escaped = {re.escape(k): v for k, v in replacements.items()}
+
+    assert [replacer.replace(t) for t in texts] == [_sequential(t, escaped) for t in texts]
+
+
+def test_longest_literal_wins_and_values_are_not_rescanned():
+    replacer = MultiPatternReplacer({'new': 'N', 'new york': 'NYC', 'N': 'no'})
+
+    assert replacer.replace('new york and new jersey') == 'NYC and N jersey'
+
+
+def test_whole_word_and_ignore_case():
+    replacer = MultiPatternReplacer({'st': 'street', 'Rd': 'road'}, whole_word=True, ignore_case=True)
+
+    assert replacer.replace('1 Main St, first RD, stop') == '1 Main street, first road, stop'
+
+
+def test_regex_keys():
+    replacer = MultiPatternReplacer({r'\d+': '#', r'[A-Z]{2}$': 'STATE'}, use_regex=True)
+
+    assert replacer('12 Main 3, NY') == '# Main #, STATE'
+
+
+def test_replace_series_scans_unique_values_and_keeps_missing():
+    s = pd.Series(['a b', None, 'a b', 'c', np.nan], index=[5, 4, 3, 2, 1])
+
+    result = MultiPatternReplacer({'a': 'A'}).replace_series(s)
+
+    assert result.index.tolist() == [5, 4, 3, 2, 1]
+    assert result.isna().tolist() == [False, True, False, False, True]
+    assert result.iloc[[0, 2, 3]].tolist() == ['A b', 'A b', 'c']
+
+
+def test_compiled_replacers_are_reused_and_empty_keys_ignored():
+    first = compile_replacements({'a': 'b'}, whole_word=True)
+
+    assert compile_replacements({'a': 'b'}, whole_word=True) is first
+    assert compile_replacements({'a': 'b'}) is not first
+    assert MultiPatternReplacer({'': 'x'}).replace('abc') == 'abc'
+    assert MultiPatternReplacer({'a': 'b'}).replace(None) is None
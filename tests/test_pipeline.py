@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+
+from businesswizard.functions import Pipeline
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(6)
+    n = 80
+    start = pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 200, n), unit='D')
+    return pd.DataFrame({
+        'zip': rng.choice(['123', '4567', '89'], n),
+        'city': rng.choice([' new york', 'boston! ', 'Austin'], n),
+        'state': rng.choice(['NY', 'MA', 'TX'], n),
+        'opened': start,
+        'closed': start + pd.to_timedelta(rng.integers(0, 60, n), unit='D'),
+        'unused': rng.random(n)
+    })
+
+
+def _pipeline():
+    return (
+        Pipeline()
+        .add_leading_zero('zip', 5)
+        .clean_column_text(['city'], change_case='upper', remove_special_characters=True)
+        .add_leading_zero(['zip', 'city'], 12)
+        .create_flag('state', ['NY', 'MA'], 'north_east')
+        .create_flags([{'name': 'is_tx', 'column': 'state', 'isin': ['TX']}])
+        .date_diff('opened', 'closed')
+    )
+
+
+def _eager(df):
+    return (
+        df.copy()
+        .add_leading_zero('zip', 5)
+        .clean_column_text(['city'], change_case='upper', remove_special_characters=True)
+        .add_leading_zero(['zip', 'city'], 12)
+        .create_flag('state', ['NY', 'MA'], 'north_east')
+        .create_flags([{'name': 'is_tx', 'column': 'state', 'isin': ['TX']}])
+        .date_diff('opened', 'closed')
+    )
+
+
+def test_pipeline_matches_eager_calls(df):
+    source = df.copy()
+
+    result = _pipeline().run(df, max_workers=2)
+
+    pd.testing.assert_frame_equal(result, _eager(df))
+    pd.testing.assert_frame_equal(df, source)
+
+
+def test_select_prunes_steps_and_columns(df):
+    columns = ['zip', 'north_east', 'date_diff_business_days']
+    pipeline = _pipeline().select(columns)
+
+    pd.testing.assert_frame_equal(pipeline.run(df), _eager(df)[columns])
+    plan = pipeline.explain()
+    assert "columns used: ['closed', 'opened', 'state', 'zip']" in plan
+    assert 'skipped steps: 2' in plan
+    assert len(pipeline.timings) == 4
+
+
+def test_apply_steps(df):
+    def double(frame, column, factor=2):
+        frame[f'{column}_x'] = frame[column] * factor
+        return frame
+
+    pipeline = Pipeline().apply(double, 'unused', factor=3, reads=['unused'], writes=['unused_x']).select(['unused_x'])
+    assert pipeline.run(df)['unused_x'].tolist() == (df['unused'] * 3).tolist()
+
+    skipped = Pipeline().apply(double, 'unused', reads=['unused'], writes=['unused_x']).select(['zip'])
+    assert skipped.run(df).columns.tolist() == ['zip']
+    assert len(skipped.timings) == 0
+
+
+def test_group_concat_keeps_every_column(df):
+    pipeline = Pipeline().add_leading_zero('zip', 5).group_concat('state', 'zip').select(['state', 'zip'])
+
+    expected = df.copy().add_leading_zero('zip', 5).group_concat('state', 'zip')[['state', 'zip']]
+    pd.testing.assert_frame_equal(pipeline.run(df), expected)
+    assert 'columns used: all' in pipeline.explain()
+
+
+def test_polars_frames_run_through_the_polars_backend(df):
+    columns = ['zip', 'city', 'north_east']
+    pipeline = _pipeline().select(columns)
+
+    result = pipeline.run(pl.from_pandas(df))
+
+    assert isinstance(result, pl.DataFrame)
+    assert result.to_pandas().to_dict('list') == _eager(df)[columns].to_dict('list')
@@ -0,0 +1,143 @@
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+
+from businesswizard.functions import (
+    add_leading_zero, clean_column_text, create_flag, create_flags, date_diff, group_concat, subset_by_group
+)
+
+
+@pytest.fixture
+def pdf():
+    rng = np.random.default_rng(5)
+    n = 60
+    return pd.DataFrame({
+        'region': rng.choice(['east', 'west', 'north'], n),
+        'item': rng.choice([' pen', 'Ink!', 'pad '], n),
+        'amount': rng.choice([1.0, 2.5, 1e-05, 1e20, np.nan], n),
+        'zip': rng.choice(['123', '4567', '89'], n),
+        'start': pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 300, n), unit='D'),
+        'days': rng.integers(-5, 90, n),
+        'active': rng.choice([True, False], n)
+    }).assign(end=lambda d: d['start'] + pd.to_timedelta(d['days'], unit='D')).drop(columns='days')
+
+
+def _polars(pdf):
+    return pl.from_pandas(pdf)
+
+
+def _text(values):
+    return [None if pd.isna(v) else v for v in values]
+
+
+def test_add_leading_zero(pdf):
+    result = add_leading_zero(_polars(pdf), 'zip', 5)
+
+    assert result['zip'].to_list() == add_leading_zero(pdf.copy(), 'zip', 5)['zip'].tolist()
+
+
+@pytest.mark.parametrize('column', ['amount', 'active'])
+def test_add_leading_zero_spells_values_like_pandas(pdf, column):
+    result = add_leading_zero(_polars(pdf), column, 8)
+
+    assert result[column].to_list() == _text(add_leading_zero(pdf.copy(), column, 8)[column])
+
+
+def test_add_leading_zero_keeps_missing_flags_missing():
+    pdf = pd.DataFrame({'active': pd.Series([True, None, False], dtype=object)})
+
+    result = add_leading_zero(pl.DataFrame({'active': [True, None, False]}), 'active', 6)
+
+    assert result['active'].to_list() == _text(add_leading_zero(pdf, 'active', 6)['active']) == ['00True', None, '0False']
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'change_case': 'upper'},
+    {'remove_special_characters': True, 'change_case': 'proper'},
+    {'transformations_dictionary': {'pad': 'notepad', 'ink': 'INK'}, 'ignore_case': True},
+    {'transformations_dictionary': {'pen': 'biro'}, 'whole_word': True, 'engine': 'pandas', 'max_workers': 2}
+])
+def test_clean_column_text(pdf, kwargs):
+    columns = ['item', 'amount', 'active']
+    result = clean_column_text(_polars(pdf), columns, **kwargs)
+    expected = clean_column_text(pdf.copy(), columns, **kwargs)
+
+    for c in columns:
+        assert result[c].to_list() == _text(expected[c]), c
+
+
+def test_create_flags(pdf):
+    rules = [
+        {'name': 'east', 'column': 'region', 'isin': ['east']},
+        {'name': 'big', 'column': 'amount', 'between': (2, None)},
+        {'name': 'ink', 'column': 'item', 'regex': 'ink', 'ignore_case': True},
+        {'name': 'no_amount', 'column': 'amount', 'isnull': True},
+        {'name': 'not_west', 'column': 'region', 'isin': ['west'], 'negate': True}
+    ]
+    result = create_flags(_polars(pdf), rules, output='bool')
+    expected = create_flags(pdf.copy(), rules, output='bool')
+
+    for rule in rules:
+        assert result[rule['name']].to_list() == expected[rule['name']].tolist(), rule['name']
+
+
+def test_create_flag_with_missing_values_in_the_lookup():
+    pdf = pd.DataFrame({'code': ['a', None, 'b', 'c']})
+
+    for lookup in [['a', None], ['a', np.nan], ['b']]:
+        result = create_flag(_polars(pdf), 'code', lookup)
+        assert result['created_flag_column'].to_list() == create_flag(pdf.copy(), 'code', lookup)['created_flag_column'].tolist()
+
+
+@pytest.mark.parametrize('calculation', ['days', 'weeks', 'months', 'quarters', 'years', 'hours'])
+def test_date_diff(pdf, calculation):
+    result = date_diff(_polars(pdf), 'start', 'end', calculation=calculation).to_pandas()
+    expected = date_diff(pdf.copy(), 'start', 'end', calculation=calculation)
+
+    for c in [c for c in expected.columns if c.startswith('date_diff')]:
+        assert result[c].tolist() == expected[c].tolist(), c
+
+
+def test_date_diff_with_a_calendar(pdf):
+    result = date_diff(_polars(pdf), 'start', 'end', calendar='us_federal')
+    expected = date_diff(pdf.copy(), 'start', 'end', calendar='us_federal')
+
+    assert result['date_diff_business_days'].to_list() == expected['date_diff_business_days'].tolist()
+
+
+@pytest.mark.parametrize('kwargs', [{}, {'distinct': True, 'max_items': 2}, {'engine': 'pandas'}])
+def test_group_concat(pdf, kwargs):
+    data = pdf[['region', 'item', 'zip']]
+    result = group_concat(_polars(data), 'region', ['item', 'zip'], **kwargs)
+    expected = group_concat(data, 'region', ['item', 'zip'], **kwargs)
+
+    assert result.to_pandas().to_dict('list') == expected.to_dict('list')
+
+
+def test_group_concat_numbers_read_as_text():
+    pdf = pd.DataFrame({'k': ['a', 'a', 'b'], 'v': [1.0, 2.5, 1e-05]})
+
+    result = group_concat(_polars(pdf), 'k', 'v')
+
+    assert result['v'].to_list() == group_concat(pdf, 'k', 'v')['v'].tolist()
+
+
+@pytest.mark.parametrize('lazy', [False, True])
+def test_subset_by_group(pdf, lazy):
+    result = subset_by_group(_polars(pdf), 'region', lazy=lazy, cache_size=4)
+    expected = subset_by_group(pdf, 'region', lazy=lazy)
+
+    assert list(result) == list(expected)
+    for key in expected:
+        assert result[key]['zip'].to_list() == expected[key]['zip'].tolist()
+
+
+def test_namespace_and_engine_validation(pdf):
+    frame = _polars(pdf)
+
+    assert frame.bw.add_leading_zero('zip', 6)['zip'].to_list() == add_leading_zero(frame, 'zip', 6)['zip'].to_list()
+    with pytest.raises(ValueError, match='engine'):
+        clean_column_text(frame, 'item', engine='numba')
+    with pytest.raises(ValueError, match='engine'):
+        group_concat(frame, 'region', 'item', engine='numba')
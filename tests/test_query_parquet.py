@@ -0,0 +1,54 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pyarrow as pa
+
+from businesswizard.filewizard import ParquetQueryEngine, query_parquet, write_parquet_dataset
+
+
+def test_query_filters_a_file(tmp_path):
+    path = tmp_path / 'a.parquet'
+    pd.DataFrame({'x': range(10)}).to_parquet(path)
+
+    df = query_parquet(str(path), 'select x from parquet where x >= ? order by x', params=[7])
+
+    assert df['x'].tolist() == [7, 8, 9]
+
+
+def test_query_partitioned_directory_as_arrow(tmp_path):
+    df = pd.DataFrame({'year': [2023, 2023, 2024], 'amount': [1, 2, 3]})
+    write_parquet_dataset(df, str(tmp_path / 'sales'), partition_cols=['year'])
+
+    result = query_parquet(
+        str(tmp_path / 'sales'), 'select sum(amount) as total from parquet where year = 2023', output='arrow'
+    )
+
+    assert isinstance(result, pa.Table)
+    assert result.column('total').to_pylist() == [3]
+
+
+def test_concurrent_calls_do_not_share_views(tmp_path):
+    paths = []
+    for i in range(8):
+        path = tmp_path / f'{i}.parquet'
+        pd.DataFrame({'x': [i] * 1000}).to_parquet(path)
+        paths.append(str(path))
+
+    def run(i):
+        return query_parquet(paths[i % 8], 'select distinct x from parquet')['x'].tolist()
+
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(run, range(64)))
+
+    assert results == [[i % 8] for i in range(64)]
+
+
+def test_engine_keeps_registered_views(tmp_path):
+    path = tmp_path / 'a.parquet'
+    pd.DataFrame({'x': [1, 2]}).to_parquet(path)
+    engine = ParquetQueryEngine(threads=1)
+    engine.register('a', str(path))
+
+    assert engine.query('select count(*) as n from a')['n'].tolist() == [2]
+    assert 'READ_PARQUET' in engine.explain('select * from a').upper()
+    engine.close()
@@ -0,0 +1,98 @@
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pv
+import pytest
+
+from businesswizard.filewizard import bulk_import_csv, read_file_schema, unify_schemas
+
+
+def test_unify_schemas_resolves_conflicts_in_any_order():
+    a = pa.schema([('Customer ID', pa.int32()), ('Amount', pa.int64()), ('Day', pa.date32()), ('Flag', pa.null())])
+    b = pa.schema([('customer_id', pa.int64()), ('Amount', pa.float64()), ('Day', pa.timestamp('s')), ('Note', pa.string())])
+    c = pa.schema([('Customer ID', pa.string())])
+
+    expected = pa.schema([
+        ('customer_id', pa.string()), ('amount', pa.float64()), ('day', pa.timestamp('us')),
+        ('flag', pa.string()), ('note', pa.string())
+    ])
+    assert unify_schemas([a, b, c]) == expected
+    assert unify_schemas([c, b, a]).field('customer_id').type == pa.string()
+
+
+def test_read_file_schema_uses_metadata(tmp_path):
+    pd.DataFrame({'a': [1], 'b': ['x']}).to_parquet(tmp_path / 'a.parquet')
+    (tmp_path / 'a.csv').write_text('a,b\n1,x\n')
+
+    assert read_file_schema(str(tmp_path / 'a.parquet')).names == ['a', 'b']
+    assert read_file_schema(str(tmp_path / 'a.csv')).types == [pa.int64(), pa.string()]
+
+
+@pytest.fixture
+def csv_files(tmp_path):
+    (tmp_path / 'a.csv').write_text('Customer ID,Amount,Note\n1,10,x\n2,20,\n')
+    (tmp_path / 'b.csv').write_text('Customer ID,Amount,Extra\nc3,2.5,e\n,,\n')
+    return [str(tmp_path / 'a.csv'), str(tmp_path / 'b.csv')]
+
+
+def test_reconciled_import_matches_the_default_import(csv_files):
+    reconciled = bulk_import_csv(csv_files, reconcile_schema=True)
+    default = bulk_import_csv(csv_files)
+
+    assert reconciled.columns.tolist() == ['customer_id', 'amount', 'note', 'extra']
+    assert reconciled['customer_id'].dtype == pd.ArrowDtype(pa.string())
+    assert reconciled['amount'].dtype == pd.ArrowDtype(pa.float64())
+    assert sorted(reconciled['customer_id'].tolist()) == sorted(default['customer_id'].astype(str).tolist())
+    assert sorted(reconciled['amount'].tolist()) == sorted(default['amount'].tolist())
+
+
+def test_reconciled_import_passes_csv_options(tmp_path, csv_files):
+    df = bulk_import_csv(csv_files, reconcile_schema=True, usecols=['Customer ID', 'Amount'])
+    assert df.columns.tolist() == ['customer_id', 'amount']
+
+    (tmp_path / 'c.csv').write_text('skip me\nid;value\n1;missing\n2;3\n')
+    df = bulk_import_csv([str(tmp_path / 'c.csv')], reconcile_schema=True, sep=';', skiprows=1, na_values=['missing'])
+    assert df.columns.tolist() == ['id', 'value']
+    assert df['value'].isna().tolist() == [True, False]
+    assert df['value'].dtype == pd.ArrowDtype(pa.int64())
+
+    with pytest.raises(TypeError, match='dtype'):
+        bulk_import_csv(csv_files, reconcile_schema=True, dtype={'Amount': 'float64'})
+
+
+def test_reconciled_import_falls_back_through_encodings(tmp_path):
+    (tmp_path / 'latin.csv').write_bytes('city,n\nMünchen,1\nZürich,2\n'.encode('latin1'))
+
+    df = bulk_import_csv([str(tmp_path / 'latin.csv')], reconcile_schema=True)
+
+    assert df['city'].tolist() == ['München', 'Zürich']
+
+
+def test_reconciled_import_widens_types_after_the_first_block(tmp_path):
+    rows = ''.join(f'{i},{i}\n' for i in range(300_000))
+    (tmp_path / 'drift.csv').write_text('id,amount\n' + rows + '300000,1.5\n300001,n/a\n')
+
+    reconciled = bulk_import_csv([str(tmp_path / 'drift.csv')], reconcile_schema=True)
+    default = bulk_import_csv([str(tmp_path / 'drift.csv')])
+
+    assert reconciled['id'].dtype == pd.ArrowDtype(pa.int64())
+    assert reconciled['amount'].dtype == pd.ArrowDtype(pa.float64())
+    assert reconciled['amount'].tolist()[-3:-1] == default['amount'].tolist()[-3:-1] == [299_999.0, 1.5]
+    assert len(reconciled) == len(default) == 300_002
+
+
+def test_reconciled_import_reports_parse_errors_without_trying_other_encodings(tmp_path, monkeypatch):
+    (tmp_path / 'bad.csv').write_text('a,b\n' + '1,2\n' * 10 + '3,4,5\n')
+    reads = []
+
+    def recording(read):
+        def wrapper(*args, **kwargs):
+            reads.append(kwargs['read_options'].encoding)
+            return read(*args, **kwargs)
+        return wrapper
+
+    monkeypatch.setattr(pv, 'open_csv', recording(pv.open_csv))
+    monkeypatch.setattr(pv, 'read_csv', recording(pv.read_csv))
+
+    with pytest.raises(pa.ArrowInvalid, match='Expected 2 columns, got 3'):
+        bulk_import_csv([str(tmp_path / 'bad.csv')], reconcile_schema=True)
+    assert set(reads) == {'utf-8'}
@@ -0,0 +1,124 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from businesswizard.filewizard import write_parquet_dataset
+from businesswizard.functions import Pipeline, StreamingExecutor
+from businesswizard.functions.streaming import _partition_of
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(7)
+    n = 1_000
+    return pd.DataFrame({
+        'customer': rng.choice([f'c{i}' for i in range(40)], n),
+        'order': [f'o{i}' for i in range(n)],
+        'zip': rng.choice(['123', '4567', '89'], n),
+        'amount': rng.random(n)
+    })
+
+
+def _pipeline():
+    return Pipeline().add_leading_zero('zip', 5).create_flag('zip', ['00123'], 'local')
+
+
+def _read(path, by):
+    return pq.read_table(path).to_pandas().sort_values(by, ignore_index=True)
+
+
+def test_row_steps_match_in_memory(tmp_path, df):
+    write_parquet_dataset(df, str(tmp_path / 'source'))
+    executor = StreamingExecutor(_pipeline(), batch_size=128)
+
+    executor.run(str(tmp_path / 'source'), str(tmp_path / 'out'))
+
+    expected = _pipeline().run(df).sort_values('order', ignore_index=True)
+    pd.testing.assert_frame_equal(_read(tmp_path / 'out', 'order'), expected, check_dtype=False)
+    assert executor.rows_read == executor.rows_written == len(df)
+
+
+def test_group_steps_match_in_memory(tmp_path, df):
+    df.to_parquet(tmp_path / 'source.parquet')
+    pipeline = _pipeline().group_concat('customer', 'order').select(['customer', 'order', 'local'])
+
+    batches = list(StreamingExecutor(pipeline, batch_size=100, partitions=7).iter_batches(str(tmp_path / 'source.parquet')))
+    streamed = pd.concat(batches).sort_values('customer', ignore_index=True)
+
+    pd.testing.assert_frame_equal(streamed, pipeline.run(df), check_dtype=False)
+
+
+def test_csv_source(tmp_path, df):
+    df.to_csv(tmp_path / 'a.csv', index=False)
+    pipeline = _pipeline().select(['order', 'zip', 'local'])
+
+    streamed = pd.concat(StreamingExecutor(pipeline, batch_size=300).iter_batches(str(tmp_path / 'a.csv')))
+
+    expected = pipeline.run(pd.read_csv(tmp_path / 'a.csv', dtype={'zip': str}))
+    assert streamed['zip'].tolist() == expected['zip'].tolist()
+    assert streamed['local'].tolist() == expected['local'].tolist()
+
+
+def test_overwrite_can_rewrite_a_dataset_in_place(tmp_path, df):
+    root = str(tmp_path / 'data')
+    write_parquet_dataset(df, root)
+
+    StreamingExecutor(_pipeline(), batch_size=128).run(root, root)
+
+    result = _read(root, 'order')
+    assert len(result) == len(df)
+    assert set(result['zip']) == {'00123', '04567', '00089'}
+    assert [name for name in os.listdir(tmp_path) if name != 'data'] == []
+
+
+def test_failed_overwrite_keeps_the_old_output(tmp_path, df):
+    df.to_parquet(tmp_path / 'source.parquet')
+    StreamingExecutor(_pipeline()).run(str(tmp_path / 'source.parquet'), str(tmp_path / 'out'))
+
+    def fail(frame):
+        raise RuntimeError('boom')
+
+    with pytest.raises(RuntimeError, match='boom'):
+        StreamingExecutor(Pipeline().apply(fail)).run(str(tmp_path / 'source.parquet'), str(tmp_path / 'out'))
+
+    assert len(_read(tmp_path / 'out', 'order')) == len(df)
+    assert sorted(os.listdir(tmp_path)) == ['out', 'source.parquet']
+
+
+def test_append_and_partitioning(tmp_path, df):
+    df.to_parquet(tmp_path / 'source.parquet')
+    executor = StreamingExecutor(_pipeline(), batch_size=400)
+
+    executor.run(str(tmp_path / 'source.parquet'), str(tmp_path / 'out'), partition_cols=['local'])
+    executor.run(str(tmp_path / 'source.parquet'), str(tmp_path / 'out'), partition_cols=['local'], mode='append')
+
+    assert sorted(os.listdir(tmp_path / 'out')) == ['local=N', 'local=Y']
+    assert pq.read_table(tmp_path / 'out').num_rows == 2 * len(df)
+    with pytest.raises(ValueError, match='mode'):
+        executor.run(str(tmp_path / 'source.parquet'), str(tmp_path / 'out'), mode='replace')
+
+
+def test_group_keys_with_different_dtypes_across_batches(tmp_path):
+    # The second file's null turns its int keys into floats once read into pandas
+    os.makedirs(tmp_path / 'source')
+    pd.DataFrame({'k': [1, 2, 3, 1, 2, 3], 'v': list('abcdef')}).to_parquet(tmp_path / 'source' / 'a.parquet')
+    pd.DataFrame({'k': [1, 2, None], 'v': list('ghi')}).to_parquet(tmp_path / 'source' / 'b.parquet')
+    pipeline = Pipeline().group_concat('k', 'v')
+
+    streamed = pd.concat(StreamingExecutor(pipeline, batch_size=6, partitions=8).iter_batches(str(tmp_path / 'source')))
+
+    assert streamed.dropna(subset=['k'])['k'].is_unique
+    assert sorted(streamed.dropna(subset=['k'])['k'].tolist()) == [1, 2, 3]
+
+
+def test_object_keys_hash_like_their_typed_values():
+    plain = pd.DataFrame({'k': [1.0, 0.0, 5.0, 2.0], 'j': ['x', 'y', 'z', None]})
+    mixed = pd.DataFrame({'k': pd.Series([1, 0, 5.0, 2], dtype=object), 'j': pd.Series(['x', 'y', 'z', None], dtype=object)})
+    flags = pd.DataFrame({'k': [True, False]})
+    flags_with_null = pd.DataFrame({'k': pd.Series([True, False, None], dtype=object)})
+
+    assert (_partition_of(plain, ['k', 'j'], 16) == _partition_of(mixed, ['k', 'j'], 16)).all()
+    assert (_partition_of(flags, ['k'], 16) == _partition_of(flags_with_null, ['k'], 16)[:2]).all()
@@ -0,0 +1,64 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from businesswizard.functions import GroupPartitions, subset_by_group
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(4)
+    return pd.DataFrame({
+        'region': rng.choice(['east', 'west', 'a/b', 'a_b', None], 200),
+        'team': rng.choice([1, 2], 200),
+        'value': rng.random(200)
+    })
+
+
+@pytest.mark.parametrize('by', ['region', ['region'], ['region', 'team']])
+def test_lazy_matches_eager(df, by):
+    eager = subset_by_group(df, by)
+    lazy = subset_by_group(df, by, lazy=True, cache_size=2)
+
+    assert list(lazy) == list(eager)
+    assert len(lazy) == len(eager)
+    for key in eager:
+        assert key in lazy
+        pd.testing.assert_frame_equal(lazy[key], eager[key])
+
+
+def test_sorted_frames_are_sliced_and_cached(df):
+    ordered = df.sort_values('region', kind='stable')
+    groups = GroupPartitions(ordered, 'region', cache_size=1)
+
+    first = groups['east']
+    assert np.shares_memory(first['value'].to_numpy(), ordered['value'].to_numpy())
+    assert groups['east'] is first
+    groups['west']
+    assert groups['east'] is not first
+
+
+def test_to_files_gives_every_group_its_own_file(tmp_path, df):
+    groups = GroupPartitions(df, ['region', 'team'])
+
+    paths = groups.to_files(str(tmp_path), max_workers=3)
+
+    assert len(set(paths.values())) == len(groups) == len(os.listdir(tmp_path))
+    for key, path in paths.items():
+        pd.testing.assert_frame_equal(pd.read_parquet(path), groups[key].reset_index(drop=True))
+    assert os.path.basename(paths[('east', 1)]) == 'east_1.parquet'
+
+
+def test_to_files_csv_and_invalid_format(tmp_path):
+    df = pd.DataFrame({'k': ['X', 'x'], 'v': [1, 2]})
+    groups = GroupPartitions(df, 'k')
+
+    paths = groups.to_files(str(tmp_path), file_format='csv')
+
+    # Names differing only in case would overwrite each other on case-insensitive file systems
+    assert len({p.lower() for p in paths.values()}) == 2
+    assert pd.read_csv(paths['x'])['v'].tolist() == [2]
+    with pytest.raises(ValueError, match='file_format'):
+        groups.to_files(str(tmp_path), file_format='json')
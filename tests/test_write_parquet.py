@@ -0,0 +1,64 @@
+import os
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from businesswizard.filewizard import write_parquet_dataset
+
+
+def _frame():
+    return pd.DataFrame({
+        'year': [2024, 2023, 2024, 2023],
+        'customer': ['b', 'a', 'a', 'b'],
+        'amount': [4, 1, 3, 2]
+    })
+
+
+def _read(path):
+    return pq.read_table(path).to_pandas().sort_values(['year', 'customer']).reset_index(drop=True)
+
+
+def test_partitioned_round_trip(tmp_path):
+    root = str(tmp_path / 'sales')
+    write_parquet_dataset(_frame(), root, partition_cols=['year'])
+
+    assert sorted(os.listdir(root)) == ['year=2023', 'year=2024']
+    df = _read(root)
+    assert df['customer'].tolist() == ['a', 'b', 'a', 'b']
+    assert df['amount'].tolist() == [1, 2, 3, 4]
+
+
+def test_sort_by_orders_rows_within_files(tmp_path):
+    root = str(tmp_path / 'sales')
+    write_parquet_dataset(_frame(), root, sort_by=['amount'])
+
+    assert pq.read_table(root).column('amount').to_pylist() == [1, 2, 3, 4]
+
+
+def test_append_keeps_existing_files_and_overwrite_replaces_partitions(tmp_path):
+    root = str(tmp_path / 'sales')
+    write_parquet_dataset(_frame(), root, partition_cols=['year'])
+    write_parquet_dataset(_frame(), root, partition_cols=['year'], mode='append')
+    assert pq.read_table(root).num_rows == 8
+
+    write_parquet_dataset(_frame().query('year == 2024'), root, partition_cols=['year'])
+    df = _read(root)
+    assert (df['year'] == 2023).sum() == 4
+    assert (df['year'] == 2024).sum() == 2
+
+
+def test_low_cardinality_strings_are_dictionary_encoded(tmp_path):
+    root = str(tmp_path / 'sales')
+    df = pd.DataFrame({'region': ['north', 'south'] * 50, 'id': [str(i) for i in range(100)]})
+    write_parquet_dataset(df, root)
+
+    metadata = pq.ParquetFile(os.path.join(root, os.listdir(root)[0])).metadata.row_group(0)
+    encodings = {metadata.column(i).path_in_schema: metadata.column(i).encodings for i in range(2)}
+    assert any('DICTIONARY' in e for e in encodings['region'])
+    assert not any('DICTIONARY' in e for e in encodings['id'])
+
+
+def test_invalid_mode(tmp_path):
+    with pytest.raises(ValueError, match='mode'):
+        write_parquet_dataset(_frame(), str(tmp_path), mode='replace')